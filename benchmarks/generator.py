@@ -0,0 +1,118 @@
+import random
+from typing import Dict, Iterator, Optional
+
+LEVELS = ["Junior", "Middle", "Senior", "Ведущий", "Старший", "Младший", "Главный"]
+ROLES = [
+    "Python-разработчик",
+    "Java-разработчик",
+    "Frontend-разработчик",
+    "Backend-разработчик",
+    "аналитик данных",
+    "инженер по тестированию",
+    "DevOps-инженер",
+    "системный администратор",
+    "бухгалтер",
+    "менеджер по продажам",
+    "специалист службы поддержки",
+    "product manager",
+    "дизайнер интерфейсов",
+    "data scientist",
+]
+COMPANIES = ["в банк", "в маркетплейс", "в стартап", "в IT-компанию", "в ритейл", ""]
+SKILLS = [
+    "Python",
+    "Django",
+    "FastAPI",
+    "PostgreSQL",
+    "Docker",
+    "Kubernetes",
+    "Git",
+    "Linux",
+    "SQL",
+    "Excel",
+    "1С",
+    "React",
+    "TypeScript",
+    "Java",
+    "Spring",
+    "Kafka",
+    "Redis",
+    "английский язык",
+]
+PHRASES = [
+    "Опыт работы от {years} лет",
+    "Уверенное знание {skill}",
+    "Опыт коммерческой разработки на {skill}",
+    "Понимание принципов ООП",
+    "Будет плюсом знание {skill} и {other}",
+    "Умение работать в команде",
+    "Высшее образование",
+    "Готовность к <highlighttext>обучению</highlighttext>",
+    "Опыт написания тестов",
+    "Знание {skill} на уровне продвинутого пользователя",
+]
+
+
+class VacancyGenerator:
+    """Генератор правдоподобных вакансий с фиксированным seed.
+
+    Одинаковый seed дает одинаковую последовательность вакансий, поэтому
+    замеры на разных версиях проекта сравнимы между собой.
+    """
+
+    def __init__(self, seed: int = 42):
+        self.seed = seed
+
+    def items(self, count: int, start: int = 0) -> Iterator[Dict]:
+        """Отдает вакансии в формате ответа API hh.ru."""
+        rng = random.Random(f"{self.seed}:{start}")
+        for number in range(start, start + count):
+            yield {
+                "id": str(number),
+                "name": self.__title(rng),
+                "alternate_url": f"https://hh.ru/vacancy/{number}",
+                "salary": self.__salary(rng),
+                "snippet": {"requirement": self.__description(rng)},
+            }
+
+    def records(self, count: int, start: int = 0) -> Iterator[Dict]:
+        """Отдает вакансии в формате записей JSONSaver."""
+        for item in self.items(count, start):
+            salary = item["salary"] or {}
+            yield {
+                "id": f"bench{item['id']}",
+                "title": item["name"],
+                "url": item["alternate_url"],
+                "salary_from": salary.get("from"),
+                "salary_to": salary.get("to"),
+                "description": item["snippet"]["requirement"],
+            }
+
+    @staticmethod
+    def __title(rng: random.Random) -> str:
+        parts = [rng.choice(LEVELS), rng.choice(ROLES), rng.choice(COMPANIES)]
+        return " ".join(part for part in parts if part)
+
+    @staticmethod
+    def __salary(rng: random.Random) -> Optional[Dict]:
+        # Примерно у трети вакансий на hh.ru зарплата не указана
+        if rng.random() < 0.3:
+            return None
+        low = rng.randrange(30, 400) * 1000
+        high = low + rng.randrange(0, 200) * 1000
+        kind = rng.random()
+        if kind < 0.2:
+            return {"from": low, "to": None, "currency": "RUR"}
+        if kind < 0.35:
+            return {"from": None, "to": high, "currency": "RUR"}
+        return {"from": low, "to": high, "currency": "RUR"}
+
+    @staticmethod
+    def __description(rng: random.Random) -> str:
+        phrases = []
+        for phrase in rng.sample(PHRASES, rng.randint(2, 5)):
+            skill, other = rng.sample(SKILLS, 2)
+            phrases.append(
+                phrase.format(years=rng.randint(1, 6), skill=skill, other=other)
+            )
+        return ". ".join(phrases) + "."
@@ -0,0 +1,88 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from generator import VacancyGenerator
+
+
+class HHStubHandler(BaseHTTPRequestHandler):
+    """Отвечает на /vacancies так же, как hh.ru: страницами с полями pages и found."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path != "/vacancies":
+            self.__send(404, {"errors": [{"type": "not_found"}]})
+            return
+
+        params = parse_qs(url.query)
+        per_page = int(params.get("per_page", ["20"])[0])
+        page = int(params.get("page", ["0"])[0])
+        server = self.server
+        # hh.ru отдает не больше 2000 вакансий на запрос
+        available = min(server.found, 2000)
+        pages = (available + per_page - 1) // per_page
+        start = page * per_page
+        count = max(0, min(per_page, available - start))
+
+        if server.latency:
+            time.sleep(server.latency)
+        with server.lock:
+            server.requests += 1
+        self.__send(
+            200,
+            {
+                "items": list(server.generator.items(count, start)),
+                "found": server.found,
+                "pages": pages,
+                "page": page,
+                "per_page": per_page,
+            },
+        )
+
+    def __send(self, status: int, payload: dict):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class HHStubServer:
+    """Локальная замена API hh.ru с настраиваемой задержкой ответа."""
+
+    def __init__(self, found: int = 2000, latency: float = 0.0, seed: int = 42):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), HHStubHandler)
+        self.server.found = found
+        self.server.latency = latency
+        self.server.generator = VacancyGenerator(seed)
+        self.server.lock = threading.Lock()
+        self.server.requests = 0
+        self.thread = threading.Thread(
+            target=self.server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            daemon=True,
+        )
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}/vacancies"
+
+    @property
+    def requests(self) -> int:
+        return self.server.requests
+
+    def __enter__(self) -> "HHStubServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
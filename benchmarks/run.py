@@ -0,0 +1,309 @@
+"""Замеры производительности основных операций.
+
+Запуск: python benchmarks/run.py --sizes 1000 10000 --output results.json
+Сравнение с прошлым прогоном: --baseline old.json (код выхода 1 при регрессии).
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+)
+
+from generator import VacancyGenerator
+from hh_stub import HHStubServer
+
+import storage_formats
+from api_connectors import HHruConnector
+from data_savers import JSONSaver, ShardedSaver
+from http_client import HttpClient
+from vacancy import Vacancy
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+
+def measure(func: Callable[[], object], repeat: int, setup=None) -> Dict:
+    """Запускает func repeat раз и возвращает время в секундах."""
+    timings = []
+    for _ in range(repeat):
+        # Сообщения сохранителей («Добавлена вакансия…») не должны влиять на замер
+        with contextlib.redirect_stdout(io.StringIO()):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+    return {
+        "repeat": repeat,
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+    }
+
+
+def bench_json_saver(size: int, repeat: int, seed: int, ops: int = 10) -> List[Dict]:
+    """Замеряет операции JSONSaver на файле из size вакансий."""
+    generator = VacancyGenerator(seed)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "vacancies.json")
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(list(generator.records(size)), f, ensure_ascii=False)
+
+        def result(name: str, timing: Dict, operations: int = 1):
+            timing.update(name=name, size=size, operations=operations)
+            results.append(timing)
+
+        # JSONSaver читает файл лениво, поэтому загрузка вызывается явно
+        result(
+            "json_saver.load",
+            measure(lambda: JSONSaver(filename, binary_cache=False).load(), repeat),
+        )
+        JSONSaver(filename).load()  # создает двоичный снимок для следующего замера
+        result(
+            "json_saver.load_snapshot",
+            measure(lambda: JSONSaver(filename).load(), repeat),
+        )
+
+        saver = JSONSaver(filename)
+        new_vacancies = [
+            # Номер в названии, чтобы вакансии не отсеялись как дубли по названию
+            Vacancy(
+                f"{item['name']} #{item['id']}",
+                item["alternate_url"],
+                (item["salary"] or {}).get("from"),
+                (item["salary"] or {}).get("to"),
+                item["snippet"]["requirement"],
+            )
+            for item in generator.items(ops, start=size)
+        ]
+
+        def add():
+            for vacancy in new_vacancies:
+                saver.add_vacancy(vacancy)
+
+        def delete():
+            for vacancy in new_vacancies:
+                saver.delete_vacancy(vacancy)
+
+        result("json_saver.add_vacancy", measure(add, repeat, setup=delete), ops)
+        result("json_saver.delete_vacancy", measure(delete, repeat, setup=add), ops)
+
+        queries = {
+            "url": {"url": f"https://hh.ru/vacancy/{size // 2}"},
+            "salary_range": {"salary_from__between": (150000, 250000)},
+            "title_prefix": {"title__istartswith": "senior"},
+            "scan": {"description__icontains": "docker"},
+        }
+        for label, criteria in queries.items():
+            result(
+                f"json_saver.get_vacancies.{label}",
+                measure(lambda: saver.get_vacancies(criteria), repeat),
+            )
+
+        result(
+            "json_saver.top_by_salary", measure(lambda: saver.top_by_salary(10), repeat)
+        )
+        result(
+            "json_saver.search_vacancies",
+            measure(lambda: saver.search_vacancies("python docker"), repeat),
+        )
+    return results
+
+
+def bench_sharded_saver(
+    size: int, repeat: int, seed: int, shards: int = 16, ops: int = 10
+) -> List[Dict]:
+    """Замеряет загрузку и запись ShardedSaver на size вакансиях."""
+    generator = VacancyGenerator(seed)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = os.path.join(tmp, "vacancies.shards")
+        saver = ShardedSaver(directory, shards)
+        try:
+            saver.import_records(generator.records(size))
+        finally:
+            saver.close()
+
+        def result(name: str, timing: Dict, operations: int = 1):
+            timing.update(name=name, size=size, operations=operations)
+            results.append(timing)
+
+        def with_saver(func: Callable[[ShardedSaver], object]) -> Callable:
+            """Запускает func на новом хранилище и останавливает его пул процессов."""
+
+            def run():
+                saver = ShardedSaver(directory)
+                try:
+                    return func(saver)
+                finally:
+                    saver.close()
+
+            return run
+
+        result(
+            "sharded_saver.load",
+            measure(with_saver(lambda saver: saver.load()), repeat),
+        )
+        result(
+            "sharded_saver.scan",
+            measure(
+                with_saver(
+                    lambda saver: list(
+                        saver.iter_vacancies({"description__icontains": "docker"})
+                    )
+                ),
+                repeat,
+            ),
+        )
+
+        saver = ShardedSaver(directory)
+        new_vacancies = [
+            Vacancy(f"{item['name']} #{item['id']}", item["alternate_url"])
+            for item in generator.items(ops, start=size)
+        ]
+
+        def add():
+            for vacancy in new_vacancies:
+                saver.add_vacancy(vacancy)
+
+        def delete():
+            for vacancy in new_vacancies:
+                saver.delete_vacancy(vacancy)
+
+        try:
+            result("sharded_saver.add_vacancy", measure(add, repeat, setup=delete), ops)
+        finally:
+            saver.close()
+    return results
+
+
+def bench_storage_formats(size: int, repeat: int, seed: int) -> List[Dict]:
+    """Замеряет размер файла, запись и чтение в каждом формате хранилища."""
+    records = list(VacancyGenerator(seed).records(size))
+    results = []
+    for fmt in storage_formats.FORMATS:
+        content = storage_formats.encode(records, fmt)
+        for operation, func in (
+            ("encode", lambda: storage_formats.encode(records, fmt)),
+            ("decode", lambda: storage_formats.decode(content)),
+        ):
+            timing = measure(func, repeat)
+            timing.update(
+                name=f"storage_format.{fmt}.{operation}",
+                size=size,
+                operations=1,
+                bytes=len(content),
+            )
+            results.append(timing)
+    return results
+
+
+def bench_connector(
+    found: int, repeat: int, seed: int, latency: float, per_page: int = 100
+) -> List[Dict]:
+    """Замеряет HHruConnector целиком против локальной замены hh.ru."""
+    with HHStubServer(found=found, latency=latency, seed=seed) as server:
+
+        def fetch():
+            client = HttpClient(pool_size=5)
+            connector = HHruConnector(
+                per_page=per_page, http_client=client, base_url=server.url
+            )
+            try:
+                return sum(1 for _ in connector.iter_vacancies("python"))
+            finally:
+                client.close()
+
+        timing = measure(fetch, repeat)
+    timing.update(
+        name="hh_connector.iter_vacancies",
+        size=min(found, HHruConnector.MAX_RESULTS),
+        operations=1,
+        latency=latency,
+    )
+    return [timing]
+
+
+def run_benchmarks(
+    sizes: List[int],
+    repeat: int = 3,
+    seed: int = 42,
+    latency: float = 0.02,
+    connector_found: int = 2000,
+) -> Dict:
+    """Запускает все замеры и возвращает отчет в виде словаря."""
+    results = []
+    for size in sizes:
+        results.extend(bench_json_saver(size, repeat, seed))
+        results.extend(bench_sharded_saver(size, repeat, seed))
+        results.extend(bench_storage_formats(size, repeat, seed))
+    results.extend(bench_connector(connector_found, repeat, seed, latency))
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "sizes": sizes,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+
+def compare(report: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Находит замеры, медиана которых выросла больше чем в threshold раз."""
+    old = {(r["name"], r["size"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for result in report["results"]:
+        previous = old.get((result["name"], result["size"]))
+        if previous and result["median"] > previous["median"] * threshold:
+            regressions.append(
+                f"{result['name']} (size={result['size']}): "
+                f"{previous['median']:.6f}s -> {result['median']:.6f}s"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Замеры производительности")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--output", help="файл для отчета (по умолчанию stdout)")
+    parser.add_argument("--baseline", help="отчет прошлого прогона для сравнения")
+    parser.add_argument("--threshold", type=float, default=1.2)
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.sizes, args.repeat, args.seed, args.latency)
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        for line in regressions:
+            print(f"Регрессия: {line}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+import hashlib
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from api_connectors import APIConnector
+from pipeline import hh_item_to_vacancy, parse_items
+from vacancy import Vacancy
+
+_DONE = object()
+
+
+def url_hash(url: str) -> bytes:
+    """Возвращает короткий хеш нормализованного URL вакансии.
+
+    Схема и хост приводятся к нижнему регистру, параметры сортируются,
+    фрагмент и завершающий слеш отбрасываются.
+    """
+    parts = urlsplit(url.strip())
+    normalized = urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path.rstrip("/"),
+            urlencode(sorted(parse_qsl(parts.query))),
+            "",
+        )
+    )
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).digest()
+
+
+class Source:
+    """Источник вакансий: коннектор, преобразование схемы и лимит времени."""
+
+    def __init__(
+        self,
+        name: str,
+        connector: APIConnector,
+        mapper: Callable[[Dict], Vacancy] = hh_item_to_vacancy,
+        timeout: float = 30.0,
+    ):
+        self.name = name
+        self.connector = connector
+        self.mapper = mapper
+        self.timeout = timeout
+
+    def __repr__(self):
+        return f"Source({self.name!r}, timeout={self.timeout})"
+
+
+class Aggregator:
+    """Параллельно опрашивает несколько источников и сливает их выдачу.
+
+    Вакансии отдаются по мере поступления из любого источника, поэтому общее
+    время равно времени самого медленного источника, а не сумме. Ошибка или
+    превышение времени в одном источнике не прерывает остальные; итог по
+    источникам после обхода доступен в last_report.
+    """
+
+    def __init__(self, sources: List[Source]):
+        if len({source.name for source in sources}) != len(sources):
+            raise ValueError("Имена источников должны быть уникальными")
+        self.sources = sources
+        self.last_report: Dict[str, Dict] = {}
+
+    def get_vacancies(self, query: str) -> List[Vacancy]:
+        return list(self.iter_vacancies(query))
+
+    def iter_vacancies(self, query: str) -> Iterator[Vacancy]:
+        """Отдает вакансии всех источников без повторов по URL."""
+        results: queue.Queue = queue.Queue()
+        stop = threading.Event()
+        started = time.monotonic()
+        report = {
+            source.name: {"status": "running", "count": 0, "elapsed": None}
+            for source in self.sources
+        }
+        self.last_report = report
+        deadlines = {}
+        for source in self.sources:
+            deadlines[source.name] = started + source.timeout
+            # Потоки-демоны: зависший источник не задерживает завершение программы
+            threading.Thread(
+                target=self.__run_source,
+                args=(source, query, results, stop),
+                daemon=True,
+            ).start()
+
+        seen = set()
+        running = set(deadlines)
+        try:
+            while running:
+                now = time.monotonic()
+                for name in [n for n in running if deadlines[n] <= now]:
+                    running.discard(name)
+                    report[name].update(status="timeout", elapsed=now - started)
+                    print(f"Источник {name} не ответил за отведенное время")
+                if not running:
+                    break
+
+                wait = min(deadlines[name] for name in running) - now
+                try:
+                    name, payload = results.get(timeout=max(wait, 0))
+                except queue.Empty:
+                    continue
+                if name not in running:
+                    continue  # опоздавшие данные источника, у которого вышло время
+
+                if payload is _DONE:
+                    running.discard(name)
+                    report[name].update(status="ok", elapsed=time.monotonic() - started)
+                elif isinstance(payload, Exception):
+                    running.discard(name)
+                    report[name].update(
+                        status="error",
+                        error=str(payload),
+                        elapsed=time.monotonic() - started,
+                    )
+                    print(f"Ошибка источника {name}: {payload}")
+                else:
+                    key = url_hash(payload.url)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    report[name]["count"] += 1
+                    yield payload
+        finally:
+            stop.set()
+
+    @staticmethod
+    def __run_source(source: Source, query: str, results: queue.Queue, stop):
+        try:
+            items = source.connector.iter_vacancies(query)
+            for vacancy in parse_items(items, source.mapper):
+                if stop.is_set():
+                    return
+                results.put((source.name, vacancy))
+        except Exception as e:
+            results.put((source.name, e))
+            return
+        results.put((source.name, _DONE))
@@ -1,8 +1,16 @@
 import abc
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
 
-import requests
+from cache import ResponseCache
+from http_client import HttpClient, TokenBucket
+from lazy_import import lazy_import
+from metrics import MetricsRegistry
+
+requests = lazy_import("requests")
 
 
 class API(ABC):
@@ -21,30 +29,184 @@ class APIConnector(abc.ABC):
     """Абстрактный класс для работы с API сервиса с вакансиями."""
 
     @abc.abstractmethod
-    def get_vacancies(self, query: str) -> List[Dict]:
-        """Получает вакансии из API."""
+    def get_vacancies(self, query: str, date_from: Optional[str] = None) -> List[Dict]:
+        """Получает вакансии из API, опубликованные не раньше date_from."""
         pass
 
+    def iter_vacancies(
+        self, query: str, date_from: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """Последовательно отдает вакансии из API."""
+        yield from self.get_vacancies(query, date_from)
+
 
 class HHruConnector(APIConnector):
     """Класс для работы с API hh.ru."""
 
-    def __init__(self):
-        self.__base_url = "https://api.hh.ru/vacancies"
+    MAX_RESULTS = 2000  # hh.ru не отдает больше 2000 вакансий на один запрос
+    BASE_URL = "https://api.hh.ru/vacancies"
+
+    def __init__(
+        self,
+        per_page: int = 100,
+        max_workers: int = 5,
+        http_client: Optional[HttpClient] = None,
+        cache: Optional[ResponseCache] = None,
+        base_url: str = BASE_URL,
+        metrics: Optional[MetricsRegistry] = None,
+        raise_errors: bool = False,
+    ):
+        self.__base_url = base_url
+        self.raise_errors = raise_errors
+        self.per_page = per_page
+        self.max_workers = max_workers
+        self.metrics = metrics
+        self.http_client = http_client or HttpClient(
+            rate_limiter=TokenBucket(rate=10),
+            pool_size=max_workers,
+            cache=cache,
+            metrics=metrics,
+        )
 
-    def get_vacancies(self, query: str) -> List[Dict]:
+    def get_vacancies(self, query: str, date_from: Optional[str] = None) -> List[Dict]:
         """Получает вакансии с hh.ru."""
+        return list(self.iter_vacancies(query, date_from))
+
+    def iter_vacancies(
+        self, query: str, date_from: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """Обходит все страницы выдачи hh.ru и отдает вакансии в порядке страниц.
+
+        date_from (ISO 8601) ограничивает выдачу вакансиями, опубликованными
+        не раньше этого момента. При raise_errors=True ошибки запросов
+        пробрасываются, иначе выводятся и пропускаются.
+        """
         try:
-            params = {"text": query, "area": 113, "per_page": 100}  # area: 113 - Россия
-            response = self.__send_request(self.__base_url, params)
-            data = response.json()
-            return data.get("items", [])
+            data = self.__fetch_page(query, 0, date_from)
         except requests.exceptions.RequestException as e:
+            if self.raise_errors:
+                raise
             print(f"Ошибка при запросе к API hh.ru: {e}")
+            return
+
+        yield from data.get("items", [])
+
+        max_pages = max(1, self.MAX_RESULTS // self.per_page)
+        pages = min(int(data.get("pages") or 1), max_pages)
+        if pages <= 1:
+            return
+
+        # Держим в работе не больше max_workers страниц, чтобы память не росла
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = deque()
+            next_page = 1
+            while next_page < pages or pending:
+                while next_page < pages and len(pending) < self.max_workers:
+                    pending.append(
+                        executor.submit(
+                            self.__fetch_page_safe, query, next_page, date_from
+                        )
+                    )
+                    next_page += 1
+                yield from pending.popleft().result()
+
+    def __params(self, query: str, page: int, date_from: Optional[str]) -> Dict:
+        """Формирует параметры запроса для страницы выдачи."""
+        # area: 113 - Россия
+        params = {"text": query, "area": 113, "per_page": self.per_page, "page": page}
+        if date_from:
+            params["date_from"] = date_from
+        return params
+
+    def __fetch_page(
+        self, query: str, page: int, date_from: Optional[str] = None
+    ) -> Dict:
+        """Запрашивает одну страницу выдачи."""
+        response = self.__send_request(
+            self.__base_url, self.__params(query, page, date_from)
+        )
+        data = response.json()
+        if self.metrics is not None:
+            self.metrics.counter(
+                "connector_vacancies_total", "Получено вакансий из API"
+            ).inc(len(data.get("items", [])), source="hh.ru")
+        return data
+
+    def __fetch_page_safe(
+        self, query: str, page: int, date_from: Optional[str] = None
+    ) -> List[Dict]:
+        """Запрашивает страницу выдачи, при ошибке возвращает пустой список."""
+        try:
+            return self.__fetch_page(query, page, date_from).get("items", [])
+        except requests.exceptions.RequestException as e:
+            if self.raise_errors:
+                raise
+            print(f"Ошибка при запросе страницы {page} к API hh.ru: {e}")
             return []
 
-    def __send_request(self, url: str, params: Dict) -> requests.Response:
+    def __send_request(self, url: str, params: Dict) -> "requests.Response":
         """Отправляет GET-запрос к API и обрабатывает ответ."""
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        return response
+        return self.http_client.get(url, params=params)
+
+
+class SuperJobConnector(APIConnector):
+    """Класс для работы с API SuperJob; нужен секретный ключ приложения."""
+
+    MAX_RESULTS = 500  # SuperJob отдает не больше 500 вакансий на один запрос
+    BASE_URL = "https://api.superjob.ru/2.0/vacancies/"
+
+    def __init__(
+        self,
+        api_key: str,
+        per_page: int = 100,
+        http_client: Optional[HttpClient] = None,
+        cache: Optional[ResponseCache] = None,
+        base_url: str = BASE_URL,
+        metrics: Optional[MetricsRegistry] = None,
+        raise_errors: bool = False,
+    ):
+        self.__base_url = base_url
+        self.__headers = {"X-Api-App-Id": api_key}
+        self.per_page = min(per_page, 100)
+        self.raise_errors = raise_errors
+        self.http_client = http_client or HttpClient(
+            rate_limiter=TokenBucket(rate=5), cache=cache, metrics=metrics
+        )
+
+    def get_vacancies(self, query: str, date_from: Optional[str] = None) -> List[Dict]:
+        """Получает вакансии с SuperJob."""
+        return list(self.iter_vacancies(query, date_from))
+
+    def iter_vacancies(
+        self, query: str, date_from: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """Обходит страницы выдачи SuperJob, пока API сообщает о продолжении."""
+        params = {"keyword": query, "count": self.per_page}
+        if date_from:
+            # SuperJob принимает дату публикации как unix-время
+            try:
+                published = datetime.strptime(date_from, "%Y-%m-%dT%H:%M:%S%z")
+            except ValueError as e:
+                if self.raise_errors:
+                    raise ValueError(f"Неверный формат date_from: {date_from}") from e
+                print(f"Неверный формат date_from для API SuperJob: {date_from}")
+                return
+            params["date_published_from"] = int(published.timestamp())
+
+        for page in range(max(1, self.MAX_RESULTS // self.per_page)):
+            try:
+                response = self.http_client.get(
+                    self.__base_url,
+                    params={**params, "page": page},
+                    headers=self.__headers,
+                )
+                data = response.json()
+            except requests.exceptions.RequestException as e:
+                if self.raise_errors:
+                    raise
+                print(f"Ошибка при запросе к API SuperJob: {e}")
+                return
+
+            yield from data.get("objects", [])
+            if not data.get("more"):
+                return
@@ -0,0 +1,179 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlencode
+
+from lazy_import import lazy_import
+
+requests = lazy_import("requests")
+
+
+class ResponseCache:
+    """Дисковый кэш HTTP-ответов с TTL, ревалидацией и LRU-вытеснением."""
+
+    def __init__(
+        self,
+        directory: str,
+        ttl: float = 3600.0,
+        max_bytes: int = 50 * 1024 * 1024,
+    ):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.__lock = threading.Lock()
+        self.__clock = 0
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict] = None) -> str:
+        """Строит ключ кэша из адреса и нормализованных параметров."""
+        normalized = []
+        for name, value in (params or {}).items():
+            if value is None:
+                continue
+            if isinstance(value, str):
+                value = re.sub(r"\s+", " ", value).strip()
+            normalized.append((str(name), str(value)))
+        return f"{url}?{urlencode(sorted(normalized))}"
+
+    def __path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Возвращает запись кэша или None, если ее нет."""
+        path = self.__path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if entry.get("key") != key:
+            return None
+        self.__mark_used(path)
+        return entry
+
+    def __mark_used(self, path: str):
+        """Отмечает время использования записи в mtime файла — по нему работает LRU."""
+        with self.__lock:
+            self.__clock = max(self.__clock + 1, time.time_ns())
+            stamp = self.__clock
+        try:
+            os.utime(path, ns=(stamp, stamp))
+        except OSError:
+            pass
+
+    def is_fresh(self, entry: Dict) -> bool:
+        """Проверяет, не истек ли TTL записи."""
+        return time.time() - entry["stored_at"] < self.ttl
+
+    def put(self, key: str, response: "requests.Response") -> Dict:
+        """Сохраняет ответ в кэш и вытесняет старые записи при переполнении."""
+        entry = {
+            "key": key,
+            "stored_at": time.time(),
+            "status": response.status_code,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content_type": response.headers.get("Content-Type"),
+            "body": response.text,
+        }
+        self.__write(key, entry)
+        self.__evict()
+        return entry
+
+    def refresh(self, key: str, entry: Dict, response: "requests.Response") -> Dict:
+        """Продлевает запись после ответа 304 Not Modified."""
+        entry["stored_at"] = time.time()
+        entry["etag"] = response.headers.get("ETag", entry.get("etag"))
+        entry["last_modified"] = response.headers.get(
+            "Last-Modified", entry.get("last_modified")
+        )
+        self.__write(key, entry)
+        return entry
+
+    def __write(self, key: str, entry: Dict):
+        path = self.__path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        self.__mark_used(path)
+
+    def __evict(self):
+        """Удаляет давно не использованные записи, пока кэш больше max_bytes."""
+        with self.__lock:
+            files = []
+            total = 0
+            for name in os.listdir(self.directory):
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime_ns, path, stat.st_size))
+                total += stat.st_size
+
+            files.sort()
+            for _, path, size in files:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+
+    def to_response(self, entry: Dict, url: str) -> "requests.Response":
+        """Восстанавливает объект Response из записи кэша."""
+        response = requests.Response()
+        response.status_code = entry.get("status", 200)
+        response.url = url
+        response.encoding = "utf-8"
+        response._content = entry["body"].encode("utf-8")
+        if entry.get("content_type"):
+            response.headers["Content-Type"] = entry["content_type"]
+        if entry.get("etag"):
+            response.headers["ETag"] = entry["etag"]
+        if entry.get("last_modified"):
+            response.headers["Last-Modified"] = entry["last_modified"]
+        return response
+
+    def record(self, hit: bool, revalidated: bool = False):
+        """Учитывает попадание или промах кэша."""
+        with self.__lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            if revalidated:
+                self.revalidations += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Возвращает счетчики попаданий и промахов."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+        }
+
+    def clear(self):
+        """Очищает кэш."""
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                os.remove(os.path.join(self.directory, name))
+
+    def __str__(self):
+        return (
+            f"ResponseCache(dir='{self.directory}', hits={self.hits}, "
+            f"misses={self.misses})"
+        )
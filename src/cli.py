@@ -0,0 +1,473 @@
+"""Неинтерактивный интерфейс командной строки для запуска из cron и планировщиков.
+
+Примеры:
+    python src/main.py fetch python java --workers 8
+    python src/main.py --metrics metrics.prom fetch --queries-file queries.txt
+    python src/main.py --format json top 10
+    python src/main.py export --where salary_from__gte=200000 -o out.jsonl
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, TextIO
+
+from api_connectors import HHruConnector
+from cache import ResponseCache
+from data_savers import (
+    ADDED,
+    FAILED,
+    SALARY_FIELDS,
+    UPDATED,
+    DataSaver,
+    JSONLSaver,
+    JSONSaver,
+    ShardedSaver,
+    SQLiteSaver,
+    convert_json_format,
+    convert_json_to_jsonl,
+    migrate_json_to_shards,
+    migrate_json_to_sqlite,
+)
+from dedup import remove_near_duplicates
+from http_client import HttpClient, TokenBucket
+from metrics import MetricsRegistry
+from pipeline import dedupe, parse_items
+from query import compile_query
+from startup_profile import StartupProfile
+from storage_formats import FORMATS
+from sync import (
+    DEFAULT_OVERLAP,
+    WatermarkStore,
+    count_statuses,
+    describe_counts,
+    format_watermark,
+)
+from vacancy import Vacancy
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+DEFAULT_STORAGE = os.path.join(DATA_DIR, "vacancies.json")
+CACHE_DIR = os.path.join(DATA_DIR, "http_cache")
+WATERMARKS_FILE = os.path.join(DATA_DIR, "watermarks.json")
+
+EXIT_OK = 0
+EXIT_FAILURE = 1  # команда выполнена частично: не все запросы или URL обработаны
+EXIT_USAGE = 2  # ошибка в аргументах, как у argparse
+
+
+# Расширения сжатых JSON-файлов и формат по умолчанию для них
+COMPRESSED_EXTENSIONS = {".gz": "gzip", ".xz": "lzma"}
+
+
+def open_saver(
+    filename: str,
+    metrics: Optional[MetricsRegistry] = None,
+    storage_format: Optional[str] = None,
+) -> DataSaver:
+    """Выбирает хранилище по расширению файла."""
+    extension = os.path.splitext(filename)[1].lower()
+    if extension in (".db", ".sqlite", ".sqlite3"):
+        return SQLiteSaver(filename)
+    if extension == ".jsonl":
+        return JSONLSaver(filename)
+    if extension == ".shards":
+        return ShardedSaver(filename)
+    return JSONSaver(filename, metrics=metrics, storage_format=storage_format)
+
+
+def vacancy_to_dict(vacancy: Vacancy) -> Dict:
+    return {
+        "title": vacancy.title,
+        "url": vacancy.url,
+        "salary_from": vacancy.salary_from,
+        "salary_to": vacancy.salary_to,
+        "description": vacancy.description,
+    }
+
+
+def write_vacancies(vacancies: Iterable[Vacancy], output_format: str, out: TextIO):
+    """Выводит вакансии по одной, не накапливая их в памяти."""
+    count = 0
+    for vacancy in vacancies:
+        if output_format == "json":
+            out.write(json.dumps(vacancy_to_dict(vacancy), ensure_ascii=False) + "\n")
+        else:
+            out.write(f"{vacancy}\n")
+        out.flush()
+        count += 1
+    return count
+
+
+def read_lines(filename: str) -> List[str]:
+    """Читает непустые строки файла (или stdin для "-"), пропуская комментарии."""
+    if filename == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(filename, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.startswith("#")]
+
+
+def parse_where(conditions: Optional[List[str]]) -> Dict:
+    """Разбирает условия вида поле__оператор=значение в критерии get_vacancies."""
+    criteria = {}
+    for condition in conditions or []:
+        key, sep, value = condition.partition("=")
+        if not sep or not key:
+            raise ValueError(f"Условие должно иметь вид поле=значение: {condition}")
+        if key.endswith(("__between", "__in")):
+            value = [_parse_value(part) for part in value.split(",")]
+        else:
+            value = _parse_value(value)
+        criteria[key] = value
+    # Неизвестный оператор — ошибка в аргументах, а не сбой выгрузки
+    compile_query(criteria)
+    return criteria
+
+
+def _parse_value(value: str):
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def fetch_all(
+    connector: HHruConnector,
+    queries: List[str],
+    workers: int,
+    err: TextIO,
+    watermarks: Optional[WatermarkStore] = None,
+) -> tuple:
+    """Выполняет запросы параллельно: возвращает вакансии, число сбоев и
+    успешные запросы.
+
+    С watermarks запрашиваются только вакансии новее отметки запроса.
+    """
+    results: Dict[str, List[Dict]] = {}
+    failures = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for query in queries:
+            if watermarks is None:
+                future = executor.submit(connector.get_vacancies, query)
+            else:
+                future = executor.submit(
+                    connector.get_vacancies, query, watermarks.get(query)
+                )
+            futures[future] = query
+        for future in as_completed(futures):
+            query = futures[future]
+            try:
+                results[query] = future.result()
+            except Exception as e:
+                failures += 1
+                print(f"Ошибка запроса '{query}': {e}", file=err, flush=True)
+                continue
+            print(
+                f"Запрос '{query}': получено {len(results[query])} вакансий",
+                file=err,
+                flush=True,
+            )
+
+    # Порядок вакансий не зависит от того, какой запрос завершился первым
+    items = (item for query in queries for item in results.get(query, []))
+    return list(dedupe(parse_items(items))), failures, list(results)
+
+
+def command_fetch(args, saver: DataSaver, registry: Optional[MetricsRegistry]) -> int:
+    queries = list(args.queries)
+    if args.queries_file:
+        queries.extend(read_lines(args.queries_file))
+    queries = list(dict.fromkeys(queries))
+    if not queries:
+        print("Не задано ни одного запроса", file=sys.stderr)
+        return EXIT_USAGE
+
+    cache = None if args.no_cache else ResponseCache(args.cache_dir, ttl=args.ttl)
+    per_query_workers = 5
+    # Один клиент на все запросы: общий пул соединений и общий лимит частоты
+    client = HttpClient(
+        rate_limiter=TokenBucket(rate=args.rate),
+        pool_size=args.workers * per_query_workers,
+        cache=cache,
+        metrics=registry,
+    )
+    connector = HHruConnector(
+        max_workers=per_query_workers,
+        http_client=client,
+        metrics=registry,
+        raise_errors=True,
+    )
+    if args.incremental:
+        return _fetch_incremental(args, connector, client, saver, queries)
+
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            vacancies, failures, _ = fetch_all(
+                connector, queries, args.workers, sys.stderr
+            )
+            # Все найденные вакансии сохраняются одной операцией записи
+            results = saver.add_vacancies(vacancies)
+    finally:
+        client.close()
+
+    added = [vacancy for vacancy, ok in zip(vacancies, results) if ok]
+    write_vacancies(added, args.format, sys.stdout)
+    print(
+        f"Запросов: {len(queries)}, ошибок: {failures}, "
+        f"найдено: {len(vacancies)}, добавлено: {len(added)}",
+        file=sys.stderr,
+    )
+    return EXIT_FAILURE if failures else EXIT_OK
+
+
+def _fetch_incremental(args, connector, client, saver: DataSaver, queries) -> int:
+    """Загружает только новые вакансии и обновляет изменившиеся по URL."""
+    watermarks = WatermarkStore(args.watermarks)
+    started_at = datetime.now(timezone.utc)
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            vacancies, failures, succeeded = fetch_all(
+                connector, queries, args.workers, sys.stderr, watermarks
+            )
+            statuses = saver.upsert_vacancies(vacancies)
+    finally:
+        client.close()
+
+    counts = count_statuses(statuses)
+    if not counts[FAILED]:
+        # Отметки сдвигаются только у запросов, результаты которых сохранены
+        watermark = format_watermark(started_at - DEFAULT_OVERLAP)
+        for query in succeeded:
+            watermarks.set(query, watermark)
+        watermarks.save()
+
+    changed = [
+        vacancy
+        for vacancy, status in zip(vacancies, statuses)
+        if status in (ADDED, UPDATED)
+    ]
+    write_vacancies(changed, args.format, sys.stdout)
+    print(
+        f"Запросов: {len(queries)}, ошибок: {failures}, найдено: {len(vacancies)}, "
+        + describe_counts(counts),
+        file=sys.stderr,
+    )
+    return EXIT_FAILURE if failures or counts[FAILED] else EXIT_OK
+
+
+def command_top(args, saver: DataSaver, registry) -> int:
+    with contextlib.redirect_stdout(sys.stderr):
+        vacancies = saver.top_by_salary(args.n, field=args.field)
+    write_vacancies(vacancies, args.format, sys.stdout)
+    return EXIT_OK
+
+
+def command_search(args, saver: DataSaver, registry) -> int:
+    with contextlib.redirect_stdout(sys.stderr):
+        vacancies = saver.search_vacancies(args.keyword)
+    count = write_vacancies(vacancies, args.format, sys.stdout)
+    return EXIT_OK if count else EXIT_FAILURE
+
+
+def command_export(args, saver: DataSaver, registry) -> int:
+    try:
+        criteria = parse_where(args.where)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return EXIT_USAGE
+
+    vacancies = saver.iter_vacancies(criteria)
+    if args.output in (None, "-"):
+        count = write_vacancies(vacancies, args.format, sys.stdout)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            count = write_vacancies(vacancies, args.format, f)
+    print(f"Выгружено вакансий: {count}", file=sys.stderr)
+    return EXIT_OK
+
+
+def command_delete(args, saver: DataSaver, registry) -> int:
+    urls = list(args.urls)
+    if args.urls_file:
+        urls.extend(read_lines(args.urls_file))
+    if not urls:
+        print("Не задано ни одного URL", file=sys.stderr)
+        return EXIT_USAGE
+
+    with contextlib.redirect_stdout(sys.stderr):
+        results = saver.delete_vacancies(Vacancy("", url) for url in urls)
+    for url, deleted in zip(urls, results):
+        status = "deleted" if deleted else "not_found"
+        if args.format == "json":
+            print(json.dumps({"url": url, "status": status}), flush=True)
+        else:
+            print(f"{status}\t{url}", flush=True)
+    return EXIT_OK if all(results) else EXIT_FAILURE
+
+
+def command_dedupe(args, saver: DataSaver, registry) -> int:
+    """Удаляет почти одинаковые вакансии, оставляя первую из группы."""
+    with contextlib.redirect_stdout(sys.stderr):
+        groups = remove_near_duplicates(saver, args.threshold, args.dry_run)
+    for group in groups:
+        urls = [vacancy.url for vacancy in group]
+        if args.format == "json":
+            print(json.dumps({"keep": urls[0], "duplicates": urls[1:]}), flush=True)
+        else:
+            print(" ".join(urls), flush=True)
+    removed = sum(len(group) - 1 for group in groups)
+    action = "Найдено" if args.dry_run else "Удалено"
+    print(f"{action} почти одинаковых вакансий: {removed}", file=sys.stderr)
+    return EXIT_OK
+
+
+def command_migrate(args) -> int:
+    """Переносит JSON-хранилище в JSONL, SQLite, шарды или JSON другого формата."""
+    extension = os.path.splitext(args.target)[1].lower()
+    with contextlib.redirect_stdout(sys.stderr):
+        if extension == ".json" or extension in COMPRESSED_EXTENSIONS:
+            storage_format = args.storage_format or COMPRESSED_EXTENSIONS.get(
+                extension, "compact"
+            )
+            count = convert_json_format(args.source, args.target, storage_format)
+        elif extension == ".jsonl":
+            count = convert_json_to_jsonl(args.source, args.target)
+        elif extension in (".db", ".sqlite", ".sqlite3"):
+            count = migrate_json_to_sqlite(args.source, args.target)
+        elif extension == ".shards":
+            count = migrate_json_to_shards(args.source, args.target)
+        else:
+            print(f"Неизвестный формат назначения: {args.target}", file=sys.stderr)
+            return EXIT_USAGE
+    print(f"Перенесено вакансий: {count}", file=sys.stderr)
+    return EXIT_OK
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="vacancies", description="Сбор и обработка вакансий hh.ru"
+    )
+    parser.add_argument(
+        "--storage",
+        default=DEFAULT_STORAGE,
+        help="хранилище: .json (.gz, .xz), .jsonl, .db (SQLite) или каталог .shards",
+    )
+    parser.add_argument(
+        "--storage-format",
+        choices=FORMATS,
+        help="формат JSON-хранилища при записи (по умолчанию — текущий формат файла)",
+    )
+    parser.add_argument(
+        "--format", choices=("text", "json"), default="text", help="формат вывода"
+    )
+    parser.add_argument(
+        "--metrics", help="записать метрики Prometheus в файл ('-' — в stdout)"
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="вывести в stderr время этапов запуска и импорта модулей",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    fetch = commands.add_parser("fetch", help="загрузить вакансии с hh.ru")
+    fetch.add_argument("queries", nargs="*", help="поисковые запросы")
+    fetch.add_argument("--queries-file", help="файл с запросами, по одному в строке")
+    fetch.add_argument("--workers", type=int, default=4, help="параллельных запросов")
+    fetch.add_argument("--rate", type=float, default=10, help="запросов в секунду")
+    fetch.add_argument("--cache-dir", default=CACHE_DIR)
+    fetch.add_argument("--ttl", type=float, default=600, help="TTL кэша, секунд")
+    fetch.add_argument("--no-cache", action="store_true")
+    fetch.add_argument(
+        "--incremental",
+        action="store_true",
+        help="загрузить только новые вакансии и обновить изменившиеся",
+    )
+    fetch.add_argument(
+        "--watermarks", default=WATERMARKS_FILE, help="файл отметок синхронизации"
+    )
+    fetch.set_defaults(handler=command_fetch)
+
+    top = commands.add_parser("top", help="вакансии с наибольшей зарплатой")
+    top.add_argument("n", type=int)
+    top.add_argument("--field", choices=SALARY_FIELDS, default="salary_from")
+    top.set_defaults(handler=command_top)
+
+    search = commands.add_parser("search", help="поиск по описанию")
+    search.add_argument("keyword")
+    search.set_defaults(handler=command_search)
+
+    export = commands.add_parser("export", help="выгрузить сохраненные вакансии")
+    export.add_argument(
+        "-o", "--output", help="файл для выгрузки (по умолчанию stdout)"
+    )
+    export.add_argument(
+        "--where",
+        action="append",
+        help="условие поле__оператор=значение, например salary_from__gte=100000",
+    )
+    export.set_defaults(handler=command_export)
+
+    delete = commands.add_parser("delete", help="удалить вакансии по URL")
+    delete.add_argument("urls", nargs="*")
+    delete.add_argument("--urls-file", help="файл с URL, по одному в строке")
+    delete.set_defaults(handler=command_delete)
+
+    dedupe_parser = commands.add_parser(
+        "dedupe", help="удалить почти одинаковые вакансии (MinHash)"
+    )
+    dedupe_parser.add_argument(
+        "--threshold", type=float, default=0.8, help="порог похожести от 0 до 1"
+    )
+    dedupe_parser.add_argument(
+        "--dry-run", action="store_true", help="только показать группы дублей"
+    )
+    dedupe_parser.set_defaults(handler=command_dedupe)
+
+    migrate = commands.add_parser(
+        "migrate", help="перенести JSON в JSONL, SQLite, шарды или другой формат"
+    )
+    migrate.add_argument("source")
+    migrate.add_argument("target")
+    migrate.set_defaults(handler=None)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Точка входа командной строки; возвращает код выхода."""
+    profile = StartupProfile()
+    with profile.phase("разбор аргументов"):
+        args = build_parser().parse_args(argv)
+    if args.command == "migrate":
+        return command_migrate(args)
+
+    registry = MetricsRegistry() if args.metrics else None
+    with profile.phase("загрузка хранилища"), contextlib.redirect_stdout(sys.stderr):
+        saver = open_saver(args.storage, registry, args.storage_format)
+        if isinstance(saver, JSONSaver):
+            # Сообщения о загрузке не должны попасть в вывод команды
+            saver.load()
+    try:
+        with profile.phase(f"команда {args.command}"):
+            return args.handler(args, saver, registry)
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"Ошибка: {e}", file=sys.stderr)
+        return EXIT_FAILURE
+    finally:
+        close = getattr(saver, "close", None)
+        if close is not None:
+            close()
+        if registry is not None:
+            registry.dump(None if args.metrics == "-" else args.metrics)
+        if args.profile_startup:
+            profile.report(sys.stderr, module="cli")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,281 @@
+import heapq
+import operator
+import statistics
+import sys
+from array import array
+from typing import Dict, Iterable, List, Optional, Union
+
+from data_savers import DataSaver, _check_salary_field
+from lazy_import import lazy_import
+from query import Group, Predicate, compile_query
+from vacancy import Vacancy
+
+# NumPy необязателен: без него работаем на array
+np = lazy_import("numpy")
+
+SALARY_COLUMNS = ("salary_from", "salary_to")
+
+# Операторы, которые выполняются над колонкой зарплат целиком
+VECTOR_OPERATORS = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+}
+
+
+class ColumnarStore:
+    """Колоночное хранилище вакансий в памяти для аналитических выборок.
+
+    Зарплаты лежат в array('q') (пустая зарплата хранится как 0, как в Vacancy),
+    а отдельная маска salary_*_null отмечает пустые значения: для них, как и
+    в query.py, не выполняются сравнения и диапазоны. Названия и URL
+    интернированы. При установленном NumPy фильтры, top-N и агрегаты
+    считаются векторно.
+    """
+
+    def __init__(self, use_numpy: Optional[bool] = None):
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
+        if self.use_numpy and np is None:
+            raise RuntimeError("NumPy не установлен")
+        self.titles: List[str] = []
+        self.urls: List[str] = []
+        self.descriptions: List[Optional[str]] = []
+        self.salary_from = array("q")
+        self.salary_to = array("q")
+        self.salary_from_null = array("b")
+        self.salary_to_null = array("b")
+        self.__vectors: Dict[str, object] = {}
+
+    @classmethod
+    def from_records(
+        cls, records: Iterable[Dict], use_numpy: Optional[bool] = None
+    ) -> "ColumnarStore":
+        """Строит хранилище из записей в формате JSONSaver."""
+        store = cls(use_numpy)
+        for record in records:
+            store.append(record)
+        return store
+
+    @classmethod
+    def from_saver(
+        cls, saver: DataSaver, use_numpy: Optional[bool] = None
+    ) -> "ColumnarStore":
+        """Строит хранилище по колонкам, не создавая объектов Vacancy.
+
+        get_values отдает пустую зарплату как 0, поэтому 0 считается пустым.
+        """
+        store = cls(use_numpy)
+        store.titles = [sys.intern(str(title)) for title in saver.get_values("title")]
+        store.urls = [sys.intern(str(url)) for url in saver.get_values("url")]
+        store.descriptions = saver.get_values("description")
+        store.salary_from = array(
+            "q", (int(v) for v in saver.get_values("salary_from"))
+        )
+        store.salary_to = array("q", (int(v) for v in saver.get_values("salary_to")))
+        store.salary_from_null = array("b", (not v for v in store.salary_from))
+        store.salary_to_null = array("b", (not v for v in store.salary_to))
+        return store
+
+    def append(self, record: Dict):
+        """Добавляет запись в конец колонок."""
+        self.__vectors.clear()
+        self.titles.append(sys.intern(str(record["title"])))
+        self.urls.append(sys.intern(str(record["url"])))
+        self.descriptions.append(record.get("description"))
+        for field in SALARY_COLUMNS:
+            value = record.get(field)
+            getattr(self, field).append(int(value or 0))
+            getattr(self, f"{field}_null").append(value is None)
+
+    def __len__(self):
+        return len(self.urls)
+
+    def __column(self, field: str):
+        """Возвращает колонку зарплат: массив NumPy или array('q')."""
+        if field == "midpoint":
+            return self.__midpoints()
+        column = getattr(self, field)
+        if not self.use_numpy:
+            return column
+        if field not in self.__vectors:
+            # Копия, а не np.frombuffer: представление над буфером array('q')
+            # запрещает его расширять, и append падал бы с BufferError
+            self.__vectors[field] = np.array(column, dtype=np.int64)
+        return self.__vectors[field]
+
+    def __nulls(self, field: str):
+        """Возвращает маску пустых зарплат: массив NumPy или array('b')."""
+        column = getattr(self, f"{field}_null")
+        if not self.use_numpy:
+            return column
+        key = f"{field}_null"
+        if key not in self.__vectors:
+            self.__vectors[key] = np.array(column, dtype=bool)
+        return self.__vectors[key]
+
+    def __midpoints(self):
+        if self.use_numpy:
+            if "midpoint" not in self.__vectors:
+                low = self.__column("salary_from").astype(np.float64)
+                high = self.__column("salary_to").astype(np.float64)
+                self.__vectors["midpoint"] = np.where(
+                    (low > 0) & (high > 0), (low + high) / 2, np.maximum(low, high)
+                )
+            return self.__vectors["midpoint"]
+        return [
+            (low + high) / 2 if low and high else max(low, high)
+            for low, high in zip(self.salary_from, self.salary_to)
+        ]
+
+    def row(self, index: int) -> Dict:
+        """Возвращает запись по номеру строки; пустая зарплата — None."""
+        return {
+            "title": self.titles[index],
+            "url": self.urls[index],
+            "salary_from": (
+                None if self.salary_from_null[index] else self.salary_from[index]
+            ),
+            "salary_to": None if self.salary_to_null[index] else self.salary_to[index],
+            "description": self.descriptions[index],
+        }
+
+    def vacancy(self, index: int) -> Vacancy:
+        """Создает объект Vacancy по номеру строки."""
+        return Vacancy(**self.row(index))
+
+    def filter(
+        self, criteria: Optional[Dict[str, Union[str, int, None]]] = None
+    ) -> List[int]:
+        """Возвращает номера строк, подходящих под критерии.
+
+        Условия на зарплаты верхнего уровня выполняются над колонкой целиком,
+        остальные — построчно только для оставшихся строк.
+        """
+        plan = compile_query(criteria)
+        vector, rest = [], []
+        for child in plan.root.children:
+            if (
+                isinstance(child, Predicate)
+                and child.field in SALARY_COLUMNS
+                and (child.op in VECTOR_OPERATORS or child.op == "between")
+                and plan.root.kind == "and"
+            ):
+                vector.append(child)
+            else:
+                rest.append(child)
+        if plan.root.kind != "and":
+            vector, rest = [], [plan.root]
+
+        rows = self.__filter_vector(vector)
+        if rest:
+            group = Group("and", rest)
+            rows = [i for i in rows if group.matches(self.row(i))]
+        return rows
+
+    def __filter_vector(self, predicates: List[Predicate]) -> List[int]:
+        if self.use_numpy:
+            mask = np.ones(len(self), dtype=bool)
+            for predicate in predicates:
+                column = self.__column(predicate.field)
+                nulls = self.__nulls(predicate.field)
+                if predicate.op == "between":
+                    low, high = predicate.value
+                    matches = (column >= low) & (column <= high)
+                else:
+                    matches = VECTOR_OPERATORS[predicate.op](column, predicate.value)
+                # Пустое значение не равно ничему, поэтому ne для него истинно
+                if predicate.op == "ne":
+                    mask &= matches | nulls
+                else:
+                    mask &= matches & ~nulls
+            return np.flatnonzero(mask).tolist()
+
+        rows = range(len(self))
+        for predicate in predicates:
+            column = self.__column(predicate.field)
+            nulls = self.__nulls(predicate.field)
+            if predicate.op == "between":
+                low, high = predicate.value
+                rows = [i for i in rows if not nulls[i] and low <= column[i] <= high]
+            elif predicate.op == "ne":
+                value = predicate.value
+                rows = [i for i in rows if nulls[i] or column[i] != value]
+            else:
+                test, value = VECTOR_OPERATORS[predicate.op], predicate.value
+                rows = [i for i in rows if not nulls[i] and test(column[i], value)]
+        return list(rows)
+
+    def top_by_salary(self, n: int, field: str = "salary_from") -> List[Vacancy]:
+        """Возвращает n вакансий с наибольшей зарплатой, равные — в порядке строк."""
+        _check_salary_field(field)
+        if n <= 0:
+            return []
+        column = self.__column(field)
+        if self.use_numpy:
+            winners = _top_indexes(column, n).tolist()
+        else:
+            winners = heapq.nlargest(n, range(len(self)), key=column.__getitem__)
+        return [self.vacancy(i) for i in winners]
+
+    def salary_stats(
+        self, field: str = "salary_from", rows: Optional[List[int]] = None
+    ) -> Dict[str, Optional[float]]:
+        """Считает количество, минимум, максимум, среднее и медиану зарплат.
+
+        Нулевые (не указанные) зарплаты в расчет не входят.
+        """
+        _check_salary_field(field)
+        column = self.__column(field)
+        if self.use_numpy:
+            values = column if rows is None else column[np.asarray(rows, dtype=int)]
+            values = values[values > 0]
+            if not len(values):
+                return _empty_stats()
+            return {
+                "count": int(len(values)),
+                "min": float(values.min()),
+                "max": float(values.max()),
+                "mean": float(values.mean()),
+                "median": float(np.median(values)),
+            }
+
+        values = column if rows is None else [column[i] for i in rows]
+        values = [value for value in values if value > 0]
+        if not values:
+            return _empty_stats()
+        return {
+            "count": len(values),
+            "min": float(min(values)),
+            "max": float(max(values)),
+            "mean": float(statistics.fmean(values)),
+            "median": float(statistics.median(values)),
+        }
+
+    def __str__(self):
+        backend = "numpy" if self.use_numpy else "array"
+        return f"ColumnarStore(vacancies={len(self)}, backend={backend})"
+
+
+def _top_indexes(column, n: int):
+    """Номера n наибольших значений; равные — в порядке строк.
+
+    np.argpartition отбирает кандидатов за линейное время, и сортируются
+    только они, а не вся колонка.
+    """
+    values = -column
+    if n < len(values):
+        bound = values[np.argpartition(values, n - 1)[n - 1]]
+        better = np.flatnonzero(values < bound)
+        # Из равных пограничному берем первые по порядку строк
+        ties = np.flatnonzero(values == bound)[: n - len(better)]
+        candidates = np.concatenate([better, ties])
+    else:
+        candidates = np.arange(len(values))
+    return candidates[np.argsort(values[candidates], kind="stable")]
+
+
+def _empty_stats() -> Dict[str, Optional[float]]:
+    return {"count": 0, "min": None, "max": None, "mean": None, "median": None}
@@ -1,9 +1,91 @@
 import abc
+import bisect
+import contextlib
+import heapq
 import json
+import mmap
+import os
+import sqlite3
+import threading
 import uuid
-from typing import Dict, List, Optional, Union
+import zlib
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
 
-from vacancy import Vacancy
+import storage_formats
+from dedup import NearDuplicateDetector
+from file_lock import FileLock
+from metrics import MetricsRegistry, timer
+from query import QueryPlan, compile_query
+from search_index import InvertedIndex
+from snapshot_cache import SnapshotCache
+from vacancy import LazyVacancyList, Vacancy
+
+SALARY_FIELDS = ("salary_from", "salary_to", "midpoint")
+
+
+def _salary_value(
+    salary_from: Optional[int], salary_to: Optional[int], field: str
+) -> float:
+    """Возвращает значение зарплаты для сортировки; пустая зарплата считается нулем."""
+    salary_from = salary_from or 0
+    salary_to = salary_to or 0
+    if field == "salary_from":
+        return salary_from
+    if field == "salary_to":
+        return salary_to
+    if salary_from and salary_to:
+        return (salary_from + salary_to) / 2
+    return max(salary_from, salary_to)
+
+
+VACANCY_FIELDS = ("title", "url", "salary_from", "salary_to", "description")
+
+
+def _project(record, field: str):
+    """Читает одно поле записи так же, как его вернул бы объект Vacancy."""
+    value = record.get(field)
+    if value is None and field in ("salary_from", "salary_to"):
+        return 0
+    return value
+
+
+# Результаты upsert_vacancies для каждой вакансии
+ADDED, UPDATED, UNCHANGED, SKIPPED, FAILED = (
+    "added",
+    "updated",
+    "unchanged",
+    "skipped",
+    "failed",
+)
+
+
+def _record_changed(record, vacancy: Vacancy) -> bool:
+    """Проверяет, отличается ли сохраненная запись от вакансии с тем же URL."""
+    return any(
+        _project(record, field) != getattr(vacancy, field)
+        for field in VACANCY_FIELDS
+        if field != "url"
+    )
+
+
+def _file_state(filename: str) -> Optional[tuple]:
+    """Возвращает inode, размер и время изменения файла или None, если его нет."""
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def _check_vacancy_field(field: str):
+    if field not in VACANCY_FIELDS:
+        raise ValueError(f"Неизвестное поле вакансии: {field}")
+
+
+def _check_salary_field(field: str):
+    if field not in SALARY_FIELDS:
+        raise ValueError(f"Неизвестное поле зарплаты: {field}")
 
 
 class DataSaver(abc.ABC):
@@ -15,31 +97,358 @@ class DataSaver(abc.ABC):
 
     @abc.abstractmethod
     def get_vacancies(
-        self, criteria: Optional[Dict[str, Union[str, int, None]]] = None
-    ) -> List[Vacancy]:
+        self,
+        criteria: Optional[Dict[str, Union[str, int, None]]] = None,
+        lazy: bool = False,
+    ) -> Sequence[Vacancy]:
         pass
 
     @abc.abstractmethod
     def delete_vacancy(self, vacancy: Vacancy):
         pass
 
+    def iter_vacancies(
+        self, criteria: Optional[Dict[str, Union[str, int, None]]] = None
+    ) -> Iterator[Vacancy]:
+        """Последовательно отдает вакансии, отфильтрованные по критериям."""
+        yield from self.get_vacancies(criteria)
+
+    def get_values(
+        self, field: str, criteria: Optional[Dict[str, Union[str, int, None]]] = None
+    ) -> List:
+        """Возвращает значения одного поля у вакансий, подходящих под критерии."""
+        _check_vacancy_field(field)
+        return [getattr(v, field) for v in self.iter_vacancies(criteria)]
+
+    def add_vacancies(self, vacancies: Iterable[Vacancy]) -> List[bool]:
+        """Добавляет несколько вакансий и возвращает результат для каждой."""
+        return [self.add_vacancy(vacancy) for vacancy in vacancies]
+
+    def delete_vacancies(self, vacancies: Iterable[Vacancy]) -> List[bool]:
+        """Удаляет несколько вакансий и возвращает результат для каждой."""
+        return [self.delete_vacancy(vacancy) for vacancy in vacancies]
+
+    def upsert_vacancies(self, vacancies: Iterable[Vacancy]) -> List[str]:
+        """Добавляет новые вакансии и обновляет изменившиеся по совпадению URL.
+
+        Для каждой вакансии возвращает added, updated, unchanged, skipped
+        (не добавлена, например дубль по названию) или failed.
+        """
+        statuses = []
+        for vacancy in vacancies:
+            existing = self.get_vacancies({"url": vacancy.url})
+            if not existing:
+                added = self.add_vacancies([vacancy])[0]
+                statuses.append(ADDED if added else SKIPPED)
+            elif not _record_changed(
+                {field: getattr(existing[0], field) for field in VACANCY_FIELDS},
+                vacancy,
+            ):
+                statuses.append(UNCHANGED)
+            else:
+                self.delete_vacancies([vacancy])
+                updated = self.add_vacancies([vacancy])[0]
+                if not updated:
+                    # Новую версию не приняли (например, дубль по названию):
+                    # возвращаем старую, чтобы не потерять вакансию
+                    self.add_vacancies(existing[:1])
+                statuses.append(UPDATED if updated else FAILED)
+        return statuses
+
+    def top_by_salary(self, n: int, field: str = "salary_from") -> List[Vacancy]:
+        """Возвращает n вакансий с наибольшей зарплатой, равные — в порядке хранения."""
+        _check_salary_field(field)
+        return heapq.nlargest(
+            n,
+            self.iter_vacancies(),
+            key=lambda v: _salary_value(v.salary_from, v.salary_to, field),
+        )
+
+    def search_vacancies(self, keyword: str) -> List[Vacancy]:
+        """Ищет вакансии, в описании которых встречается ключевое слово."""
+        keyword = keyword.lower()
+        return [
+            v
+            for v in self.get_vacancies({})
+            if v.description and keyword in v.description.lower()
+        ]
+
 
 class JSONSaver(DataSaver):
-    """Класс для сохранения и загрузки вакансий в JSON-файл."""
+    """Класс для сохранения и загрузки вакансий в JSON-файл.
+
+    dedup задает, какие вакансии с новым URL считаются дублями: "title" —
+    совпадение названия без учета регистра, "near" — почти одинаковые название
+    и описание (MinHash с LSH, порог похожести near_threshold).
+
+    Один файл могут одновременно использовать несколько процессов: запись идет
+    под блокировкой файла {filename}.lock и начинается с подхвата чужих
+    изменений, а чтение перечитывает файл, только если он изменился.
+
+    Файл читается не в конструкторе, а при первом обращении к данным.
+
+    storage_format — формат файла из storage_formats.FORMATS: отступы,
+    компактный JSON, строки без ключей с заголовком, сжатие gzip или lzma.
+    Формат при чтении определяется сам; без storage_format файл сохраняется
+    в том же формате, в каком был записан.
+    """
+
+    DEDUP_MODES = ("title", "near")
+    # Атрибуты, первое обращение к которым загружает данные
+    _LAZY_ATTRIBUTES = frozenset(
+        {
+            "_data",
+            "_url_index",
+            "_title_index",
+            "_search_index",
+            "_near_detector",
+            "_sorted_indexes",
+        }
+    )
 
     def __init__(
         self,
         filename: str = "C:/Users/Sator/PycharmProjects/OOP_KURSOVAYA/data/vacancies.json",
+        journal: bool = False,
+        compact_threshold: int = 1000,
+        metrics: Optional[MetricsRegistry] = None,
+        dedup: str = "title",
+        near_threshold: float = 0.8,
+        binary_cache: bool = True,
+        storage_format: Optional[str] = None,
     ):
+        if dedup not in self.DEDUP_MODES:
+            raise ValueError(f"Неизвестный режим поиска дублей: {dedup}")
+        if storage_format is not None:
+            storage_formats.parse_format(storage_format)
         self.filename = filename
-        self.data = self.__load_data()
+        self.journal = journal
+        self.metrics = metrics
+        self.dedup = dedup
+        self.near_threshold = near_threshold
+        self.storage_format = storage_format
+        self._snapshot_cache = (
+            SnapshotCache(filename, decode=storage_formats.decode)
+            if binary_cache
+            else None
+        )
+        self.journal_filename = f"{filename}.journal"
+        self.index_filename = f"{filename}.index"
+        self.lock_filename = f"{filename}.lock"
+        self.compact_threshold = compact_threshold
+        self._lock = threading.RLock()
+        self._lock_depth = 0
+        self._journal_entries = 0
+        self._journal_offset = 0
+        self._synced_state: tuple = (None, None)
+        self._compaction_thread: Optional[threading.Thread] = None
+        self._loaded = False
+
+    def __getattr__(self, name):
+        # Вызывается только для отсутствующих атрибутов, то есть до загрузки
+        if name in JSONSaver._LAZY_ATTRIBUTES and not self.__dict__.get(
+            "_loaded", True
+        ):
+            self.load()
+            return getattr(self, name)
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+    def load(self):
+        """Загружает данные сразу, не дожидаясь первого обращения к ним."""
+        with self._lock:
+            if self._loaded:
+                return
+            if os.path.isdir(os.path.dirname(self.filename) or "."):
+                with self._locked(shared=True):
+                    self._reload()
+            else:
+                self._reload()
+
+    @property
+    def data(self) -> List[Dict]:
+        return self._data
+
+    @data.setter
+    def data(self, value: List[Dict]):
+        if not self._loaded:
+            # Заданные явно данные заменяют загрузку из файла
+            self._loaded = True
+            self._synced_state = self._disk_state()
+        self._data = value
+        self._rebuild_indexes()
+
+    @staticmethod
+    def _normalize_title(title: str) -> str:
+        """Приводит название к виду для сравнения: нижний регистр, одиночные пробелы."""
+        return " ".join(str(title).lower().split())
+
+    def _rebuild_indexes(self):
+        """Строит индексы по URL и названию за один проход по данным."""
+        self._url_index: Dict[str, List[Dict]] = {}
+        self._title_index: Dict[str, int] = {}
+        self._search_index: Optional[InvertedIndex] = None
+        self._near_detector: Optional[NearDuplicateDetector] = None
+        self._sorted_indexes: Dict[tuple, Optional[tuple]] = {}
+        for record in self._data:
+            self._index_record(record)
+
+    def _index_record(self, record: Dict):
+        """Добавляет запись в индексы."""
+        self._sorted_indexes.clear()
+        self._url_index.setdefault(record.get("url"), []).append(record)
+        title = self._normalize_title(record.get("title", ""))
+        self._title_index[title] = self._title_index.get(title, 0) + 1
+        if self._search_index is not None:
+            self._search_index.add(record.get("url"), record.get("description"))
+        if self._near_detector is not None:
+            self._near_detector.add(
+                record.get("url"), record.get("title"), record.get("description")
+            )
+
+    def _unindex_record(self, record: Dict):
+        """Удаляет запись из индексов."""
+        self._sorted_indexes.clear()
+        records = self._url_index.get(record.get("url"), [])
+        for i, item in enumerate(records):
+            if item is record:
+                del records[i]
+                break
+        if not records:
+            self._url_index.pop(record.get("url"), None)
+
+        title = self._normalize_title(record.get("title", ""))
+        count = self._title_index.get(title, 0) - 1
+        if count > 0:
+            self._title_index[title] = count
+        else:
+            self._title_index.pop(title, None)
+        if record.get("url") not in self._url_index:
+            if self._search_index is not None:
+                self._search_index.remove(record.get("url"), record.get("description"))
+            if self._near_detector is not None:
+                self._near_detector.remove(record.get("url"))
+
+    def _ensure_near_detector(self) -> NearDuplicateDetector:
+        """Строит индекс почти одинаковых вакансий при первом обращении."""
+        if self._near_detector is None:
+            detector = NearDuplicateDetector(self.near_threshold)
+            for record in self._data:
+                detector.add(
+                    record.get("url"), record.get("title"), record.get("description")
+                )
+            self._near_detector = detector
+        return self._near_detector
+
+    def _find_duplicate(self, vacancy: Vacancy) -> Optional[str]:
+        """Возвращает причину, по которой вакансия с новым URL считается дублем."""
+        if self.dedup == "near":
+            matches = self._ensure_near_detector().find(
+                vacancy.title, vacancy.description
+            )
+            if matches:
+                return f"Похожая вакансия уже существует: {matches[0][0]}"
+            return None
+        if self._normalize_title(vacancy.title) in self._title_index:
+            return f"Вакансия с названием '{vacancy.title}' уже существует"
+        return None
+
+    def _disk_state(self) -> tuple:
+        """Состояние файлов снимка и журнала, по которому видны чужие изменения."""
+        return (_file_state(self.filename), _file_state(self.journal_filename))
+
+    @contextlib.contextmanager
+    def _locked(self, shared: bool = False):
+        """Берет межпроцессную блокировку хранилища; повторный вход не блокирует."""
+        with self._lock:
+            if self._lock_depth:
+                self._lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth -= 1
+                return
+            with FileLock(self.lock_filename, shared):
+                self._lock_depth = 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth = 0
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        """Исключительная блокировка с подхватом изменений других процессов."""
+        with self._locked():
+            self._refresh_locked()
+            yield
+
+    def _reload(self):
+        """Полностью загружает снимок и журнал."""
+        with timer(
+            self.metrics, "saver_load_seconds", "Загрузка хранилища", saver="json"
+        ):
+            self._loaded = True
+            self._synced_state = self._disk_state()
+            self.data = self.__load_data()
+            self._journal_entries = 0
+            self._journal_offset = 0
+            if self.journal:
+                self._replay_journal()
+        self._update_record_gauge()
+
+    def refresh(self) -> bool:
+        """Перечитывает хранилище, если его изменил другой процесс.
+
+        Проверка стоит двух вызовов stat; если другой процесс только дописал
+        журнал, применяется лишь новый хвост.
+        """
+        if not self._loaded or self._disk_state() == self._synced_state:
+            return False
+        with self._locked(shared=True):
+            return self._refresh_locked()
+
+    def _refresh_locked(self) -> bool:
+        if not self._loaded:
+            self._reload()
+            return True
+        state = self._disk_state()
+        if state == self._synced_state:
+            return False
+        snapshot, journal = state
+        synced_snapshot, synced_journal = self._synced_state
+        appended = (
+            self.journal
+            and snapshot == synced_snapshot
+            and journal is not None
+            and (synced_journal is None or journal[0] == synced_journal[0])
+            and journal[1] >= self._journal_offset
+        )
+        if appended:
+            self._synced_state = state
+            self._journal_offset = self._replay_file(
+                self.journal_filename, self._journal_offset
+            )
+            self._update_record_gauge()
+        else:
+            self._reload()
+        return True
+
+    def _mark_synced(self):
+        """Запоминает, что данные в памяти совпадают с файлами на диске."""
+        self._synced_state = self._disk_state()
+        journal = self._synced_state[1]
+        self._journal_offset = journal[1] if journal else 0
 
     def __load_data(self) -> List[Dict]:
         try:
-            with open(self.filename, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return data if isinstance(data, list) else []
-        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            if self._snapshot_cache is not None:
+                data = self._snapshot_cache.load()
+            else:
+                with open(self.filename, "rb") as f:
+                    data = storage_formats.read(f)
+            return data if isinstance(data, list) else []
+        except ValueError as e:  # ошибки JSON, кодировки и распаковки
             print(f"Ошибка загрузки файла {self.filename}: {e}")
             return []
         except Exception as e:
@@ -89,12 +498,227 @@ class JSONSaver(DataSaver):
 
     def _save_data(self):
         """Сохраняет данные в файл с обработкой ошибок."""
+        if self.journal:
+            self.compact(wait=True)
+        else:
+            self._write_snapshot(self._data)
+
+    def _write_snapshot(self, data: List[Dict]):
+        """Атомарно записывает снимок данных: временный файл и переименование."""
+        with timer(
+            self.metrics, "saver_save_seconds", "Запись хранилища", saver="json"
+        ):
+            self.__write_snapshot(data)
+
+    def _file_format(self) -> str:
+        """Формат, в котором сохранять файл: заданный явно или текущий."""
+        if self.storage_format is not None:
+            return self.storage_format
         try:
-            with open(self.filename, "w", encoding="utf-8") as f:
-                json.dump(self.data, f, ensure_ascii=False, indent=2)
+            return storage_formats.sniff(self.filename)
+        except OSError:
+            return storage_formats.DEFAULT_FORMAT
+
+    def __write_snapshot(self, data: List[Dict]):
+        tmp_filename = f"{self.filename}.{os.getpid()}.tmp"
+        try:
+            content = storage_formats.encode(data, self._file_format())
+            with open(tmp_filename, "wb") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_filename, self.filename)
         except (IOError, TypeError) as e:
             print(f"Ошибка сохранения данных: {e}")
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
             raise RuntimeError(f"Не удалось сохранить данные в файл: {e}")
+        if self._snapshot_cache is not None:
+            # Следующий запуск прочитает только что записанные данные без разбора JSON
+            self._snapshot_cache.store(data, content)
+
+    def _commit(self, operations: List[Dict]):
+        """Фиксирует изменения: дописывает их в журнал или перезаписывает файл."""
+        if not self.journal:
+            with self._locked():
+                self._save_data()
+                self._mark_synced()
+            self._update_record_gauge()
+            return
+
+        lines = "".join(
+            json.dumps(operation, ensure_ascii=False) + "\n" for operation in operations
+        )
+        with self._locked():
+            try:
+                with open(self.journal_filename, "a", encoding="utf-8") as f:
+                    f.write(lines)
+            except IOError as e:
+                print(f"Ошибка записи журнала: {e}")
+                raise RuntimeError(f"Не удалось записать журнал: {e}")
+            self._mark_synced()
+            self._journal_entries += len(operations)
+            if self._journal_entries >= self.compact_threshold:
+                self.compact(wait=False)
+        self._update_record_gauge()
+
+    def _update_record_gauge(self):
+        if self.metrics is not None:
+            self.metrics.gauge("saver_records", "Записей в хранилище").set(
+                len(self._data), saver="json"
+            )
+
+    def _query_timer(self, operation: str):
+        """Таймер длительности запроса к хранилищу."""
+        return timer(
+            self.metrics,
+            "saver_query_seconds",
+            "Длительность запросов к хранилищу",
+            saver="json",
+            operation=operation,
+        )
+
+    def _replay_journal(self):
+        """Применяет к загруженному снимку операции из журнала."""
+        self._journal_offset = self._replay_file(self.journal_filename)
+
+    def _replay_file(self, filename: str, offset: int = 0) -> int:
+        """Применяет операции журнала начиная с offset, возвращает конец прочитанного."""
+        try:
+            with open(filename, "rb") as f:
+                f.seek(offset)
+                content = f.read()
+        except FileNotFoundError:
+            return 0
+
+        if content and not content.endswith(b"\n"):
+            # Недописанный при сбое хвост отрезаем, чтобы не склеить его со
+            # следующей записью
+            content = content[: content.rfind(b"\n") + 1]
+            with open(filename, "r+b") as f:
+                f.truncate(offset + len(content))
+
+        for line in content.decode("utf-8").splitlines():
+            try:
+                operation = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            self._apply_operation(operation)
+            self._journal_entries += 1
+        return offset + len(content)
+
+    def _apply_operation(self, operation: Dict):
+        """Применяет одну операцию журнала; повторное применение безопасно."""
+        if operation.get("op") == "add":
+            record = operation["record"]
+            if record.get("url") not in self._url_index:
+                self._data.append(record)
+                self._index_record(record)
+        elif operation.get("op") == "update":
+            record = operation["record"]
+            records = self._url_index.get(record.get("url"))
+            if records:
+                self._replace_record(records[0], record)
+            else:
+                self._data.append(record)
+                self._index_record(record)
+        elif operation.get("op") == "delete":
+            records = self._url_index.get(operation.get("url"), [])
+            for record in list(records):
+                self._unindex_record(record)
+                self._data.remove(record)
+
+    def _replace_record(self, record: Dict, values: Dict):
+        """Обновляет запись на месте, сохраняя ее позицию в данных."""
+        self._unindex_record(record)
+        record.clear()
+        record.update(values)
+        self._index_record(record)
+
+    def compact(self, wait: bool = True):
+        """Сворачивает журнал в новый снимок данных.
+
+        При wait=False снимок пишется в фоновом потоке. Если до него файлы
+        успели измениться, сворачивание откладывается до следующей записи.
+        """
+        thread = self._compaction_thread
+        if thread and thread.is_alive():
+            if not wait:
+                return
+            thread.join()
+
+        with self._transaction():
+            snapshot = list(self._data)
+            state = self._synced_state
+            if wait:
+                self.__compact_snapshot(snapshot, state)
+                return
+            self._compaction_thread = threading.Thread(
+                target=self.__compact_snapshot, args=(snapshot, state)
+            )
+            self._compaction_thread.start()
+
+    def __compact_snapshot(self, snapshot: List[Dict], state: tuple):
+        with self._locked():
+            if self._disk_state() != state:
+                return
+            try:
+                self._write_snapshot(snapshot)
+            except RuntimeError:
+                return
+            if os.path.exists(self.journal_filename):
+                os.remove(self.journal_filename)
+            self._journal_entries = 0
+            self._mark_synced()
+
+    def close(self):
+        """Дожидается фонового сворачивания журнала и сохраняет поисковый индекс."""
+        thread = self._compaction_thread
+        if thread and thread.is_alive():
+            thread.join()
+        if self._loaded and self._search_index is not None:
+            self._save_search_index()
+
+    def _storage_signature(self) -> List:
+        """Возвращает состояние файлов хранилища, с которым совпадают данные в памяти.
+
+        Берется последнее синхронизированное состояние, а не текущее: если
+        другой процесс уже изменил файлы, индекс не должен считаться актуальным.
+        """
+        return [list(state) if state else None for state in self._synced_state]
+
+    def _ensure_search_index(self) -> InvertedIndex:
+        """Загружает поисковый индекс с диска или строит его по данным."""
+        if self._search_index is None:
+            signature = self._storage_signature()
+            self._search_index = InvertedIndex.load(self.index_filename, signature)
+        if self._search_index is None:
+            self._search_index = InvertedIndex()
+            for record in self._data:
+                self._search_index.add(record.get("url"), record.get("description"))
+            self._save_search_index()
+        return self._search_index
+
+    def _save_search_index(self):
+        try:
+            self._search_index.save(self.index_filename, self._storage_signature())
+        except (OSError, TypeError) as e:
+            print(f"Ошибка сохранения поискового индекса: {e}")
+
+    def search_vacancies(self, keyword: str) -> List[Vacancy]:
+        """Ищет вакансии по словам в описании через инвертированный индекс.
+
+        Слова через пробел объединяются по И, OR задает альтернативы,
+        текст в кавычках ищется как фраза. Результат упорядочен по релевантности.
+        """
+        self.refresh()
+        with self._query_timer("search"):
+            index = self._ensure_search_index()
+            return [
+                self._dict_to_vacancy(self._url_index[url][0])
+                for url in index.search(keyword)
+                if url in self._url_index
+            ]
 
     def _vacancy_to_dict(self, vacancy: Vacancy) -> Dict:
         """Конвертирует объект Vacancy в словарь для хранения."""
@@ -119,69 +743,1412 @@ class JSONSaver(DataSaver):
 
     def add_vacancy(self, vacancy: Vacancy) -> bool:
         """Добавляет вакансию, если она не существует."""
-        if not isinstance(vacancy, Vacancy):
-            raise TypeError("Ожидается объект Vacancy")
+        return self.add_vacancies([vacancy])[0]
 
-        existing_urls = {v["url"] for v in self.data}
-        existing_titles = {v["title"].lower() for v in self.data}
+    def add_vacancies(self, vacancies: Iterable[Vacancy]) -> List[bool]:
+        """Добавляет вакансии, которых еще нет, и сохраняет файл один раз."""
+        vacancies = list(vacancies)
+        with self._transaction():
+            return self.__add_vacancies(vacancies)
 
-        if vacancy.url in existing_urls:
-            print(f"Вакансия с URL {vacancy.url} уже существует")
+    def __add_vacancies(self, vacancies: List[Vacancy]) -> List[bool]:
+        results = []
+        added = []
+        try:
+            for vacancy in vacancies:
+                if not isinstance(vacancy, Vacancy):
+                    raise TypeError("Ожидается объект Vacancy")
+
+                if vacancy.url in self._url_index:
+                    print(f"Вакансия с URL {vacancy.url} уже существует")
+                    results.append(False)
+                    continue
+
+                reason = self._find_duplicate(vacancy)
+                if reason:
+                    print(reason)
+                    results.append(False)
+                    continue
+
+                record = self._vacancy_to_dict(vacancy)
+                self._data.append(record)
+                self._index_record(record)
+                added.append(record)
+                results.append(True)
+        except TypeError:
+            self._rollback_added(added)
+            raise
+
+        if not added:
+            return results
+
+        try:
+            self._commit([{"op": "add", "record": record} for record in added])
+        except Exception as e:
+            print(f"Ошибка при добавлении вакансий: {e}")
+            self._rollback_added(added)
+            return [False] * len(results)
+
+        for record in added:
+            print(f"Добавлена вакансия: {record['title']}")
+        return results
+
+    def upsert_vacancies(self, vacancies: Iterable[Vacancy]) -> List[str]:
+        """Добавляет новые и обновляет изменившиеся по URL вакансии за одну запись.
+
+        Обновленная запись остается на своем месте и сохраняет свой id.
+        """
+        vacancies = list(vacancies)
+        with self._transaction():
+            return self.__upsert_vacancies(vacancies)
+
+    def __upsert_vacancies(self, vacancies: List[Vacancy]) -> List[str]:
+        statuses = []
+        added = []
+        updated = []  # (запись, значения до обновления)
+        operations = []
+        try:
+            for vacancy in vacancies:
+                if not isinstance(vacancy, Vacancy):
+                    raise TypeError("Ожидается объект Vacancy")
+
+                records = self._url_index.get(vacancy.url)
+                if records:
+                    record = records[0]
+                    if not _record_changed(record, vacancy):
+                        statuses.append(UNCHANGED)
+                        continue
+                    updated.append((record, dict(record)))
+                    values = self._vacancy_to_dict(vacancy)
+                    values["id"] = record.get("id", values["id"])
+                    self._replace_record(record, values)
+                    operations.append({"op": "update", "record": record})
+                    statuses.append(UPDATED)
+                    continue
+
+                reason = self._find_duplicate(vacancy)
+                if reason:
+                    print(reason)
+                    statuses.append(SKIPPED)
+                    continue
+
+                record = self._vacancy_to_dict(vacancy)
+                self._data.append(record)
+                self._index_record(record)
+                added.append(record)
+                operations.append({"op": "add", "record": record})
+                statuses.append(ADDED)
+        except TypeError:
+            self._rollback_upsert(added, updated)
+            raise
+
+        if not operations:
+            return statuses
+
+        try:
+            self._commit(operations)
+        except Exception as e:
+            print(f"Ошибка при сохранении вакансий: {e}")
+            self._rollback_upsert(added, updated)
+            return [FAILED] * len(statuses)
+
+        for record in added:
+            print(f"Добавлена вакансия: {record['title']}")
+        for record, _ in updated:
+            print(f"Обновлена вакансия: {record['title']}")
+        return statuses
+
+    def _rollback_upsert(self, added: List[Dict], updated: List[tuple]):
+        """Отменяет несохраненные добавления и обновления."""
+        # Сначала откатываем обновления: среди них могут быть только что добавленные
+        for record, values in reversed(updated):
+            self._replace_record(record, values)
+        self._rollback_added(added)
+
+    def _rollback_added(self, added: List[Dict]):
+        """Отменяет добавление записей, которые еще не были сохранены."""
+        if added:
+            del self._data[-len(added) :]
+        for record in added:
+            self._unindex_record(record)
+
+    def _rollback_deleted(self, previous: List[Dict], removed: List[Dict]):
+        """Возвращает записи, удаление которых не удалось сохранить."""
+        self._data = previous
+        for record in removed:
+            self._index_record(record)
+
+    def get_vacancies(
+        self,
+        criteria: Optional[Dict[str, Union[str, int, None]]] = None,
+        lazy: bool = False,
+    ) -> Sequence[Vacancy]:
+        """Возвращает вакансии, отфильтрованные по критериям.
+
+        При lazy=True вместо объектов Vacancy возвращается LazyVacancyList
+        с представлениями только для чтения поверх хранимых записей.
+        """
+        self.refresh()
+        with self._query_timer("get_vacancies"):
+            plan = compile_query(criteria)
+            records = self.data if plan.is_empty else self._select(plan)
+            if lazy:
+                # Копируем только ссылки, чтобы изменения не сдвигали выборку
+                return LazyVacancyList(list(records))
+            return [self._dict_to_vacancy(item) for item in records]
+
+    def get_values(
+        self, field: str, criteria: Optional[Dict[str, Union[str, int, None]]] = None
+    ) -> List:
+        """Возвращает значения одного поля, не создавая объектов Vacancy."""
+        _check_vacancy_field(field)
+        self.refresh()
+        with self._query_timer("get_values"):
+            plan = compile_query(criteria)
+            records = self.data if plan.is_empty else self._select(plan)
+            return [_project(record, field) for record in records]
+
+    def _select(self, plan: QueryPlan) -> List[Dict]:
+        """Отбирает записи по плану запроса, по возможности через индекс."""
+        path = plan.access_path
+        candidates = None
+        if path[0] == "url":
+            candidates = self._url_index.get(path[1], [])
+        elif path[0] == "range":
+            candidates = self._range_candidates(*path[1:])
+        elif path[0] == "prefix":
+            candidates = self._prefix_candidates(*path[1:])
+        if candidates is None:
+            candidates = self._data
+        return [record for record in candidates if plan.matches(record)]
+
+    def _sorted_index(self, field: str, casefold: bool = False) -> Optional[tuple]:
+        """Строит отсортированный индекс по полю; сбрасывается при изменениях."""
+        key = (field, casefold)
+        if key not in self._sorted_indexes:
+            entries = []
+            for position, record in enumerate(self._data):
+                value = record.get(field)
+                if value is None:
+                    continue
+                entries.append((str(value).lower() if casefold else value, position))
+            try:
+                entries.sort()
+            except TypeError:
+                # Значения разных типов — индекс построить нельзя
+                self._sorted_indexes[key] = None
+                return None
+            self._sorted_indexes[key] = ([value for value, _ in entries], entries)
+        return self._sorted_indexes[key]
+
+    def _range_candidates(
+        self, field, low, high, low_inclusive, high_inclusive
+    ) -> Optional[List[Dict]]:
+        """Находит записи с полем в диапазоне двоичным поиском."""
+        index = self._sorted_index(field)
+        if index is None:
+            return None
+        keys, entries = index
+        try:
+            start = 0
+            if low is not None:
+                find = bisect.bisect_left if low_inclusive else bisect.bisect_right
+                start = find(keys, low)
+            end = len(keys)
+            if high is not None:
+                find = bisect.bisect_right if high_inclusive else bisect.bisect_left
+                end = find(keys, high)
+        except TypeError:
+            return None
+        return [
+            self._data[position]
+            for position in sorted(p for _, p in entries[start:end])
+        ]
+
+    def _prefix_candidates(
+        self, field: str, prefix: str, casefold: bool
+    ) -> Optional[List[Dict]]:
+        """Находит записи, у которых поле начинается с префикса."""
+        index = self._sorted_index(field, casefold)
+        if index is None or not isinstance(prefix, str):
+            return None
+        keys, entries = index
+        prefix = prefix.lower() if casefold else prefix
+        positions = []
+        for i in range(bisect.bisect_left(keys, prefix), len(keys)):
+            if not keys[i].startswith(prefix):
+                break
+            positions.append(entries[i][1])
+        return [self._data[position] for position in sorted(positions)]
+
+    def top_by_salary(self, n: int, field: str = "salary_from") -> List[Vacancy]:
+        """Частичным отбором находит n записей с наибольшей зарплатой."""
+        _check_salary_field(field)
+        self.refresh()
+        with self._query_timer("top_by_salary"):
+            winners = heapq.nlargest(
+                n,
+                self.data,
+                key=lambda r: _salary_value(
+                    r.get("salary_from"), r.get("salary_to"), field
+                ),
+            )
+            return [self._dict_to_vacancy(record) for record in winners]
+
+    def delete_vacancy(self, vacancy: Vacancy) -> bool:
+        """Удаляет вакансию по совпадению URL."""
+        return self.delete_vacancies([vacancy])[0]
+
+    def delete_vacancies(self, vacancies: Iterable[Vacancy]) -> List[bool]:
+        """Удаляет вакансии по совпадению URL и сохраняет файл один раз."""
+        vacancies = list(vacancies)
+        with self._transaction():
+            return self.__delete_vacancies(vacancies)
+
+    def __delete_vacancies(self, vacancies: List[Vacancy]) -> List[bool]:
+        results = []
+        removed = []
+        for vacancy in vacancies:
+            records = self._url_index.get(vacancy.url)
+            if not records:
+                print(f"Вакансия с URL {vacancy.url} не найдена")
+                results.append(False)
+                continue
+
+            for record in list(records):
+                self._unindex_record(record)
+                removed.append(record)
+            results.append(True)
+
+        if not removed:
+            return results
+
+        # Прежний список остается нетронутым на случай отката
+        previous = self._data
+        removed_ids = {id(record) for record in removed}
+        self._data = [v for v in self._data if id(v) not in removed_ids]
+
+        try:
+            self._commit([{"op": "delete", "url": record["url"]} for record in removed])
+        except Exception as e:
+            print(f"Ошибка при удалении вакансий: {e}")
+            self._rollback_deleted(previous, removed)
+            return [False] * len(results)
+
+        for record in removed:
+            print(f"Удалена вакансия: {record['title']}")
+        return results
+
+    def __str__(self):
+        return f"JSONSaver(file='{self.filename}', vacancies={len(self.data)})"
+
+
+class SQLiteSaver(DataSaver):
+    """Класс для хранения вакансий в SQLite с индексами и полнотекстовым поиском."""
+
+    # Соответствие ключей критериев колонкам таблицы
+    COLUMNS = {
+        "id": "uid",
+        "title": "title",
+        "url": "url",
+        "salary_from": "salary_from",
+        "salary_to": "salary_to",
+        "description": "description",
+    }
+
+    def __init__(self, filename: str = "vacancies.db"):
+        self.filename = filename
+        self.connection = sqlite3.connect(filename)
+        self.connection.row_factory = sqlite3.Row
+        # Встроенная lower() в SQLite не понимает кириллицу
+        self.connection.create_function(
+            "py_lower", 1, lambda v: v.lower() if isinstance(v, str) else v
+        )
+        self.fts_enabled = self.__create_schema()
+
+    def __create_schema(self) -> bool:
+        """Создает таблицу и индексы; возвращает, доступен ли FTS5."""
+        with self.connection:
+            if self.filename != ":memory:":
+                self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.executescript("""
+                CREATE TABLE IF NOT EXISTS vacancies (
+                    id INTEGER PRIMARY KEY,
+                    uid TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    title_norm TEXT NOT NULL,
+                    url TEXT NOT NULL UNIQUE,
+                    salary_from INTEGER,
+                    salary_to INTEGER,
+                    description TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_vacancies_title_norm
+                    ON vacancies(title_norm);
+                CREATE INDEX IF NOT EXISTS idx_vacancies_salary_from
+                    ON vacancies(salary_from);
+                CREATE INDEX IF NOT EXISTS idx_vacancies_salary_to
+                    ON vacancies(salary_to);
+                """)
+        try:
+            with self.connection:
+                self.connection.executescript("""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS vacancies_fts USING fts5(
+                        title, description,
+                        content='vacancies', content_rowid='id',
+                        tokenize='unicode61 remove_diacritics 2'
+                    );
+                    CREATE TRIGGER IF NOT EXISTS vacancies_ai AFTER INSERT ON vacancies
+                    BEGIN
+                        INSERT INTO vacancies_fts(rowid, title, description)
+                        VALUES (new.id, new.title, new.description);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS vacancies_ad AFTER DELETE ON vacancies
+                    BEGIN
+                        INSERT INTO vacancies_fts(
+                            vacancies_fts, rowid, title, description
+                        ) VALUES ('delete', old.id, old.title, old.description);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS vacancies_au AFTER UPDATE ON vacancies
+                    BEGIN
+                        INSERT INTO vacancies_fts(
+                            vacancies_fts, rowid, title, description
+                        ) VALUES ('delete', old.id, old.title, old.description);
+                        INSERT INTO vacancies_fts(rowid, title, description)
+                        VALUES (new.id, new.title, new.description);
+                    END;
+                    """)
+            return True
+        except sqlite3.OperationalError as e:
+            print(f"Полнотекстовый поиск SQLite недоступен: {e}")
             return False
 
-        if vacancy.title.lower() in existing_titles:
+    def _row_to_vacancy(self, row: sqlite3.Row) -> Vacancy:
+        """Создает объект Vacancy из строки таблицы."""
+        return Vacancy(
+            title=row["title"],
+            url=row["url"],
+            salary_from=row["salary_from"],
+            salary_to=row["salary_to"],
+            description=row["description"],
+        )
+
+    def add_vacancy(self, vacancy: Vacancy) -> bool:
+        """Добавляет вакансию, если она не существует."""
+        return self.add_vacancies([vacancy])[0]
+
+    def add_vacancies(self, vacancies: Iterable[Vacancy]) -> List[bool]:
+        """Добавляет вакансии одной транзакцией."""
+        vacancies = list(vacancies)
+        results = []
+        try:
+            with self.connection:
+                for vacancy in vacancies:
+                    if not isinstance(vacancy, Vacancy):
+                        raise TypeError("Ожидается объект Vacancy")
+                    results.append(self.__insert(vacancy))
+        except sqlite3.Error as e:
+            print(f"Ошибка при добавлении вакансий: {e}")
+            # Транзакция откатана целиком: результат ложен для всего пакета
+            return [False] * len(vacancies)
+        return results
+
+    def __insert(self, vacancy: Vacancy) -> bool:
+        title_norm = JSONSaver._normalize_title(vacancy.title)
+        if self.connection.execute(
+            "SELECT 1 FROM vacancies WHERE url = ?", (vacancy.url,)
+        ).fetchone():
+            print(f"Вакансия с URL {vacancy.url} уже существует")
+            return False
+        if self.connection.execute(
+            "SELECT 1 FROM vacancies WHERE title_norm = ?", (title_norm,)
+        ).fetchone():
             print(f"Вакансия с названием '{vacancy.title}' уже существует")
             return False
 
-        self.data.append(self._vacancy_to_dict(vacancy))
+        self.connection.execute(
+            "INSERT INTO vacancies "
+            "(uid, title, title_norm, url, salary_from, salary_to, description) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                uuid.uuid4().hex,
+                vacancy.title,
+                title_norm,
+                vacancy.url,
+                vacancy.salary_from,
+                vacancy.salary_to,
+                vacancy.description,
+            ),
+        )
+        print(f"Добавлена вакансия: {vacancy.title}")
+        return True
+
+    def upsert_vacancies(self, vacancies: Iterable[Vacancy]) -> List[str]:
+        """Добавляет новые и обновляет изменившиеся по URL вакансии одной транзакцией."""
+        vacancies = list(vacancies)
+        statuses = []
         try:
-            self._save_data()
-            print(f"Добавлена вакансия: {vacancy.title}")
+            with self.connection:
+                for vacancy in vacancies:
+                    if not isinstance(vacancy, Vacancy):
+                        raise TypeError("Ожидается объект Vacancy")
+                    row = self.connection.execute(
+                        "SELECT title, salary_from, salary_to, description "
+                        "FROM vacancies WHERE url = ?",
+                        (vacancy.url,),
+                    ).fetchone()
+                    if row is None:
+                        statuses.append(ADDED if self.__insert(vacancy) else SKIPPED)
+                    elif not _record_changed(dict(row), vacancy):
+                        statuses.append(UNCHANGED)
+                    else:
+                        self.__update(vacancy)
+                        statuses.append(UPDATED)
+        except sqlite3.Error as e:
+            print(f"Ошибка при сохранении вакансий: {e}")
+            return [FAILED] * len(vacancies)
+        return statuses
+
+    def __update(self, vacancy: Vacancy):
+        self.connection.execute(
+            "UPDATE vacancies SET title = ?, title_norm = ?, salary_from = ?, "
+            "salary_to = ?, description = ? WHERE url = ?",
+            (
+                vacancy.title,
+                JSONSaver._normalize_title(vacancy.title),
+                vacancy.salary_from,
+                vacancy.salary_to,
+                vacancy.description,
+                vacancy.url,
+            ),
+        )
+        print(f"Обновлена вакансия: {vacancy.title}")
+
+    def import_records(self, records: Iterable[Dict]) -> int:
+        """Загружает записи в формате JSONSaver без проверки названий."""
+        rows = (
+            (
+                str(record.get("id") or uuid.uuid4().hex),
+                str(record["title"]),
+                JSONSaver._normalize_title(record["title"]),
+                str(record["url"]),
+                record.get("salary_from"),
+                record.get("salary_to"),
+                record.get("description"),
+            )
+            for record in records
+            if isinstance(record, dict) and "title" in record and "url" in record
+        )
+        before = self.count()
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO vacancies "
+                "(uid, title, title_norm, url, salary_from, salary_to, description) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return self.count() - before
+
+    def get_vacancies(
+        self,
+        criteria: Optional[Dict[str, Union[str, int, None]]] = None,
+        lazy: bool = False,
+    ) -> Sequence[Vacancy]:
+        """Возвращает вакансии, отфильтрованные по критериям на стороне SQLite."""
+        where, params = compile_query(criteria).to_sql(self.COLUMNS, "py_lower")
+        sql = (
+            "SELECT title, url, salary_from, salary_to, description FROM vacancies "
+            f"WHERE {where} ORDER BY id"
+        )
+        rows = self.connection.execute(sql, params)
+        if lazy:
+            return LazyVacancyList([dict(row) for row in rows])
+        return [self._row_to_vacancy(row) for row in rows]
+
+    def get_values(
+        self, field: str, criteria: Optional[Dict[str, Union[str, int, None]]] = None
+    ) -> List:
+        """Читает из базы только одну колонку."""
+        _check_vacancy_field(field)
+        where, params = compile_query(criteria).to_sql(self.COLUMNS, "py_lower")
+        rows = self.connection.execute(
+            f"SELECT {self.COLUMNS[field]} AS {field} FROM vacancies "
+            f"WHERE {where} ORDER BY id",
+            params,
+        )
+        return [_project(row, field) for row in map(dict, rows)]
+
+    # Выражения сортировки; NULL в SQLite при DESC оказывается в конце
+    SALARY_ORDER = {
+        "salary_from": "salary_from",
+        "salary_to": "salary_to",
+        "midpoint": (
+            "CASE WHEN COALESCE(salary_from, 0) > 0 AND COALESCE(salary_to, 0) > 0 "
+            "THEN (salary_from + salary_to) / 2.0 "
+            "ELSE MAX(COALESCE(salary_from, 0), COALESCE(salary_to, 0)) END"
+        ),
+    }
+
+    def top_by_salary(self, n: int, field: str = "salary_from") -> List[Vacancy]:
+        """Возвращает n вакансий с наибольшей зарплатой, сортируя по индексу."""
+        _check_salary_field(field)
+        if n <= 0:
+            return []
+        rows = self.connection.execute(
+            "SELECT title, url, salary_from, salary_to, description FROM vacancies "
+            f"ORDER BY {self.SALARY_ORDER[field]} DESC, id ASC LIMIT ?",
+            (n,),
+        )
+        return [self._row_to_vacancy(row) for row in rows]
+
+    def search_vacancies(self, keyword: str) -> List[Vacancy]:
+        """Ищет вакансии по словам в названии и описании через FTS5."""
+        words = keyword.split()
+        if not words:
+            return []
+
+        if not self.fts_enabled:
+            pattern = f"%{keyword.strip()}%"
+            rows = self.connection.execute(
+                "SELECT title, url, salary_from, salary_to, description "
+                "FROM vacancies WHERE description LIKE ? OR title LIKE ? ORDER BY id",
+                (pattern, pattern),
+            )
+            return [self._row_to_vacancy(row) for row in rows]
+
+        # Каждое слово берем в кавычки, чтобы ввод пользователя не стал синтаксисом FTS
+        query = " ".join('"' + word.replace('"', '""') + '"' for word in words)
+        rows = self.connection.execute(
+            "SELECT v.title, v.url, v.salary_from, v.salary_to, v.description "
+            "FROM vacancies_fts JOIN vacancies v ON v.id = vacancies_fts.rowid "
+            "WHERE vacancies_fts MATCH ? ORDER BY rank",
+            (query,),
+        )
+        return [self._row_to_vacancy(row) for row in rows]
+
+    def delete_vacancy(self, vacancy: Vacancy) -> bool:
+        """Удаляет вакансию по совпадению URL."""
+        return self.delete_vacancies([vacancy])[0]
+
+    def delete_vacancies(self, vacancies: Iterable[Vacancy]) -> List[bool]:
+        """Удаляет вакансии по URL одной транзакцией."""
+        vacancies = list(vacancies)
+        results = []
+        try:
+            with self.connection:
+                for vacancy in vacancies:
+                    cursor = self.connection.execute(
+                        "DELETE FROM vacancies WHERE url = ?", (vacancy.url,)
+                    )
+                    if cursor.rowcount:
+                        print(f"Удалена вакансия: {vacancy.url}")
+                        results.append(True)
+                    else:
+                        print(f"Вакансия с URL {vacancy.url} не найдена")
+                        results.append(False)
+        except sqlite3.Error as e:
+            print(f"Ошибка при удалении вакансий: {e}")
+            return [False] * len(vacancies)
+        return results
+
+    def count(self) -> int:
+        """Возвращает количество вакансий в базе."""
+        return self.connection.execute("SELECT COUNT(*) FROM vacancies").fetchone()[0]
+
+    def close(self):
+        """Закрывает соединение с базой."""
+        self.connection.close()
+
+    def __str__(self):
+        return f"SQLiteSaver(file='{self.filename}', vacancies={self.count()})"
+
+
+class JSONLSaver(DataSaver):
+    """Класс для хранения вакансий в файле JSON Lines с ленивым чтением через mmap."""
+
+    def __init__(self, filename: str = "vacancies.jsonl"):
+        self.filename = filename
+        if not os.path.exists(filename):
+            open(filename, "ab").close()
+        self._offsets = self.__scan_offsets()
+        self._url_index: Optional[Dict[str, int]] = None
+        self._title_index: Optional[Dict[str, int]] = None
+
+    def __scan_offsets(self) -> array:
+        """Находит начала непустых строк, не разбирая JSON."""
+        offsets = array("q")
+        with open(self.filename, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return offsets
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                start = 0
+                size = len(mm)
+                while start < size:
+                    end = mm.find(b"\n", start)
+                    if end == -1:
+                        end = size
+                    if mm[start:end].strip():
+                        offsets.append(start)
+                    start = end + 1
+        return offsets
+
+    def _iter_records(self) -> Iterator[tuple]:
+        """Отдает пары (смещение, запись), читая файл через mmap."""
+        if not self._offsets:
+            return
+        with open(self.filename, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for offset in self._offsets:
+                    end = mm.find(b"\n", offset)
+                    line = mm[offset : end if end != -1 else len(mm)]
+                    if not line.strip():
+                        continue
+                    try:
+                        yield offset, json.loads(line)
+                    except json.JSONDecodeError as e:
+                        print(f"Ошибка чтения строки файла {self.filename}: {e}")
+
+    def _ensure_indexes(self):
+        """Строит индексы по URL и названию при первом изменении данных."""
+        if self._url_index is not None:
+            return
+        self._url_index = {}
+        self._title_index = {}
+        for offset, record in self._iter_records():
+            self._url_index.setdefault(record.get("url"), offset)
+            title = JSONSaver._normalize_title(record.get("title", ""))
+            self._title_index[title] = self._title_index.get(title, 0) + 1
+
+    def iter_vacancies(
+        self, criteria: Optional[Dict[str, Union[str, int, None]]] = None
+    ) -> Iterator[Vacancy]:
+        """Лениво отдает вакансии из файла, отфильтрованные по критериям."""
+        plan = compile_query(criteria)
+        for _, record in self._iter_records():
+            if plan.matches(record):
+                yield self._dict_to_vacancy(record)
+
+    def get_vacancies(
+        self,
+        criteria: Optional[Dict[str, Union[str, int, None]]] = None,
+        lazy: bool = False,
+    ) -> Sequence[Vacancy]:
+        """Возвращает вакансии, отфильтрованные по критериям."""
+        if lazy:
+            return LazyVacancyList(self._select_records(criteria))
+        return list(self.iter_vacancies(criteria))
+
+    def get_values(
+        self, field: str, criteria: Optional[Dict[str, Union[str, int, None]]] = None
+    ) -> List:
+        """Возвращает значения одного поля, не создавая объектов Vacancy."""
+        _check_vacancy_field(field)
+        return [_project(record, field) for record in self._select_records(criteria)]
+
+    def _select_records(
+        self, criteria: Optional[Dict[str, Union[str, int, None]]]
+    ) -> List[Dict]:
+        plan = compile_query(criteria)
+        return [record for _, record in self._iter_records() if plan.matches(record)]
+
+    def top_by_salary(self, n: int, field: str = "salary_from") -> List[Vacancy]:
+        """Частичным отбором находит n записей с наибольшей зарплатой."""
+        _check_salary_field(field)
+        winners = heapq.nlargest(
+            n,
+            (record for _, record in self._iter_records()),
+            key=lambda r: _salary_value(
+                r.get("salary_from"), r.get("salary_to"), field
+            ),
+        )
+        return [self._dict_to_vacancy(record) for record in winners]
+
+    def _dict_to_vacancy(self, data: Dict) -> Vacancy:
+        """Создает объект Vacancy из словаря."""
+        return Vacancy(
+            title=data["title"],
+            url=data["url"],
+            salary_from=data.get("salary_from"),
+            salary_to=data.get("salary_to"),
+            description=data.get("description"),
+        )
+
+    def add_vacancy(self, vacancy: Vacancy) -> bool:
+        """Добавляет вакансию, если она не существует."""
+        return self.add_vacancies([vacancy])[0]
+
+    def add_vacancies(self, vacancies: Iterable[Vacancy]) -> List[bool]:
+        """Дописывает новые вакансии в конец файла одной записью."""
+        self._ensure_indexes()
+        results = []
+        records = []
+        pending_urls = set()
+        pending_titles = set()
+        for vacancy in vacancies:
+            if not isinstance(vacancy, Vacancy):
+                raise TypeError("Ожидается объект Vacancy")
+
+            title = JSONSaver._normalize_title(vacancy.title)
+            if vacancy.url in self._url_index or vacancy.url in pending_urls:
+                print(f"Вакансия с URL {vacancy.url} уже существует")
+                results.append(False)
+                continue
+            if title in self._title_index or title in pending_titles:
+                print(f"Вакансия с названием '{vacancy.title}' уже существует")
+                results.append(False)
+                continue
+
+            records.append(self.__vacancy_record(vacancy))
+            pending_urls.add(vacancy.url)
+            pending_titles.add(title)
+            results.append(True)
+
+        if not records:
+            return results
+
+        try:
+            self.__append(records)
+        except IOError as e:
+            print(f"Ошибка при добавлении вакансий: {e}")
+            return [False] * len(results)
+        return results
+
+    def delete_vacancy(self, vacancy: Vacancy) -> bool:
+        """Удаляет вакансию по совпадению URL."""
+        return self.delete_vacancies([vacancy])[0]
+
+    def upsert_vacancies(self, vacancies: Iterable[Vacancy]) -> List[str]:
+        """Добавляет новые и обновляет изменившиеся по URL вакансии одной дозаписью.
+
+        Новая версия записи дописывается в конец файла с прежним id, а старая
+        строка затирается только после успешной дозаписи.
+        """
+        vacancies = list(vacancies)
+        self._ensure_indexes()
+        statuses = []
+        pending: List[Dict] = []  # записи для дозаписи и смещения их старых строк
+        by_url: Dict[str, Dict] = {}
+        pending_titles = set()
+        try:
+            with open(self.filename, "rb") as f:
+                for vacancy in vacancies:
+                    if not isinstance(vacancy, Vacancy):
+                        raise TypeError("Ожидается объект Vacancy")
+
+                    entry = by_url.get(vacancy.url)
+                    if entry is None and vacancy.url in self._url_index:
+                        offset = self._url_index[vacancy.url]
+                        f.seek(offset)
+                        entry = {"record": json.loads(f.readline()), "old": offset}
+                    if entry is not None:
+                        if not _record_changed(entry["record"], vacancy):
+                            statuses.append(UNCHANGED)
+                            continue
+                        record = self.__vacancy_record(vacancy)
+                        record["id"] = entry["record"].get("id", record["id"])
+                        entry["record"] = record
+                        if vacancy.url not in by_url:
+                            by_url[vacancy.url] = entry
+                            pending.append(entry)
+                        statuses.append(UPDATED)
+                        continue
+
+                    title = JSONSaver._normalize_title(vacancy.title)
+                    if title in self._title_index or title in pending_titles:
+                        print(f"Вакансия с названием '{vacancy.title}' уже существует")
+                        statuses.append(SKIPPED)
+                        continue
+                    entry = {"record": self.__vacancy_record(vacancy), "old": None}
+                    by_url[vacancy.url] = entry
+                    pending.append(entry)
+                    pending_titles.add(title)
+                    statuses.append(ADDED)
+        except (IOError, json.JSONDecodeError) as e:
+            print(f"Ошибка при сохранении вакансий: {e}")
+            return [FAILED] * len(vacancies)
+
+        if not pending:
+            return statuses
+        try:
+            self.__append([entry["record"] for entry in pending])
+        except IOError as e:
+            print(f"Ошибка при сохранении вакансий: {e}")
+            return [FAILED] * len(vacancies)
+
+        old_offsets = {entry["old"] for entry in pending if entry["old"] is not None}
+        try:
+            with open(self.filename, "r+b") as f:
+                for offset in old_offsets:
+                    self.__erase(f, offset)
+        except (IOError, json.JSONDecodeError) as e:
+            # Новые версии уже дописаны, поэтому данные не потеряны
+            print(f"Ошибка при затирании старых версий вакансий: {e}")
+        self.__drop_offsets(old_offsets)
+        for entry in pending:
+            verb = "Добавлена" if entry["old"] is None else "Обновлена"
+            print(f"{verb} вакансия: {entry['record']['title']}")
+        return statuses
+
+    @staticmethod
+    def __vacancy_record(vacancy: Vacancy) -> Dict:
+        return {
+            "id": uuid.uuid4().hex,
+            "title": vacancy.title,
+            "url": vacancy.url,
+            "salary_from": vacancy.salary_from,
+            "salary_to": vacancy.salary_to,
+            "description": vacancy.description,
+        }
+
+    def __append(self, records: List[Dict]):
+        """Дописывает записи в конец файла и добавляет их в индексы."""
+        lines = [json.dumps(r, ensure_ascii=False).encode("utf-8") for r in records]
+        with open(self.filename, "ab") as f:
+            offset = f.tell()
+            f.write(b"".join(line + b"\n" for line in lines))
+        for line, record in zip(lines, records):
+            title = JSONSaver._normalize_title(record["title"])
+            self._offsets.append(offset)
+            self._url_index[record["url"]] = offset
+            self._title_index[title] = self._title_index.get(title, 0) + 1
+            offset += len(line) + 1
+
+    def __erase(self, f, offset: int) -> Dict:
+        """Затирает строку записи пробелами и убирает ее название из индекса."""
+        f.seek(offset)
+        line = f.readline()
+        record = json.loads(line)
+        title = JSONSaver._normalize_title(record.get("title", ""))
+        count = self._title_index.get(title, 0) - 1
+        if count > 0:
+            self._title_index[title] = count
+        else:
+            self._title_index.pop(title, None)
+        f.seek(offset)
+        f.write(b" " * len(line.rstrip(b"\n")))
+        return record
+
+    def __drop_offsets(self, removed: set):
+        """Убирает смещения затертых строк одним проходом по списку."""
+        if removed:
+            self._offsets = array(
+                "q", (offset for offset in self._offsets if offset not in removed)
+            )
+
+    def delete_vacancies(self, vacancies: Iterable[Vacancy]) -> List[bool]:
+        """Затирает строки удаляемых вакансий пробелами, не переписывая файл."""
+        vacancies = list(vacancies)
+        self._ensure_indexes()
+        results = []
+        removed = set()
+        found = set()
+        try:
+            with open(self.filename, "r+b") as f:
+                for vacancy in vacancies:
+                    offset = self._url_index.pop(vacancy.url, None)
+                    if offset is None:
+                        print(f"Вакансия с URL {vacancy.url} не найдена")
+                        results.append(False)
+                        continue
+
+                    found.add(vacancy.url)
+                    record = self.__erase(f, offset)
+                    removed.add(offset)
+                    print(f"Удалена вакансия: {record.get('title')}")
+                    results.append(True)
+        except (IOError, json.JSONDecodeError) as e:
+            print(f"Ошибка при удалении вакансий: {e}")
+            # Часть строк могла успеть затереться: индексы строим заново по файлу
+            self.__rescan()
+            self._ensure_indexes()
+            return [
+                vacancy.url in found and vacancy.url not in self._url_index
+                for vacancy in vacancies
+            ]
+        self.__drop_offsets(removed)
+        return results
+
+    def compact(self):
+        """Переписывает файл без затертых строк."""
+        tmp_filename = f"{self.filename}.{os.getpid()}.tmp"
+        with open(tmp_filename, "wb") as dst:
+            for _, record in self._iter_records():
+                dst.write(json.dumps(record, ensure_ascii=False).encode("utf-8"))
+                dst.write(b"\n")
+        os.replace(tmp_filename, self.filename)
+        self.__rescan()
+
+    def __rescan(self):
+        """Заново находит строки в файле и сбрасывает индексы."""
+        self._offsets = self.__scan_offsets()
+        self._url_index = None
+        self._title_index = None
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __str__(self):
+        return f"JSONLSaver(file='{self.filename}', vacancies={len(self)})"
+
+
+def shard_of(url: str, shards: int) -> int:
+    """Возвращает номер шарда для URL; одинаков во всех процессах и запусках."""
+    return zlib.crc32(str(url).encode("utf-8")) % shards
+
+
+def _load_shard(filename: str) -> List[Dict]:
+    """Читает один файл шарда; выполняется в процессе пула."""
+    try:
+        with open(filename, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return []
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        print(f"Ошибка загрузки файла {filename}: {e}")
+        return []
+    return data if isinstance(data, list) else []
+
+
+def _scan_shard(filename: str, criteria: Optional[Dict]) -> List[Dict]:
+    """Читает шард и возвращает только подходящие записи."""
+    plan = compile_query(criteria)
+    return [record for record in _load_shard(filename) if plan.matches(record)]
+
+
+class ShardedSaver(DataSaver):
+    """Хранит вакансии в каталоге из нескольких JSON-файлов, разбитых по хешу URL.
+
+    Шарды читаются параллельно пулом процессов, а изменение переписывает только
+    затронутые шарды. Число шардов записывается в manifest.json и при повторном
+    открытии берется оттуда. Вакансии отдаются по шардам, а не в порядке
+    добавления.
+
+    Без явного workers пул запускается, только если шарды вместе занимают
+    не меньше PARALLEL_MIN_BYTES и процессоров больше одного: на меньших
+    объемах запуск процессов и передача записей дороже самого чтения.
+    Пул создается один раз и останавливается в close().
+    """
+
+    DEFAULT_SHARDS = 16
+    PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+
+    def __init__(
+        self,
+        directory: str = "vacancies.shards",
+        shards: Optional[int] = None,
+        workers: Optional[int] = None,
+    ):
+        self.directory = directory
+        self.workers = workers
+        self.manifest_filename = os.path.join(directory, "manifest.json")
+        self.shards = self.__read_manifest() or shards or self.DEFAULT_SHARDS
+        if shards and shards != self.shards:
+            print(
+                f"Хранилище {directory} уже разбито на {self.shards} шардов, "
+                f"параметр shards={shards} не применяется"
+            )
+        self._shards: Optional[List[List[Dict]]] = None
+        self._url_index: Dict[str, Dict] = {}
+        self._title_index: Dict[str, int] = {}
+        self._executor = None
+
+    def __read_manifest(self) -> Optional[int]:
+        try:
+            with open(self.manifest_filename, "r", encoding="utf-8") as f:
+                return int(json.load(f)["shards"])
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            print(f"Ошибка загрузки файла {self.manifest_filename}: {e}")
+            return None
+
+    def __write_manifest(self):
+        if os.path.exists(self.manifest_filename):
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        self.__write_json(self.manifest_filename, {"shards": self.shards})
+
+    @staticmethod
+    def __write_json(filename: str, data):
+        """Атомарно записывает файл: временный файл и переименование."""
+        tmp_filename = f"{filename}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_filename, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_filename, filename)
+        except (IOError, TypeError) as e:
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
+            raise RuntimeError(f"Не удалось сохранить данные в файл: {e}")
+
+    def shard_filename(self, shard: int) -> str:
+        return os.path.join(self.directory, f"shard-{shard:03d}.json")
+
+    def _map_shards(self, function, *args) -> Iterator[List[Dict]]:
+        """Применяет функцию ко всем шардам, параллельно в пуле процессов."""
+        filenames = [self.shard_filename(shard) for shard in range(self.shards)]
+        extra = [[arg] * self.shards for arg in args]
+        if not self._parallel(filenames):
+            yield from map(function, filenames, *extra)
+            return
+        if self._executor is None:
+            # multiprocessing импортируется долго, а нужен только этому хранилищу
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        yield from self._executor.map(function, filenames, *extra)
+
+    def _parallel(self, filenames: List[str]) -> bool:
+        """Решает, читать ли шарды в пуле процессов."""
+        if self.workers == 1 or self.shards == 1:
+            return False
+        if self.workers is not None:
             return True
-        except Exception as e:
-            print(f"Ошибка при добавлении вакансии: {e}")
-            self.data.pop()
+        if (os.cpu_count() or 1) < 2:
             return False
+        size = 0
+        for filename in filenames:
+            with contextlib.suppress(OSError):
+                size += os.path.getsize(filename)
+        return size >= self.PARALLEL_MIN_BYTES
 
-    def get_vacancies(
+    def close(self):
+        """Останавливает пул процессов, если он был запущен."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def load(self):
+        """Загружает все шарды в память и строит индексы."""
+        self._shards = list(self._map_shards(_load_shard))
+        self._url_index = {}
+        self._title_index = {}
+        for records in self._shards:
+            for record in records:
+                self._index_record(record)
+
+    def _ensure_loaded(self) -> List[List[Dict]]:
+        if self._shards is None:
+            self.load()
+        return self._shards
+
+    def _index_record(self, record: Dict):
+        self._url_index.setdefault(record.get("url"), record)
+        title = JSONSaver._normalize_title(record.get("title", ""))
+        self._title_index[title] = self._title_index.get(title, 0) + 1
+
+    def _unindex_record(self, record: Dict):
+        if self._url_index.get(record.get("url")) is record:
+            del self._url_index[record.get("url")]
+        title = JSONSaver._normalize_title(record.get("title", ""))
+        count = self._title_index.get(title, 0) - 1
+        if count > 0:
+            self._title_index[title] = count
+        else:
+            self._title_index.pop(title, None)
+
+    def _iter_records(self) -> Iterator[Dict]:
+        for records in self._ensure_loaded():
+            yield from records
+
+    def _select_records(self, criteria: Optional[Dict]) -> List[Dict]:
+        plan = compile_query(criteria)
+        self._ensure_loaded()
+        if plan.access_path[0] == "url":
+            record = self._url_index.get(plan.access_path[1])
+            return [record] if record is not None and plan.matches(record) else []
+        return [record for record in self._iter_records() if plan.matches(record)]
+
+    def _flush(self, shards: Iterable[int]):
+        """Переписывает только измененные шарды."""
+        self.__write_manifest()
+        for shard in sorted(set(shards)):
+            self.__write_json(self.shard_filename(shard), self._shards[shard])
+
+    def iter_vacancies(
         self, criteria: Optional[Dict[str, Union[str, int, None]]] = None
-    ) -> List[Vacancy]:
+    ) -> Iterator[Vacancy]:
+        """Отдает вакансии по критериям.
+
+        Пока шарды не загружены в память, они фильтруются прямо с диска
+        в пуле процессов, и в основной процесс попадают только подходящие записи.
+        """
+        if self._shards is not None:
+            records = self._select_records(criteria)
+            yield from (self._dict_to_vacancy(record) for record in records)
+            return
+        for records in self._map_shards(_scan_shard, criteria):
+            for record in records:
+                yield self._dict_to_vacancy(record)
+
+    def get_vacancies(
+        self,
+        criteria: Optional[Dict[str, Union[str, int, None]]] = None,
+        lazy: bool = False,
+    ) -> Sequence[Vacancy]:
         """Возвращает вакансии, отфильтрованные по критериям."""
-        if not criteria:
-            return [self._dict_to_vacancy(v) for v in self.data]
+        records = self._select_records(criteria)
+        if lazy:
+            return LazyVacancyList(records)
+        return [self._dict_to_vacancy(record) for record in records]
+
+    def get_values(
+        self, field: str, criteria: Optional[Dict[str, Union[str, int, None]]] = None
+    ) -> List:
+        """Возвращает значения одного поля, не создавая объектов Vacancy."""
+        _check_vacancy_field(field)
+        return [_project(record, field) for record in self._select_records(criteria)]
+
+    def top_by_salary(self, n: int, field: str = "salary_from") -> List[Vacancy]:
+        """Частичным отбором находит n записей с наибольшей зарплатой."""
+        _check_salary_field(field)
+        winners = heapq.nlargest(
+            n,
+            self._iter_records(),
+            key=lambda r: _salary_value(
+                r.get("salary_from"), r.get("salary_to"), field
+            ),
+        )
+        return [self._dict_to_vacancy(record) for record in winners]
 
+    def _dict_to_vacancy(self, data: Dict) -> Vacancy:
+        """Создает объект Vacancy из словаря."""
+        return Vacancy(
+            title=data["title"],
+            url=data["url"],
+            salary_from=data.get("salary_from"),
+            salary_to=data.get("salary_to"),
+            description=data.get("description"),
+        )
+
+    @staticmethod
+    def _vacancy_to_dict(vacancy: Vacancy) -> Dict:
+        return {
+            "id": uuid.uuid4().hex,
+            "title": vacancy.title,
+            "url": vacancy.url,
+            "salary_from": vacancy.salary_from,
+            "salary_to": vacancy.salary_to,
+            "description": vacancy.description,
+        }
+
+    def add_vacancy(self, vacancy: Vacancy) -> bool:
+        """Добавляет вакансию, если она не существует."""
+        return self.add_vacancies([vacancy])[0]
+
+    def add_vacancies(self, vacancies: Iterable[Vacancy]) -> List[bool]:
+        """Добавляет новые вакансии и переписывает только их шарды."""
+        self._ensure_loaded()
+        vacancies = list(vacancies)
         results = []
-        for item in self.data:
-            match = True
-            for key, value in criteria.items():
-                if value is None:
-                    continue
+        added = []
+        for vacancy in vacancies:
+            if not isinstance(vacancy, Vacancy):
+                self.__discard(added)
+                raise TypeError("Ожидается объект Vacancy")
+            if vacancy.url in self._url_index:
+                print(f"Вакансия с URL {vacancy.url} уже существует")
+                results.append(False)
+                continue
+            if JSONSaver._normalize_title(vacancy.title) in self._title_index:
+                print(f"Вакансия с названием '{vacancy.title}' уже существует")
+                results.append(False)
+                continue
 
-                if key not in item or item[key] != value:
-                    match = False
-                    break
+            record = self._vacancy_to_dict(vacancy)
+            shard = shard_of(vacancy.url, self.shards)
+            self._shards[shard].append(record)
+            self._index_record(record)
+            added.append((shard, record))
+            results.append(True)
 
-            if match:
-                results.append(self._dict_to_vacancy(item))
+        if not added:
+            return results
+        try:
+            self._flush(shard for shard, _ in added)
+        except RuntimeError as e:
+            print(f"Ошибка при добавлении вакансий: {e}")
+            # Часть шардов могла успеть записаться: берем их состояние с диска
+            self.__reload_shards(shard for shard, _ in added)
+            return [
+                result and vacancy.url in self._url_index
+                for vacancy, result in zip(vacancies, results)
+            ]
 
+        for _, record in added:
+            print(f"Добавлена вакансия: {record['title']}")
         return results
 
+    def __discard(self, added: List[tuple]):
+        """Отменяет несохраненные добавления."""
+        for shard, record in reversed(added):
+            self._shards[shard].remove(record)
+            self._unindex_record(record)
+
+    def __reload_shards(self, shards: Iterable[int]):
+        """Перечитывает шарды с диска, отбрасывая их несохраненные изменения."""
+        for shard in set(shards):
+            for record in self._shards[shard]:
+                self._unindex_record(record)
+            self._shards[shard] = _load_shard(self.shard_filename(shard))
+            for record in self._shards[shard]:
+                self._index_record(record)
+
+    def upsert_vacancies(self, vacancies: Iterable[Vacancy]) -> List[str]:
+        """Добавляет новые и обновляет изменившиеся по URL вакансии.
+
+        Обновленная запись сохраняет свой id; переписываются только шарды,
+        в которых что-то изменилось.
+        """
+        self._ensure_loaded()
+        statuses = []
+        changed = []
+        for vacancy in vacancies:
+            if not isinstance(vacancy, Vacancy):
+                # Уже сделанные в памяти изменения отбрасываем, как в add_vacancies
+                self.__reload_shards(changed)
+                raise TypeError("Ожидается объект Vacancy")
+            record = self._url_index.get(vacancy.url)
+            shard = shard_of(vacancy.url, self.shards)
+            if record is None:
+                if JSONSaver._normalize_title(vacancy.title) in self._title_index:
+                    print(f"Вакансия с названием '{vacancy.title}' уже существует")
+                    statuses.append(SKIPPED)
+                    continue
+                record = self._vacancy_to_dict(vacancy)
+                self._shards[shard].append(record)
+                self._index_record(record)
+                statuses.append(ADDED)
+            elif _record_changed(record, vacancy):
+                values = self._vacancy_to_dict(vacancy)
+                values["id"] = record.get("id", values["id"])
+                self._unindex_record(record)
+                record.clear()
+                record.update(values)
+                self._index_record(record)
+                statuses.append(UPDATED)
+            else:
+                statuses.append(UNCHANGED)
+                continue
+            changed.append(shard)
+
+        if not changed:
+            return statuses
+        try:
+            self._flush(changed)
+        except RuntimeError as e:
+            print(f"Ошибка при сохранении вакансий: {e}")
+            # Несохраненные изменения отбрасываем, перечитывая хранилище
+            self.load()
+            return [FAILED] * len(statuses)
+        return statuses
+
     def delete_vacancy(self, vacancy: Vacancy) -> bool:
         """Удаляет вакансию по совпадению URL."""
-        initial_count = len(self.data)
-        self.data = [v for v in self.data if v["url"] != vacancy.url]
+        return self.delete_vacancies([vacancy])[0]
 
-        if len(self.data) < initial_count:
-            try:
-                self._save_data()
-                print(f"Удалена вакансия: {vacancy.title}")
-                return True
-            except Exception as e:
-                print(f"Ошибка при удалении вакансии: {e}")
-                return False
+    def delete_vacancies(self, vacancies: Iterable[Vacancy]) -> List[bool]:
+        """Удаляет вакансии по URL и переписывает только их шарды."""
+        self._ensure_loaded()
+        results = []
+        removed = []
+        for vacancy in vacancies:
+            record = self._url_index.get(vacancy.url)
+            if record is None:
+                print(f"Вакансия с URL {vacancy.url} не найдена")
+                results.append(False)
+                continue
+            shard = shard_of(vacancy.url, self.shards)
+            self._shards[shard] = [r for r in self._shards[shard] if r is not record]
+            self._unindex_record(record)
+            removed.append((shard, record))
+            results.append(True)
+
+        if not removed:
+            return results
+        try:
+            self._flush(shard for shard, _ in removed)
+        except RuntimeError as e:
+            print(f"Ошибка при удалении вакансий: {e}")
+            self.load()
+            return [False] * len(results)
+
+        for _, record in removed:
+            print(f"Удалена вакансия: {record['title']}")
+        return results
 
-        print(f"Вакансия с URL {vacancy.url} не найдена")
-        return False
+    def import_records(self, records: Iterable[Dict]) -> int:
+        """Загружает записи в формате JSONSaver без проверки названий."""
+        self._ensure_loaded()
+        changed = []
+        for record in records:
+            if not isinstance(record, dict) or "title" not in record:
+                continue
+            url = record.get("url")
+            if url is None or url in self._url_index:
+                continue
+            record = dict(record, id=str(record.get("id") or uuid.uuid4().hex))
+            shard = shard_of(url, self.shards)
+            self._shards[shard].append(record)
+            self._index_record(record)
+            changed.append(shard)
+        self._flush(changed)
+        return len(changed)
+
+    def __len__(self):
+        if self._shards is None:
+            return sum(len(records) for records in self._map_shards(_load_shard))
+        return sum(len(records) for records in self._shards)
 
     def __str__(self):
-        return f"JSONSaver(file='{self.filename}', vacancies={len(self.data)})"
+        return f"ShardedSaver(directory='{self.directory}', shards={self.shards})"
+
+
+def convert_json_to_jsonl(json_filename: str, jsonl_filename: str) -> int:
+    """Переносит вакансии из JSON-файла в формат JSON Lines и возвращает их число."""
+    json_saver = JSONSaver(json_filename)
+    tmp_filename = f"{jsonl_filename}.{os.getpid()}.tmp"
+    with open(tmp_filename, "w", encoding="utf-8") as f:
+        for record in json_saver.data:
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write("\n")
+    os.replace(tmp_filename, jsonl_filename)
+    print(f"Перенесено вакансий: {len(json_saver.data)}")
+    return len(json_saver.data)
+
+
+def convert_json_format(
+    json_filename: str, target_filename: str, storage_format: str
+) -> int:
+    """Пересохраняет JSON-хранилище в другом формате и возвращает число вакансий."""
+    json_saver = JSONSaver(json_filename, binary_cache=False)
+    target = JSONSaver(
+        target_filename, binary_cache=False, storage_format=storage_format
+    )
+    target.data = json_saver.data
+    target._commit([])
+    print(f"Перенесено вакансий: {len(target.data)}")
+    return len(target.data)
+
+
+def migrate_json_to_sqlite(json_filename: str, db_filename: str) -> int:
+    """Переносит вакансии из JSON-файла в базу SQLite и возвращает их число."""
+    json_saver = JSONSaver(json_filename)
+    sqlite_saver = SQLiteSaver(db_filename)
+    try:
+        imported = sqlite_saver.import_records(json_saver.data)
+    finally:
+        sqlite_saver.close()
+    print(f"Перенесено вакансий: {imported}")
+    return imported
+
+
+def migrate_json_to_shards(
+    json_filename: str, directory: str, shards: Optional[int] = None
+) -> int:
+    """Раскладывает вакансии из JSON-файла по шардам и возвращает их число."""
+    json_saver = JSONSaver(json_filename)
+    imported = ShardedSaver(directory, shards).import_records(json_saver.data)
+    print(f"Перенесено вакансий: {imported}")
+    return imported
@@ -0,0 +1,237 @@
+import random
+import zlib
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from lazy_import import lazy_import
+from search_index import tokenize
+from vacancy import Vacancy
+
+# NumPy необязателен: без него сигнатуры считаются построчно
+np = lazy_import("numpy")
+
+MERSENNE_PRIME = (1 << 31) - 1
+
+Signature = Tuple[int, ...]
+
+
+def shingles(text: Optional[str], size: int = 3) -> Set[int]:
+    """Разбивает текст на перекрывающиеся группы из size слов и хеширует их."""
+    tokens = tokenize(text)
+    if not tokens:
+        return set()
+    if len(tokens) <= size:
+        return {zlib.crc32(" ".join(tokens).encode("utf-8"))}
+    return {
+        zlib.crc32(" ".join(tokens[i : i + size]).encode("utf-8"))
+        for i in range(len(tokens) - size + 1)
+    }
+
+
+def vacancy_text(title: Optional[str], description: Optional[str]) -> str:
+    return f"{title or ''} {description or ''}"
+
+
+class MinHasher:
+    """Считает MinHash-сигнатуры множеств шинглов.
+
+    Доля совпавших позиций двух сигнатур оценивает коэффициент Жаккара
+    исходных множеств.
+    """
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.a = [rng.randrange(1, MERSENNE_PRIME) for _ in range(num_perm)]
+        self.b = [rng.randrange(0, MERSENNE_PRIME) for _ in range(num_perm)]
+        if np is not None:
+            self.__a = np.array(self.a, dtype=np.uint64)[:, None]
+            self.__b = np.array(self.b, dtype=np.uint64)[:, None]
+
+    def signature(self, values: Set[int]) -> Signature:
+        if not values:
+            return (MERSENNE_PRIME,) * self.num_perm
+        if np is not None:
+            x = np.fromiter(values, dtype=np.uint64, count=len(values))
+            x %= MERSENNE_PRIME
+            # a, x < 2^31, поэтому a * x + b помещается в uint64
+            hashed = (self.__a * x + self.__b) % MERSENNE_PRIME
+            return tuple(hashed.min(axis=1).tolist())
+        values = [value % MERSENNE_PRIME for value in values]
+        return tuple(
+            min((a * x + b) % MERSENNE_PRIME for x in values)
+            for a, b in zip(self.a, self.b)
+        )
+
+    @staticmethod
+    def similarity(first: Signature, second: Signature) -> float:
+        """Оценивает коэффициент Жаккара по двум сигнатурам."""
+        same = sum(1 for x, y in zip(first, second) if x == y)
+        return same / len(first)
+
+
+class LSHIndex:
+    """Индекс LSH: сигнатура режется на полосы, совпадение полосы — кандидат.
+
+    Поиск кандидатов стоит O(число полос) и не зависит от размера индекса.
+    """
+
+    def __init__(self, bands: int = 16, rows: int = 8):
+        self.bands = bands
+        self.rows = rows
+        self.__buckets: List[Dict[Signature, Set[Hashable]]] = [
+            {} for _ in range(bands)
+        ]
+        self.__signatures: Dict[Hashable, Signature] = {}
+
+    def __band_keys(self, signature: Signature):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows : (band + 1) * self.rows]
+
+    def add(self, key: Hashable, signature: Signature):
+        if key in self.__signatures:
+            self.remove(key)
+        self.__signatures[key] = signature
+        for band, band_key in self.__band_keys(signature):
+            self.__buckets[band].setdefault(band_key, set()).add(key)
+
+    def remove(self, key: Hashable):
+        signature = self.__signatures.pop(key, None)
+        if signature is None:
+            return
+        for band, band_key in self.__band_keys(signature):
+            bucket = self.__buckets[band].get(band_key)
+            if bucket is None:
+                continue
+            bucket.discard(key)
+            if not bucket:
+                del self.__buckets[band][band_key]
+
+    def candidates(self, signature: Signature) -> Set[Hashable]:
+        found = set()
+        for band, band_key in self.__band_keys(signature):
+            found.update(self.__buckets[band].get(band_key, ()))
+        return found
+
+    def signature_of(self, key: Hashable) -> Optional[Signature]:
+        return self.__signatures.get(key)
+
+    def __contains__(self, key):
+        return key in self.__signatures
+
+    def __len__(self):
+        return len(self.__signatures)
+
+
+def choose_bands(threshold: float, num_perm: int) -> int:
+    """Подбирает число полос так, чтобы порог LSH был чуть ниже threshold.
+
+    Пара с похожестью s становится кандидатом с вероятностью 1 - (1 - s^r)^b,
+    перелом этой кривой примерно в (1/b)^(1/r).
+    """
+    best = num_perm
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if (1 / bands) ** (1 / rows) <= threshold - 0.05:
+            best = bands
+    return best
+
+
+class NearDuplicateDetector:
+    """Находит почти одинаковые вакансии по названию и описанию.
+
+    LSH отбирает кандидатов, окончательное решение принимается по оценке
+    похожести и threshold.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        bands: Optional[int] = None,
+        shingle_size: int = 3,
+        seed: int = 1,
+    ):
+        bands = bands or choose_bands(threshold, num_perm)
+        if num_perm % bands:
+            raise ValueError("num_perm должно делиться на число полос")
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.hasher = MinHasher(num_perm, seed)
+        self.index = LSHIndex(bands, num_perm // bands)
+
+    def signature(self, title: Optional[str], description: Optional[str]) -> Signature:
+        text = vacancy_text(title, description)
+        return self.hasher.signature(shingles(text, self.shingle_size))
+
+    def find(
+        self,
+        title: Optional[str],
+        description: Optional[str],
+        signature: Optional[Signature] = None,
+    ) -> List[Tuple[Hashable, float]]:
+        """Возвращает ключи похожих вакансий и оценку похожести, лучшие первыми."""
+        if signature is None:
+            signature = self.signature(title, description)
+        matches = []
+        for key in self.index.candidates(signature):
+            score = MinHasher.similarity(signature, self.index.signature_of(key))
+            if score >= self.threshold:
+                matches.append((key, score))
+        matches.sort(key=lambda match: -match[1])
+        return matches
+
+    def add(self, key: Hashable, title: Optional[str], description: Optional[str]):
+        self.index.add(key, self.signature(title, description))
+
+    def remove(self, key: Hashable):
+        self.index.remove(key)
+
+    def __len__(self):
+        return len(self.index)
+
+
+def find_duplicate_groups(
+    vacancies: Iterable[Vacancy], detector: Optional[NearDuplicateDetector] = None
+) -> List[List[Vacancy]]:
+    """Группирует почти одинаковые вакансии за один проход.
+
+    Первая вакансия группы — самая ранняя в порядке обхода; одиночки в
+    результат не попадают.
+    """
+    if detector is None:
+        detector = NearDuplicateDetector()
+    groups: Dict[str, List[Vacancy]] = {}
+    leaders: Dict[str, str] = {}
+    for vacancy in vacancies:
+        if vacancy.url in leaders:
+            continue  # точный дубль по URL
+        signature = detector.signature(vacancy.title, vacancy.description)
+        matches = detector.find(None, None, signature)
+        if matches:
+            leader = leaders[matches[0][0]]
+            leaders[vacancy.url] = leader
+            groups[leader].append(vacancy)
+        else:
+            leaders[vacancy.url] = vacancy.url
+            groups[vacancy.url] = [vacancy]
+        detector.index.add(vacancy.url, signature)
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def remove_near_duplicates(
+    saver, threshold: float = 0.8, dry_run: bool = False
+) -> List[List[Vacancy]]:
+    """Удаляет из хранилища все вакансии группы, кроме первой.
+
+    Возвращает найденные группы; при dry_run хранилище не изменяется.
+    """
+    groups = find_duplicate_groups(
+        saver.iter_vacancies(), NearDuplicateDetector(threshold)
+    )
+    if not dry_run:
+        duplicates = [vacancy for group in groups for vacancy in group[1:]]
+        if duplicates:
+            saver.delete_vacancies(duplicates)
+    return groups
@@ -0,0 +1,67 @@
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows: блокировки через msvcrt, только исключительные
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """Межпроцессная блокировка на отдельном файле.
+
+    Общая блокировка (shared=True) допускает одновременных читателей,
+    исключительная — одного писателя. Каждый объект открывает файл заново,
+    поэтому блокировки разных объектов исключают друг друга и внутри процесса.
+    """
+
+    def __init__(self, filename: str, shared: bool = False):
+        self.filename = filename
+        self.shared = shared
+        self.__file = None
+
+    def acquire(self):
+        directory = os.path.dirname(self.filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.__file = open(self.filename, "a+b")
+        try:
+            if fcntl is not None:
+                fcntl.flock(
+                    self.__file.fileno(),
+                    fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX,
+                )
+            else:
+                self.__file.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(self.__file.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        # LK_LOCK сдается через 10 секунд — ждем дальше
+                        time.sleep(0.05)
+        except BaseException:
+            self.__file.close()
+            self.__file = None
+            raise
+
+    def release(self):
+        if self.__file is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self.__file.fileno(), fcntl.LOCK_UN)
+            else:
+                self.__file.seek(0)
+                msvcrt.locking(self.__file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self.__file.close()
+            self.__file = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
@@ -0,0 +1,224 @@
+import random
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from cache import ResponseCache
+from lazy_import import lazy_import
+from metrics import MetricsRegistry
+
+# requests загружается при первом запросе, а не при запуске программы
+requests = lazy_import("requests")
+
+
+class TokenBucket:
+    """Ограничитель частоты запросов по алгоритму token bucket."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("Частота запросов должна быть положительной")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.__tokens = self.capacity
+        self.__updated_at = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Ждет, пока в корзине появятся токены, и возвращает время ожидания."""
+        waited = 0.0
+        while True:
+            with self.__lock:
+                now = time.monotonic()
+                self.__tokens = min(
+                    self.capacity, self.__tokens + (now - self.__updated_at) * self.rate
+                )
+                self.__updated_at = now
+                if self.__tokens >= tokens:
+                    self.__tokens -= tokens
+                    return waited
+                delay = (tokens - self.__tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class HttpClient:
+    """HTTP-клиент с пулом соединений, повторами и ограничением частоты запросов."""
+
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        timeout: float = 10.0,
+        rate_limiter: Optional[TokenBucket] = None,
+        pool_size: int = 10,
+        user_agent: str = "oop-kursovaya/0.1",
+        cache: Optional[ResponseCache] = None,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.metrics = metrics
+        self.user_agent = user_agent
+        self.pool_size = pool_size
+        self.__session = None
+        self.__session_lock = threading.Lock()
+
+    @property
+    def session(self) -> "requests.Session":
+        """Сессия с пулом соединений, создается при первом запросе."""
+        if self.__session is None:
+            with self.__session_lock:
+                if self.__session is None:
+                    session = requests.Session()
+                    session.headers["User-Agent"] = self.user_agent
+                    adapter = requests.adapters.HTTPAdapter(
+                        pool_connections=self.pool_size, pool_maxsize=self.pool_size
+                    )
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self.__session = session
+        return self.__session
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+    ) -> "requests.Response":
+        """Отправляет GET-запрос, при наличии кэша сначала ищет ответ в нем."""
+        if self.cache is None:
+            return self.__send(url, params, headers)
+
+        key = self.cache.make_key(url, params)
+        entry = self.cache.get(key)
+        if entry is not None and self.cache.is_fresh(entry):
+            self.cache.record(hit=True)
+            if self.metrics is not None:
+                self.__count_cache(url, "hit")
+            return self.cache.to_response(entry, url)
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if entry.get("etag"):
+                request_headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                request_headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self.__send(url, params, request_headers or headers)
+        if response.status_code == 304 and entry is not None:
+            self.cache.record(hit=True, revalidated=True)
+            if self.metrics is not None:
+                self.__count_cache(url, "revalidated")
+            entry = self.cache.refresh(key, entry, response)
+            return self.cache.to_response(entry, url)
+
+        self.cache.record(hit=False)
+        if self.metrics is not None:
+            self.__count_cache(url, "miss")
+        self.cache.put(key, response)
+        return response
+
+    def __send(
+        self, url: str, params: Optional[Dict], headers: Optional[Dict]
+    ) -> "requests.Response":
+        """Отправляет GET-запрос, повторяя его при сетевых ошибках, 429 и 5xx."""
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            started = time.perf_counter()
+            try:
+                response = self.session.get(
+                    url, params=params, headers=headers, timeout=self.timeout
+                )
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+            ) as e:
+                if self.metrics is not None:
+                    self.__observe(url, started, type(e).__name__)
+                if attempt >= self.retries:
+                    if self.metrics is not None:
+                        self.__count_error(url, type(e).__name__)
+                    raise
+                if self.metrics is not None:
+                    self.__count_retry(url, type(e).__name__)
+                time.sleep(self._backoff(attempt))
+                attempt += 1
+                continue
+
+            if self.metrics is not None:
+                self.__observe(url, started, response.status_code, response)
+            if response.status_code in self.RETRY_STATUSES and attempt < self.retries:
+                if self.metrics is not None:
+                    self.__count_retry(url, response.status_code)
+                time.sleep(self._backoff(attempt, response))
+                attempt += 1
+                continue
+
+            if self.metrics is not None and response.status_code >= 400:
+                self.__count_error(url, response.status_code)
+            response.raise_for_status()
+            return response
+
+    @staticmethod
+    def _endpoint(url: str) -> str:
+        """Возвращает адрес без параметров запроса — метку для метрик."""
+        parts = urlsplit(url)
+        return f"{parts.netloc}{parts.path}"
+
+    def __observe(
+        self,
+        url: str,
+        started: float,
+        status,
+        response: Optional["requests.Response"] = None,
+    ):
+        endpoint = self._endpoint(url)
+        self.metrics.histogram(
+            "http_request_duration_seconds", "Длительность HTTP-запросов"
+        ).observe(time.perf_counter() - started, endpoint=endpoint)
+        self.metrics.counter("http_requests_total", "HTTP-запросы по статусам").inc(
+            endpoint=endpoint, status=status
+        )
+        if response is not None:
+            self.metrics.counter(
+                "http_response_bytes_total", "Получено байт в теле ответов"
+            ).inc(len(response.content), endpoint=endpoint)
+
+    def __count_retry(self, url: str, reason):
+        self.metrics.counter("http_retries_total", "Повторы HTTP-запросов").inc(
+            endpoint=self._endpoint(url), reason=reason
+        )
+
+    def __count_error(self, url: str, reason):
+        self.metrics.counter(
+            "http_errors_total", "HTTP-запросы, завершившиеся ошибкой"
+        ).inc(endpoint=self._endpoint(url), reason=reason)
+
+    def __count_cache(self, url: str, result: str):
+        self.metrics.counter("http_cache_total", "Обращения к кэшу ответов").inc(
+            endpoint=self._endpoint(url), result=result
+        )
+
+    def _backoff(self, attempt: int, response: Optional["requests.Response"] = None):
+        """Считает паузу перед повтором: Retry-After или экспонента с jitter."""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                return min(float(retry_after), self.max_backoff)
+        delay = min(self.max_backoff, self.backoff_factor * (2**attempt))
+        return random.uniform(0, delay)
+
+    def close(self):
+        """Закрывает пул соединений."""
+        if self.__session is not None:
+            self.__session.close()
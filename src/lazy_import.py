@@ -0,0 +1,26 @@
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Optional
+
+
+def lazy_import(name: str) -> Optional[ModuleType]:
+    """Возвращает модуль, который выполнится при первом обращении к атрибуту.
+
+    Если модуль не установлен, возвращает None — так же, как блок
+    try/except ImportError для необязательных зависимостей. Аннотации
+    с типами из такого модуля нужно писать строками, иначе модуль загрузится
+    при импорте.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        return None
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -1,32 +1,19 @@
-import re
+import os
+import sys
 from typing import List
 
 from api_connectors import APIConnector, HHruConnector
+from cache import ResponseCache
 from data_savers import DataSaver, JSONSaver
+from pipeline import vacancy_pipeline
 from vacancy import Vacancy
 
+CACHE_DIR = os.path.join(os.path.dirname(__file__), "..", "data", "http_cache")
+
 
 def interact_with_user(json_saver: JSONSaver, hh_connector: HHruConnector):
     """Функция для взаимодействия с пользователем через консоль."""
 
-    def get_vacancies_from_api(query: str) -> List[Vacancy]:
-        """Получает вакансии с API, преобразует в объекты Vacancy и возвращает список."""
-        vacancies_data = hh_connector.get_vacancies(query)
-        new_vacancies = []
-
-        for data in vacancies_data:
-            salary = data.get("salary") or {"from": None, "to": None}
-            vacancy = Vacancy(
-                title=data["name"],
-                url=data["alternate_url"],
-                salary_from=salary["from"],
-                salary_to=salary["to"],
-                description=data.get("snippet", {}).get("requirement"),
-            )
-            new_vacancies.append(vacancy)
-
-        return new_vacancies
-
     def print_vacancies(vacancies: List[Vacancy]):
         """Выводит список вакансий на экран."""
         if not vacancies:
@@ -49,45 +36,35 @@ def interact_with_user(json_saver: JSONSaver, hh_connector: HHruConnector):
 
         if choice == "1":
             query = input("Введите поисковый запрос для вакансий на hh.ru: ").strip()
-            new_vacancies = get_vacancies_from_api(query)
-
-            existing_urls = {v.url for v in json_saver.get_vacancies({})}
-            unique_vacancies = [v for v in new_vacancies if v.url not in existing_urls]
-
-            for vacancy in unique_vacancies:
-                json_saver.add_vacancy(vacancy)
+            added = 0
+            for vacancy in vacancy_pipeline(hh_connector, json_saver, query):
                 print(f"Добавлена: {vacancy}")
+                added += 1
 
-            print(f"\nДобавлено {len(unique_vacancies)} новых вакансий.")
+            print(f"\nДобавлено {added} новых вакансий.")
 
         elif choice == "2":
             try:
                 n = int(input("Введите количество вакансий для вывода: "))
-                all_vacancies = json_saver.get_vacancies({})
-                sorted_vacancies = sorted(all_vacancies, reverse=True)[:n]
-                print_vacancies(sorted_vacancies)
+                print_vacancies(json_saver.top_by_salary(n))
             except ValueError:
                 print("Ошибка: введите число!")
 
         elif choice == "3":
             keyword = input("Введите ключевое слово для поиска в описании: ").strip()
-            all_vacancies = json_saver.get_vacancies({})
-            filtered = [
-                v
-                for v in all_vacancies
-                if v.description and re.search(keyword, v.description, re.IGNORECASE)
-            ]
-            print_vacancies(filtered)
+            print_vacancies(json_saver.search_vacancies(keyword))
 
         elif choice == "4":
-            print_vacancies(json_saver.get_vacancies({}))
+            print_vacancies(json_saver.get_vacancies({}, lazy=True))
 
         elif choice == "5":
-            url = input("Введите URL вакансии для удаления: ").strip()
-            if json_saver.delete_vacancy(Vacancy("", url)):
-                print("Вакансия удалена.")
-            else:
-                print("Вакансия не найдена.")
+            urls = input("Введите URL вакансий для удаления через пробел: ").split()
+            results = json_saver.delete_vacancies(Vacancy("", url) for url in urls)
+            for url, deleted in zip(urls, results):
+                if deleted:
+                    print(f"Вакансия удалена: {url}")
+                else:
+                    print(f"Вакансия не найдена: {url}")
 
         elif choice == "6":
             print("Выход из программы.")
@@ -98,6 +75,12 @@ def interact_with_user(json_saver: JSONSaver, hh_connector: HHruConnector):
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # С аргументами работаем без меню — для cron и планировщиков задач
+        from cli import main
+
+        sys.exit(main())
+
     json_saver = JSONSaver()
-    hh_connector = HHruConnector()
+    hh_connector = HHruConnector(cache=ResponseCache(CACHE_DIR, ttl=600))
     interact_with_user(json_saver, hh_connector)
@@ -0,0 +1,235 @@
+import abc
+import bisect
+import math
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Границы корзин гистограмм по умолчанию, как в клиентах Prometheus
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(key: LabelKey, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+    pairs = key + extra
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric(abc.ABC):
+    """Базовый класс метрики с набором значений по меткам."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str = ""):
+        self.name = name
+        self.help = help
+        self._lock = threading.Lock()
+        self._values: Dict[LabelKey, object] = {}
+
+    @abc.abstractmethod
+    def _samples(self) -> List[str]:
+        pass
+
+    def to_prometheus(self) -> str:
+        """Возвращает метрику в текстовом формате Prometheus."""
+        lines = []
+        if self.help:
+            lines.append(f"# HELP {self.name} {_escape(self.help)}")
+        lines.append(f"# TYPE {self.name} {self.kind}")
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    """Монотонно растущий счетчик."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        if amount < 0:
+            raise ValueError("Счетчик не может уменьшаться")
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(_label_key(labels), 0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(Counter):
+    """Значение, которое может как расти, так и уменьшаться."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[_label_key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Histogram(Metric):
+    """Распределение значений по корзинам, например длительностей запросов."""
+
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, help: str = "", buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, help)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = _label_key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # Счетчики по корзинам (последняя — +Inf), сумма и количество
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def time(self, **labels) -> "_Timer":
+        """Контекстный менеджер, который записывает длительность блока."""
+        return _Timer(self, labels)
+
+    def count(self, **labels) -> int:
+        state = self._values.get(_label_key(labels))
+        return state[2] if state else 0
+
+    def sum(self, **labels) -> float:
+        state = self._values.get(_label_key(labels))
+        return state[1] if state else 0.0
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(
+                (key, ([*counts], total, count))
+                for key, (counts, total, count) in self._values.items()
+            )
+        lines = []
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                labels = _format_labels(key, (("le", _format_value(bound)),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {count}")
+        return lines
+
+
+class _Timer:
+    __slots__ = ("histogram", "labels", "start")
+
+    def __init__(self, histogram: Histogram, labels: Dict):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.start, **self.labels)
+
+
+class _NullTimer:
+    """Пустой таймер для случая, когда метрики не собираются."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+NULL_TIMER = _NullTimer()
+
+
+class MetricsRegistry:
+    """Реестр метрик с выгрузкой в текстовом формате Prometheus."""
+
+    def __init__(self):
+        self.__metrics: Dict[str, Metric] = {}
+        self.__lock = threading.Lock()
+
+    def __get_or_create(self, cls, name: str, help: str, **kwargs) -> Metric:
+        with self.__lock:
+            metric = self.__metrics.get(name)
+            if metric is None:
+                metric = self.__metrics[name] = cls(name, help, **kwargs)
+            elif type(metric) is not cls:
+                raise ValueError(f"Метрика {name} уже зарегистрирована другого типа")
+            return metric
+
+    def counter(self, name: str, help: str = "") -> Counter:
+        return self.__get_or_create(Counter, name, help)
+
+    def gauge(self, name: str, help: str = "") -> Gauge:
+        return self.__get_or_create(Gauge, name, help)
+
+    def histogram(
+        self, name: str, help: str = "", buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.__get_or_create(Histogram, name, help, buckets=buckets)
+
+    def get(self, name: str) -> Optional[Metric]:
+        return self.__metrics.get(name)
+
+    def to_prometheus(self) -> str:
+        """Возвращает все метрики в текстовом формате Prometheus."""
+        with self.__lock:
+            metrics = sorted(self.__metrics.values(), key=lambda m: m.name)
+        return "".join(metric.to_prometheus() + "\n" for metric in metrics)
+
+    def dump(self, filename: Optional[str] = None):
+        """Записывает метрики в файл или, если он не задан, в stdout."""
+        text = self.to_prometheus()
+        if filename is None:
+            sys.stdout.write(text)
+            return
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+def timer(registry: Optional[MetricsRegistry], name: str, help: str = "", **labels):
+    """Возвращает таймер гистограммы или пустой таймер без реестра."""
+    if registry is None:
+        return NULL_TIMER
+    return registry.histogram(name, help).time(**labels)
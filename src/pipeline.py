@@ -0,0 +1,86 @@
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+from api_connectors import APIConnector
+from data_savers import DataSaver
+from vacancy import Vacancy
+
+
+def hh_item_to_vacancy(item: Dict) -> Vacancy:
+    """Преобразует вакансию в формате hh.ru в объект Vacancy."""
+    salary = item.get("salary") or {}
+    snippet = item.get("snippet") or {}
+    return Vacancy(
+        title=item["name"],
+        url=item["alternate_url"],
+        salary_from=salary.get("from"),
+        salary_to=salary.get("to"),
+        description=snippet.get("requirement"),
+    )
+
+
+def superjob_item_to_vacancy(item: Dict) -> Vacancy:
+    """Преобразует вакансию в формате SuperJob в объект Vacancy."""
+    # SuperJob обозначает отсутствующую зарплату нулем
+    return Vacancy(
+        title=item["profession"],
+        url=item["link"],
+        salary_from=item.get("payment_from") or None,
+        salary_to=item.get("payment_to") or None,
+        description=item.get("candidat"),
+    )
+
+
+def parse_items(
+    items: Iterable[Dict], mapper: Callable[[Dict], Vacancy] = hh_item_to_vacancy
+) -> Iterator[Vacancy]:
+    """Преобразует поток сырых вакансий в объекты Vacancy, пропуская битые записи."""
+    for item in items:
+        try:
+            yield mapper(item)
+        except (KeyError, TypeError, AttributeError) as e:
+            print(f"Пропущена некорректная вакансия: {e}")
+
+
+def dedupe(
+    vacancies: Iterable[Vacancy], seen: Optional[Set[str]] = None
+) -> Iterator[Vacancy]:
+    """Отбрасывает вакансии с уже встречавшимся URL."""
+    seen = set() if seen is None else seen
+    for vacancy in vacancies:
+        if vacancy.url in seen:
+            continue
+        seen.add(vacancy.url)
+        yield vacancy
+
+
+def chunked(iterable: Iterable, size: int) -> Iterator[List]:
+    """Разбивает поток на списки длиной не больше size."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def persist(
+    vacancies: Iterable[Vacancy], saver: DataSaver, chunk_size: int = 100
+) -> Iterator[Vacancy]:
+    """Сохраняет вакансии порциями и отдает те, что были добавлены."""
+    for chunk in chunked(vacancies, chunk_size):
+        for vacancy, added in zip(chunk, saver.add_vacancies(chunk)):
+            if added:
+                yield vacancy
+
+
+def vacancy_pipeline(
+    connector: APIConnector,
+    saver: DataSaver,
+    query: str,
+    mapper: Callable[[Dict], Vacancy] = hh_item_to_vacancy,
+    chunk_size: int = 100,
+) -> Iterator[Vacancy]:
+    """Потоково загружает вакансии из API в хранилище: страница за страницей."""
+    items = connector.iter_vacancies(query)
+    return persist(dedupe(parse_items(items, mapper)), saver, chunk_size)
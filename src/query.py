@@ -0,0 +1,256 @@
+import operator
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Операторы сравнения в ключах критериев: {"salary_from__gte": 200000}
+OPERATORS = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "between": lambda value, bounds: bounds[0] <= value <= bounds[1],
+    "in": lambda value, options: value in options,
+    "startswith": lambda value, prefix: str(value).startswith(prefix),
+    "istartswith": lambda value, prefix: str(value).lower().startswith(prefix.lower()),
+    "contains": lambda value, part: part in str(value),
+    "icontains": lambda value, part: part.lower() in str(value).lower(),
+}
+
+# Операторы, которые не имеют смысла для пустого значения в записи
+NULL_UNSAFE = {
+    "gt",
+    "gte",
+    "lt",
+    "lte",
+    "between",
+    "startswith",
+    "istartswith",
+    "contains",
+    "icontains",
+}
+RANGE_OPERATORS = {"gt", "gte", "lt", "lte", "between"}
+SALARY_FIELDS = {"salary_from", "salary_to"}
+
+
+class Predicate:
+    """Условие на одно поле записи."""
+
+    __slots__ = ("field", "op", "value", "_test")
+
+    def __init__(self, field: str, op: str, value: Any):
+        if op not in OPERATORS:
+            raise ValueError(f"Неизвестный оператор в критерии: {op}")
+        if op == "between" and (
+            not isinstance(value, (list, tuple)) or len(value) != 2
+        ):
+            raise ValueError("Для between нужна пара значений (от, до)")
+        self.field = field
+        self.op = op
+        self.value = tuple(value) if isinstance(value, list) else value
+        self._test = OPERATORS[op]
+
+    def matches(self, record: Dict) -> bool:
+        if self.field not in record:
+            return False
+        value = record[self.field]
+        if value is None and self.op in NULL_UNSAFE:
+            return False
+        try:
+            return self._test(value, self.value)
+        except TypeError:
+            return False
+
+    def __repr__(self):
+        return f"Predicate({self.field!r}, {self.op!r}, {self.value!r})"
+
+
+class Group:
+    """Набор условий, объединенных по И или по ИЛИ."""
+
+    __slots__ = ("kind", "children")
+
+    def __init__(self, kind: str, children: List):
+        self.kind = kind
+        self.children = children
+
+    def matches(self, record: Dict) -> bool:
+        if self.kind == "and":
+            return all(child.matches(record) for child in self.children)
+        return any(child.matches(record) for child in self.children)
+
+    def __repr__(self):
+        return f"Group({self.kind!r}, {self.children!r})"
+
+
+class QueryPlan:
+    """Скомпилированный запрос: проверка записи и подсказка по индексу."""
+
+    def __init__(self, root: Group):
+        self.root = root
+        self.matches: Callable[[Dict], bool] = root.matches
+        self.access_path = self.__choose_access_path()
+
+    @property
+    def is_empty(self) -> bool:
+        """Запрос без условий подходит под любую запись."""
+        return self.root.kind == "and" and not self.root.children
+
+    def __choose_access_path(self) -> Tuple:
+        """Выбирает условие верхнего уровня, которое можно ответить индексом.
+
+        Возвращает ("url", значение), ("range", поле, от, до, включая_от,
+        включая_до), ("prefix", поле, префикс, без_учета_регистра) или ("scan",).
+        """
+        if self.root.kind != "and":
+            return ("scan",)
+
+        predicates = [c for c in self.root.children if isinstance(c, Predicate)]
+        for predicate in predicates:
+            if predicate.field == "url" and predicate.op == "eq":
+                return ("url", predicate.value)
+
+        for predicate in predicates:
+            if predicate.field in SALARY_FIELDS and predicate.op in RANGE_OPERATORS:
+                low, high = None, None
+                low_inclusive = high_inclusive = True
+                if predicate.op == "between":
+                    low, high = predicate.value
+                elif predicate.op in ("gt", "gte"):
+                    low, low_inclusive = predicate.value, predicate.op == "gte"
+                else:
+                    high, high_inclusive = predicate.value, predicate.op == "lte"
+                return (
+                    "range",
+                    predicate.field,
+                    low,
+                    high,
+                    low_inclusive,
+                    high_inclusive,
+                )
+
+        for predicate in predicates:
+            if predicate.field == "title" and predicate.op in (
+                "startswith",
+                "istartswith",
+            ):
+                return (
+                    "prefix",
+                    predicate.field,
+                    predicate.value,
+                    predicate.op == "istartswith",
+                )
+
+        return ("scan",)
+
+    def to_sql(
+        self, columns: Dict[str, str], lower_function: str = "lower"
+    ) -> Tuple[str, List]:
+        """Переводит запрос в условие WHERE с параметрами для sqlite3."""
+        params: List = []
+        return _node_to_sql(self.root, columns, lower_function, params), params
+
+    def __repr__(self):
+        return f"QueryPlan({self.root!r}, access_path={self.access_path!r})"
+
+
+def _node_to_sql(node, columns, lower_function, params) -> str:
+    if isinstance(node, Group):
+        parts = [
+            _node_to_sql(child, columns, lower_function, params)
+            for child in node.children
+        ]
+        if not parts:
+            return "1" if node.kind == "and" else "0"
+        joiner = " AND " if node.kind == "and" else " OR "
+        return "(" + joiner.join(parts) + ")"
+
+    if node.field not in columns:
+        # Как и при переборе: записи без такого поля не подходят
+        return "0"
+    column = columns[node.field]
+    op, value = node.op, node.value
+    simple = {"eq": "=", "gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+    if op in simple:
+        params.append(value)
+        return f"{column} {simple[op]} ?"
+    if op == "ne":
+        params.append(value)
+        return f"{column} IS NOT ?"
+    if op == "between":
+        params.extend(value)
+        return f"{column} BETWEEN ? AND ?"
+    if op == "in":
+        options = list(value)
+        if not options:
+            return "0"
+        params.extend(options)
+        return f"{column} IN ({', '.join('?' * len(options))})"
+    if op == "startswith":
+        params.extend([len(value), value])
+        return f"substr({column}, 1, ?) = ?"
+    if op == "istartswith":
+        params.extend([len(value), value.lower()])
+        return f"substr({lower_function}({column}), 1, ?) = ?"
+    if op == "contains":
+        params.append(value)
+        return f"instr({column}, ?) > 0"
+    params.append(value.lower())
+    return f"instr({lower_function}({column}), ?) > 0"
+
+
+def _freeze(value: Any) -> Any:
+    """Делает критерии хешируемыми, чтобы кэшировать скомпилированные планы."""
+    if isinstance(value, dict):
+        return ("dict", tuple((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return ("list", tuple(_freeze(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return ("set", frozenset(value))
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, tuple) and len(value) == 2 and value[0] == "dict":
+        return {key: _thaw(item) for key, item in value[1]}
+    if isinstance(value, tuple) and len(value) == 2 and value[0] == "list":
+        return [_thaw(item) for item in value[1]]
+    if isinstance(value, tuple) and len(value) == 2 and value[0] == "set":
+        return set(value[1])
+    return value
+
+
+def _build_group(criteria: Dict, kind: str = "and") -> Group:
+    children = []
+    for key, value in criteria.items():
+        if value is None:
+            continue
+        if key in ("or", "and"):
+            if not value:
+                continue
+            children.append(Group(key, [_build_group(item) for item in value]))
+            continue
+        field, _, op = key.partition("__")
+        children.append(Predicate(field, op or "eq", value))
+    return Group(kind, children)
+
+
+@lru_cache(maxsize=256)
+def _compile_frozen(frozen: Tuple) -> QueryPlan:
+    return QueryPlan(_build_group(_thaw(frozen)))
+
+
+def compile_query(criteria: Optional[Dict]) -> QueryPlan:
+    """Компилирует критерии в план запроса.
+
+    Ключ без суффикса — точное совпадение, суффикс задает оператор:
+    salary_from__gte, salary_to__between, title__startswith и т.д.
+    Ключи "or" и "and" принимают списки вложенных критериев.
+    Значение None, как и раньше, означает отсутствие условия.
+    """
+    try:
+        return _compile_frozen(_freeze(criteria or {}))
+    except TypeError:
+        # Нехешируемое значение — компилируем без кэша
+        return QueryPlan(_build_group(criteria or {}))
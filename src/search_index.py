@@ -0,0 +1,186 @@
+import json
+import math
+import os
+import re
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+HIGHLIGHT_RE = re.compile(r"</?highlighttext>", re.IGNORECASE)
+TOKEN_RE = re.compile(r"\w+")
+PHRASE_RE = re.compile(r'"([^"]*)"|(\S+)')
+OR_WORDS = {"or", "или", "|"}
+
+# Терм запроса: одно слово или фраза из нескольких слов подряд
+Term = Union[str, Tuple[str, ...]]
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Разбивает русский и английский текст на слова в нижнем регистре."""
+    if not text:
+        return []
+    text = HIGHLIGHT_RE.sub("", text).lower().replace("ё", "е")
+    return TOKEN_RE.findall(text)
+
+
+def parse_query(query: str) -> List[List[Term]]:
+    """Разбирает запрос на группы ИЛИ, внутри которых термы объединяются по И.
+
+    Слова через пробел — И, слово OR (ИЛИ, |) — разделитель групп,
+    текст в двойных кавычках — фраза.
+    """
+    groups: List[List[Term]] = [[]]
+    for phrase, word in PHRASE_RE.findall(query):
+        if word and word.lower() in OR_WORDS:
+            if groups[-1]:
+                groups.append([])
+            continue
+
+        tokens = tokenize(phrase if phrase else word)
+        if not tokens:
+            continue
+        if phrase and len(tokens) > 1:
+            groups[-1].append(tuple(tokens))
+        else:
+            groups[-1].extend(tokens)
+    return [group for group in groups if group]
+
+
+def _group_words(group: List[Term]) -> List[str]:
+    """Возвращает все слова группы, раскрывая фразы."""
+    words = []
+    for term in group:
+        words.extend(term if isinstance(term, tuple) else (term,))
+    return words
+
+
+class InvertedIndex:
+    """Инвертированный индекс с позициями слов и ранжированием BM25."""
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[str, List[int]]] = {}
+        self.doc_lengths: Dict[str, int] = {}
+        self.total_length = 0
+
+    def add(self, doc_id: str, text: Optional[str]):
+        """Добавляет документ в индекс."""
+        if doc_id in self.doc_lengths:
+            return
+        tokens = tokenize(text)
+        for position, token in enumerate(tokens):
+            self.postings.setdefault(token, {}).setdefault(doc_id, []).append(position)
+        self.doc_lengths[doc_id] = len(tokens)
+        self.total_length += len(tokens)
+
+    def remove(self, doc_id: str, text: Optional[str]):
+        """Удаляет документ из индекса; text — тот же текст, что был добавлен."""
+        if doc_id not in self.doc_lengths:
+            return
+        for token in set(tokenize(text)):
+            docs = self.postings.get(token)
+            if docs is None:
+                continue
+            docs.pop(doc_id, None)
+            if not docs:
+                del self.postings[token]
+        self.total_length -= self.doc_lengths.pop(doc_id)
+
+    def __len__(self):
+        return len(self.doc_lengths)
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """Возвращает идентификаторы документов по убыванию релевантности."""
+        scores: Dict[str, float] = {}
+        for group in parse_query(query):
+            docs = self.__match_group(group)
+            if not docs:
+                continue
+            words = _group_words(group)
+            for doc_id in docs:
+                score = self.__score(doc_id, words)
+                if score > scores.get(doc_id, -1.0):
+                    scores[doc_id] = score
+
+        ranked = sorted(scores, key=lambda doc_id: -scores[doc_id])
+        return ranked[:limit] if limit is not None else ranked
+
+    def __match_group(self, group: List[Term]) -> Set[str]:
+        """Находит документы, содержащие все термы группы."""
+        postings = [self.postings.get(word) for word in set(_group_words(group))]
+        if not all(postings):
+            return set()
+
+        # Пересечение начинаем с самого короткого списка
+        postings.sort(key=len)
+        docs = set(postings[0])
+        for docs_with_word in postings[1:]:
+            docs.intersection_update(docs_with_word)
+            if not docs:
+                return docs
+
+        for term in group:
+            if isinstance(term, tuple):
+                docs = {doc_id for doc_id in docs if self.__has_phrase(doc_id, term)}
+        return docs
+
+    def __has_phrase(self, doc_id: str, phrase: Tuple[str, ...]) -> bool:
+        """Проверяет, что слова фразы идут в документе подряд."""
+        starts = set(self.postings[phrase[0]][doc_id])
+        for offset, word in enumerate(phrase[1:], start=1):
+            positions = set(self.postings[word][doc_id])
+            starts = {start for start in starts if start + offset in positions}
+            if not starts:
+                return False
+        return True
+
+    def __score(self, doc_id: str, words: List[str]) -> float:
+        """Считает BM25 документа для слов запроса."""
+        total_docs = len(self.doc_lengths)
+        average_length = self.total_length / total_docs if total_docs else 0
+        length = self.doc_lengths[doc_id]
+        score = 0.0
+        for word in set(words):
+            docs = self.postings.get(word, {})
+            frequency = len(docs.get(doc_id, ()))
+            if not frequency:
+                continue
+            idf = math.log(1 + (total_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            norm = (
+                1 - self.B + self.B * (length / average_length if average_length else 0)
+            )
+            score += idf * frequency * (self.K1 + 1) / (frequency + self.K1 * norm)
+        return score
+
+    def save(self, filename: str, signature: List):
+        """Сохраняет индекс рядом с данными вместе с подписью исходного файла."""
+        tmp_filename = f"{filename}.{os.getpid()}.tmp"
+        with open(tmp_filename, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "signature": signature,
+                    "postings": self.postings,
+                    "doc_lengths": self.doc_lengths,
+                },
+                f,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+        os.replace(tmp_filename, filename)
+
+    @classmethod
+    def load(cls, filename: str, signature: List) -> Optional["InvertedIndex"]:
+        """Загружает индекс, если он построен для той же версии данных."""
+        try:
+            with open(filename, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if data.get("signature") != signature:
+            return None
+
+        index = cls()
+        index.postings = data["postings"]
+        index.doc_lengths = data["doc_lengths"]
+        index.total_length = sum(index.doc_lengths.values())
+        return index
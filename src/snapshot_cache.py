@@ -0,0 +1,92 @@
+import hashlib
+import json
+import marshal
+import os
+import sys
+from typing import Any, Callable, List, Optional
+
+# Формат marshal зависит от версии Python, поэтому она входит в ключ
+CACHE_FORMAT = [1, marshal.version, list(sys.version_info[:2])]
+
+
+def content_key(content: bytes, stat: os.stat_result) -> List:
+    """Ключ версии исходного файла: размер, время изменения и хеш содержимого."""
+    digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+    return [CACHE_FORMAT, stat.st_size, stat.st_mtime_ns, digest]
+
+
+class SnapshotCache:
+    """Двоичная копия разобранного JSON-файла в соседнем файле .snapshot.
+
+    Пока размер, время изменения и хеш исходного файла совпадают с ключом
+    копии, данные читаются через marshal, без разбора JSON. Устаревшая копия
+    пересобирается при следующей загрузке. decode разбирает содержимое
+    исходного файла при промахе.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        cache_filename: Optional[str] = None,
+        decode: Callable[[bytes], Any] = json.loads,
+    ):
+        self.filename = filename
+        self.cache_filename = cache_filename or f"{filename}.snapshot"
+        self.decode = decode
+        self.hits = 0
+        self.misses = 0
+
+    def load(self) -> Any:
+        """Читает исходный файл; ошибки открытия и разбора JSON пробрасываются."""
+        with open(self.filename, "rb") as f:
+            content = f.read()
+            stat = os.fstat(f.fileno())
+        key = content_key(content, stat)
+
+        cached = self.__read()
+        if cached is not None and cached[0] == key:
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        data = self.decode(content)
+        self.__write(key, data)
+        return data
+
+    def store(self, data: Any, content: bytes):
+        """Обновляет копию после записи content в исходный файл."""
+        try:
+            stat = os.stat(self.filename)
+        except OSError:
+            return
+        self.__write(content_key(content, stat), data)
+
+    def invalidate(self):
+        try:
+            os.remove(self.cache_filename)
+        except FileNotFoundError:
+            pass
+
+    def __read(self) -> Optional[list]:
+        try:
+            with open(self.cache_filename, "rb") as f:
+                # loads из памяти в разы быстрее load, читающего файл кусками
+                cached = marshal.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (EOFError, ValueError, TypeError, OSError):
+            return None  # поврежденная или чужая копия просто пересобирается
+        if not isinstance(cached, list) or len(cached) != 2:
+            return None
+        return cached
+
+    def __write(self, key: List, data: Any):
+        tmp_filename = f"{self.cache_filename}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_filename, "wb") as f:
+                f.write(marshal.dumps([key, data]))
+            os.replace(tmp_filename, self.cache_filename)
+        except (OSError, ValueError) as e:
+            print(f"Ошибка сохранения кэша снимка: {e}")
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
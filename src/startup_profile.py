@@ -0,0 +1,83 @@
+import contextlib
+import os
+import re
+import subprocess
+import sys
+import time
+from typing import List, Optional, TextIO, Tuple
+
+# Строка вывода -X importtime: собственное и суммарное время в микросекундах
+IMPORT_TIME_RE = re.compile(r"^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|( *)(\S+)\s*$")
+
+ImportRecord = Tuple[str, float, float, int]
+
+
+def parse_import_times(output: str) -> List[ImportRecord]:
+    """Разбирает вывод -X importtime в записи (модуль, свое, суммарное, уровень)."""
+    records = []
+    for line in output.splitlines():
+        match = IMPORT_TIME_RE.match(line)
+        if match is None:
+            continue
+        own, cumulative, indent, name = match.groups()
+        depth = (len(indent) - 1) // 2
+        records.append((name, int(own) / 1e6, int(cumulative) / 1e6, depth))
+    return records
+
+
+def measure_imports(module: str) -> Tuple[float, List[ImportRecord]]:
+    """Импортирует модуль в новом интерпретаторе с -X importtime.
+
+    Возвращает полное время запуска процесса и записи об импортах.
+    """
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+    )
+    return time.perf_counter() - started, parse_import_times(result.stderr)
+
+
+class StartupProfile:
+    """Замеряет этапы запуска команды и печатает их разбивку."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - started))
+
+    def report(self, out: TextIO, module: Optional[str] = None, top: int = 10):
+        """Печатает этапы и, если задан module, самые долгие импорты."""
+        total = time.perf_counter() - self.started
+        print("Этапы выполнения:", file=out)
+        for name, seconds in self.phases:
+            print(f"  {name:<32}{seconds * 1000:10.1f} мс", file=out)
+        print(f"  {'всего':<32}{total * 1000:10.1f} мс", file=out)
+        if module is None:
+            return
+
+        process_time, records = measure_imports(module)
+        root = [record for record in records if record[3] == 0]
+        imported = sum(cumulative for _, _, cumulative, _ in root)
+        print(f"Холодный запуск процесса с импортом {module}:", file=out)
+        print(f"  {'процесс целиком':<32}{process_time * 1000:10.1f} мс", file=out)
+        print(f"  {'импорт модулей':<32}{imported * 1000:10.1f} мс", file=out)
+        print("Самые долгие импорты (суммарно / собственное время):", file=out)
+        nested = sorted(
+            (record for record in records if record[3] <= 1),
+            key=lambda record: -record[2],
+        )
+        for name, own, cumulative, _ in nested[:top]:
+            print(
+                f"  {name:<32}{cumulative * 1000:10.1f} мс {own * 1000:8.1f} мс",
+                file=out,
+            )
@@ -0,0 +1,212 @@
+import io
+import json
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from lazy_import import lazy_import
+
+gzip = lazy_import("gzip")
+lzma = lazy_import("lzma")
+
+# Раскладка данных и необязательное сжатие; "gzip" и "lzma" — компактный JSON
+FORMATS = ("pretty", "compact", "rows", "gzip", "lzma", "rows+gzip", "rows+lzma")
+DEFAULT_FORMAT = "pretty"
+
+GZIP_MAGIC = b"\x1f\x8b"
+LZMA_MAGIC = b"\xfd7zXZ\x00"
+GZIP_LEVEL = 6
+# Уровень 6 сжимает на ~13% лучше, но в 7 раз медленнее; файл пишется при каждом
+# сохранении, поэтому берем 3
+LZMA_PRESET = 3
+
+ROWS_VERSION = 1
+# Записей в одном куске потоковой записи
+BATCH_SIZE = 1000
+# Сколько байт читать для определения формата
+SNIFF_SIZE = 4096
+
+
+def parse_format(fmt: str) -> Tuple[str, Optional[str]]:
+    """Разбирает имя формата на раскладку и сжатие."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Неизвестный формат хранилища: {fmt}")
+    if fmt in ("gzip", "lzma"):
+        return "compact", fmt
+    layout, _, compression = fmt.partition("+")
+    return layout, compression or None
+
+
+def format_name(layout: str, compression: Optional[str]) -> str:
+    if compression is None:
+        return layout
+    return compression if layout == "compact" else f"{layout}+{compression}"
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _batches(items: List, size: int = BATCH_SIZE) -> Iterator[List]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _row_columns(records: List[Dict]) -> List[str]:
+    """Берет имена полей из первой записи: у записей хранилища они одинаковы."""
+    return list(records[0]) if records else []
+
+
+def _all_records(data: Any) -> bool:
+    # Строка без ключей — список, поэтому в rows попадают только списки словарей
+    return isinstance(data, list) and all(isinstance(item, dict) for item in data)
+
+
+def _iter_compact(data: Any) -> Iterator[str]:
+    if not isinstance(data, list):
+        yield _dumps(data)
+        return
+    yield "["
+    for number, batch in enumerate(_batches(data)):
+        if number:
+            yield ","
+        # Кусок кодируется одним вызовом: так работает быстрый C-кодировщик
+        yield _dumps(batch)[1:-1]
+    yield "]"
+
+
+def _iter_rows(data: List[Dict]) -> Iterator[str]:
+    columns = _row_columns(data)
+    header = {"format": "rows", "version": ROWS_VERSION, "columns": columns}
+    # Заголовок идет первым, чтобы формат определялся по началу файла
+    yield _dumps(header)[:-1] + ',"rows":['
+
+    def row(record):
+        if list(record) == columns:
+            return list(record.values())
+        # Запись с другим набором полей хранится как есть
+        return record
+
+    for number, batch in enumerate(_batches(data)):
+        if number:
+            yield ","
+        yield _dumps([row(record) for record in batch])[1:-1]
+    yield "]}"
+
+
+def _iter_chunks(data: Any, layout: str) -> Iterator[str]:
+    if layout == "pretty":
+        yield json.dumps(data, ensure_ascii=False, indent=2)
+    elif layout == "rows" and _all_records(data):
+        yield from _iter_rows(data)
+    else:
+        yield from _iter_compact(data)
+
+
+def write(f: BinaryIO, data: Any, fmt: str = DEFAULT_FORMAT):
+    """Записывает данные в двоичный файл в формате fmt.
+
+    JSON кодируется кусками по BATCH_SIZE записей и сразу уходит в
+    компрессор, так что несжатый текст целиком в памяти не собирается.
+    """
+    layout, compression = parse_format(fmt)
+    if compression == "gzip":
+        # mtime=0: одинаковые данные дают одинаковые байты
+        stream = gzip.GzipFile(fileobj=f, mode="wb", compresslevel=GZIP_LEVEL, mtime=0)
+    elif compression == "lzma":
+        stream = lzma.LZMAFile(f, "wb", preset=LZMA_PRESET)
+    else:
+        stream = None
+    target = stream or f
+    try:
+        for chunk in _iter_chunks(data, layout):
+            target.write(chunk.encode("utf-8"))
+    finally:
+        if stream is not None:
+            stream.close()
+
+
+def encode(data: Any, fmt: str = DEFAULT_FORMAT) -> bytes:
+    """Возвращает содержимое файла с данными в формате fmt."""
+    buffer = io.BytesIO()
+    write(buffer, data, fmt)
+    return buffer.getvalue()
+
+
+def _compression_of(head: bytes) -> Optional[str]:
+    if head.startswith(GZIP_MAGIC):
+        return "gzip"
+    if head.startswith(LZMA_MAGIC):
+        return "lzma"
+    return None
+
+
+def _open_decompressed(f: BinaryIO, compression: Optional[str]) -> BinaryIO:
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=f, mode="rb")
+    if compression == "lzma":
+        return lzma.LZMAFile(f, "rb")
+    return f
+
+
+def _layout_of(text: bytes) -> str:
+    text = text.lstrip()
+    if text.startswith(b"{") and b'"format"' in text[:64]:
+        return "rows"
+    if text.startswith(b"[") and text[1:2] in (b"\n", b"\r"):
+        return "pretty"
+    return "compact"
+
+
+def detect_format(head: bytes) -> str:
+    """Определяет формат по первым байтам файла (хватает SNIFF_SIZE байт)."""
+    compression = _compression_of(head)
+    if compression is None:
+        return _layout_of(head)
+    stream = _open_decompressed(io.BytesIO(head), compression)
+    try:
+        text = stream.read(64)
+    except (EOFError, OSError, ValueError, lzma.LZMAError):
+        # Начала файла не хватило, чтобы распаковать заголовок
+        text = b""
+    return format_name(_layout_of(text) if text else "compact", compression)
+
+
+def sniff(filename: str) -> str:
+    """Определяет формат существующего файла."""
+    with open(filename, "rb") as f:
+        return detect_format(f.read(SNIFF_SIZE))
+
+
+def _unpack_rows(document: Any) -> Any:
+    if not (isinstance(document, dict) and document.get("format") == "rows"):
+        return document
+    if document.get("version") != ROWS_VERSION:
+        raise ValueError(f"Неизвестная версия формата rows: {document.get('version')}")
+    columns = document["columns"]
+    return [
+        dict(zip(columns, row)) if isinstance(row, list) else row
+        for row in document["rows"]
+    ]
+
+
+def read(f: BinaryIO) -> Any:
+    """Читает данные из двоичного файла любого формата из FORMATS.
+
+    Сжатие определяется по сигнатуре, раскладка rows — по заголовку.
+    Повреждение сжатого файла сообщается как ValueError, как и ошибки JSON.
+    """
+    head = f.read(len(LZMA_MAGIC))
+    f.seek(0)
+    compression = _compression_of(head)
+    if compression is None:
+        content = f.read()
+    else:
+        try:
+            content = _open_decompressed(f, compression).read()
+        except (EOFError, OSError, lzma.LZMAError) as e:
+            raise ValueError(f"Поврежденный файл {compression}: {e}") from e
+    return _unpack_rows(json.loads(content))
+
+
+def decode(content: bytes) -> Any:
+    """Разбирает содержимое файла любого формата из FORMATS."""
+    return read(io.BytesIO(content))
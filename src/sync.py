@@ -0,0 +1,105 @@
+import json
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, Optional
+
+from api_connectors import APIConnector
+from data_savers import ADDED, FAILED, SKIPPED, UNCHANGED, UPDATED, DataSaver
+from pipeline import dedupe, hh_item_to_vacancy, parse_items
+from vacancy import Vacancy
+
+# Запас на расхождение часов и задержку индексации на стороне hh.ru: вакансии
+# из перекрытия придут повторно и будут отмечены как неизмененные
+DEFAULT_OVERLAP = timedelta(minutes=10)
+
+
+def normalize_query(query: str) -> str:
+    """Приводит запрос к виду ключа водяной отметки."""
+    return " ".join(query.lower().split())
+
+
+def format_watermark(moment: datetime) -> str:
+    """Форматирует момент времени так, как его принимает date_from hh.ru."""
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S%z")
+
+
+class WatermarkStore:
+    """Хранит для каждого запроса момент последней успешной синхронизации."""
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.__lock = threading.Lock()
+        self.__watermarks: Dict[str, str] = self.__load()
+
+    def __load(self) -> Dict[str, str]:
+        try:
+            with open(self.filename, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            print(f"Ошибка загрузки файла {self.filename}: {e}")
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def get(self, query: str) -> Optional[str]:
+        return self.__watermarks.get(normalize_query(query))
+
+    def set(self, query: str, watermark: str):
+        with self.__lock:
+            self.__watermarks[normalize_query(query)] = watermark
+
+    def save(self):
+        """Атомарно записывает отметки в файл."""
+        with self.__lock:
+            data = dict(self.__watermarks)
+        directory = os.path.dirname(self.filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_filename = f"{self.filename}.{os.getpid()}.tmp"
+        with open(tmp_filename, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_filename, self.filename)
+
+    def __len__(self):
+        return len(self.__watermarks)
+
+
+def count_statuses(statuses: Iterable[str]) -> Dict[str, int]:
+    """Считает результаты upsert_vacancies по видам."""
+    counts = {status: 0 for status in (ADDED, UPDATED, UNCHANGED, SKIPPED, FAILED)}
+    for status in statuses:
+        counts[status] += 1
+    return counts
+
+
+def sync_query(
+    connector: APIConnector,
+    saver: DataSaver,
+    query: str,
+    watermarks: WatermarkStore,
+    mapper: Callable[[Dict], Vacancy] = hh_item_to_vacancy,
+    overlap: timedelta = DEFAULT_OVERLAP,
+) -> Dict[str, int]:
+    """Загружает вакансии, появившиеся после прошлой синхронизации запроса.
+
+    Изменившиеся вакансии обновляются по URL. Отметка сдвигается только
+    после успешного сохранения, иначе следующий запуск повторит тот же отрезок,
+    поэтому коннектор должен пробрасывать ошибки (HHruConnector(raise_errors=True)).
+    """
+    started_at = datetime.now(timezone.utc)
+    items = connector.iter_vacancies(query, date_from=watermarks.get(query))
+    vacancies = list(dedupe(parse_items(items, mapper)))
+    counts = count_statuses(saver.upsert_vacancies(vacancies))
+    if not counts[FAILED]:
+        watermarks.set(query, format_watermark(started_at - overlap))
+        watermarks.save()
+    return counts
+
+
+def describe_counts(counts: Dict[str, int]) -> str:
+    return (
+        f"добавлено: {counts[ADDED]}, обновлено: {counts[UPDATED]}, "
+        f"без изменений: {counts[UNCHANGED]}, пропущено: {counts[SKIPPED]}"
+    )
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Any, Dict, Iterator, List, Mapping, Sequence, Union
 
 
 class Vacancy:
@@ -43,13 +43,13 @@ class Vacancy:
         return self.__description
 
     def __lt__(self, other):
-        return self.__salary_from < other.__salary_from
+        return self.__salary_from < other.salary_from
 
     def __gt__(self, other):
-        return self.__salary_from > other.__salary_from
+        return self.__salary_from > other.salary_from
 
     def __eq__(self, other):
-        return self.__salary_from == other.__salary_from
+        return self.__salary_from == other.salary_from
 
     def __validate_data(self):
         if self.__salary_from is None:
@@ -57,3 +57,87 @@ class Vacancy:
 
     def __str__(self):
         return f"Вакансия: {self.__title}\nURL: {self.__url}\nЗарплата от: {self.__salary_from}\nЗарплата до: {self.__salary_to}\nОписание: {self.__description}\n"
+
+
+class VacancyView:
+    """Легковесное представление вакансии поверх сохраненной записи.
+
+    Повторяет интерфейс Vacancy, но не копирует данные: поля читаются
+    из записи при обращении. Полный объект создается методом materialize.
+    """
+
+    __slots__ = ("__record",)
+
+    def __init__(self, record: Mapping[str, Any]):
+        self.__record = record
+
+    @property
+    def title(self):
+        return self.__record["title"]
+
+    @property
+    def url(self):
+        return self.__record["url"]
+
+    @property
+    def salary_from(self):
+        value = self.__record.get("salary_from")
+        return value if value is not None else 0
+
+    @property
+    def salary_to(self):
+        value = self.__record.get("salary_to")
+        return value if value is not None else 0
+
+    @property
+    def description(self):
+        return self.__record.get("description")
+
+    def materialize(self) -> Vacancy:
+        """Создает полноценный объект Vacancy."""
+        return Vacancy(
+            title=self.title,
+            url=self.url,
+            salary_from=self.salary_from,
+            salary_to=self.salary_to,
+            description=self.description,
+        )
+
+    def __setattr__(self, name, value):
+        if name != "_VacancyView__record" or hasattr(self, name):
+            raise AttributeError("VacancyView доступен только для чтения")
+        object.__setattr__(self, name, value)
+
+    def __lt__(self, other):
+        return self.salary_from < other.salary_from
+
+    def __gt__(self, other):
+        return self.salary_from > other.salary_from
+
+    def __eq__(self, other):
+        return self.salary_from == other.salary_from
+
+    def __str__(self):
+        return f"Вакансия: {self.title}\nURL: {self.url}\nЗарплата от: {self.salary_from}\nЗарплата до: {self.salary_to}\nОписание: {self.description}\n"
+
+
+class LazyVacancyList(Sequence):
+    """Последовательность вакансий, создающая представления только при обращении."""
+
+    def __init__(self, records: Sequence[Dict]):
+        self.__records = records
+
+    def __len__(self):
+        return len(self.__records)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return LazyVacancyList(self.__records[index])
+        return VacancyView(self.__records[index])
+
+    def __iter__(self) -> Iterator[VacancyView]:
+        return (VacancyView(record) for record in self.__records)
+
+    def materialize(self) -> List[Vacancy]:
+        """Создает список полноценных объектов Vacancy."""
+        return [view.materialize() for view in self]
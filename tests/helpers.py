@@ -0,0 +1,10 @@
+def make_item(
+    number=0, salary_from=None, salary_to=None, requirement=None, url=None, name=None
+):
+    """Создает вакансию в формате hh.ru."""
+    return {
+        "name": name or f"Vacancy {number}",
+        "alternate_url": url or f"http://test.com/{number}",
+        "salary": {"from": salary_from, "to": salary_to},
+        "snippet": {"requirement": requirement},
+    }
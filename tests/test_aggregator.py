@@ -0,0 +1,166 @@
+import io
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+)
+
+from src.aggregator import Aggregator, Source, url_hash
+from src.api_connectors import APIConnector, SuperJobConnector
+from src.http_client import HttpClient
+from src.pipeline import superjob_item_to_vacancy
+from tests.helpers import make_item
+
+
+class SlowConnector(APIConnector):
+    """Коннектор, который отдает вакансии с задержкой."""
+
+    def __init__(self, items, delay=0.0, error=None):
+        self.items = items
+        self.delay = delay
+        self.error = error
+
+    def get_vacancies(self, query, date_from=None):
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.items
+
+
+class TestAggregator(unittest.TestCase):
+
+    def test_url_hash_normalization(self):
+        """Проверяет, что одинаковые по смыслу URL дают один хеш."""
+        self.assertEqual(
+            url_hash("HTTPS://HH.ru/vacancy/1/?b=2&a=1#top"),
+            url_hash("https://hh.ru/vacancy/1?a=1&b=2"),
+        )
+        self.assertNotEqual(
+            url_hash("https://hh.ru/vacancy/1"), url_hash("https://hh.ru/vacancy/2")
+        )
+
+    def test_merges_sources_concurrently_without_duplicates(self):
+        """Проверяет слияние источников и время, равное самому медленному."""
+        first = SlowConnector(
+            [make_item(url="http://a.com/1"), make_item(url="http://a.com/2")], 0.15
+        )
+        second = SlowConnector(
+            [make_item(url="http://a.com/2/"), make_item(url="http://b.com")], 0.25
+        )
+        aggregator = Aggregator([Source("first", first), Source("second", second)])
+
+        started = time.monotonic()
+        vacancies = aggregator.get_vacancies("python")
+        elapsed = time.monotonic() - started
+
+        self.assertEqual(len(vacancies), 3)
+        self.assertEqual(
+            {v.url for v in vacancies},
+            {"http://a.com/1", "http://a.com/2", "http://b.com"},
+        )
+        self.assertLess(elapsed, 0.4)
+        self.assertEqual(aggregator.last_report["first"]["status"], "ok")
+        self.assertEqual(
+            aggregator.last_report["first"]["count"]
+            + aggregator.last_report["second"]["count"],
+            3,
+        )
+
+    def test_partial_failure_and_timeout(self):
+        """Проверяет, что сбой и зависание источника не мешают остальным."""
+        aggregator = Aggregator(
+            [
+                Source("ok", SlowConnector([make_item(url="http://a.com")])),
+                Source(
+                    "broken",
+                    SlowConnector([], error=requests.exceptions.ConnectionError("нет")),
+                ),
+                Source(
+                    "slow",
+                    SlowConnector([make_item(url="http://b.com")], 5),
+                    timeout=0.1,
+                ),
+            ]
+        )
+
+        started = time.monotonic()
+        with patch("sys.stdout"):
+            vacancies = aggregator.get_vacancies("python")
+
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual([v.url for v in vacancies], ["http://a.com"])
+        report = aggregator.last_report
+        self.assertEqual(report["ok"]["status"], "ok")
+        self.assertEqual(report["broken"]["status"], "error")
+        self.assertEqual(report["slow"]["status"], "timeout")
+
+    def test_duplicate_source_names(self):
+        """Проверяет запрет одинаковых имен источников."""
+        connector = SlowConnector([])
+        with self.assertRaises(ValueError):
+            Aggregator([Source("hh", connector), Source("hh", connector)])
+
+
+class TestSuperJobConnector(unittest.TestCase):
+
+    @patch("requests.Session.get")
+    def test_pagination_and_mapping(self, mock_get):
+        """Проверяет обход страниц SuperJob и преобразование схемы."""
+        pages = [
+            {
+                "objects": [
+                    {
+                        "profession": "Python Dev",
+                        "link": "https://superjob.ru/v/1",
+                        "payment_from": 100000,
+                        "payment_to": 0,
+                        "candidat": "Django",
+                    }
+                ],
+                "more": True,
+            },
+            {"objects": [], "more": False},
+        ]
+        responses = []
+        for page in pages:
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = page
+            responses.append(response)
+        mock_get.side_effect = responses
+
+        connector = SuperJobConnector("secret", http_client=HttpClient())
+        items = connector.get_vacancies("python", date_from="2026-01-01T00:00:00+0000")
+
+        self.assertEqual(mock_get.call_count, 2)
+        kwargs = mock_get.call_args_list[0].kwargs
+        self.assertEqual(kwargs["headers"], {"X-Api-App-Id": "secret"})
+        self.assertEqual(kwargs["params"]["date_published_from"], 1767225600)
+        vacancy = superjob_item_to_vacancy(items[0])
+        self.assertEqual(vacancy.salary_from, 100000)
+        self.assertEqual(vacancy.salary_to, 0)
+        self.assertEqual(vacancy.description, "Django")
+
+    @patch("requests.Session.get")
+    def test_malformed_date_from(self, mock_get):
+        """Проверяет, что неверная дата не прерывает работу и не уходит в API."""
+        connector = SuperJobConnector("secret", http_client=HttpClient())
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            self.assertEqual(connector.get_vacancies("python", "2026-13-01"), [])
+        self.assertIn("Неверный формат date_from", stdout.getvalue())
+        mock_get.assert_not_called()
+
+        connector.raise_errors = True
+        with self.assertRaises(ValueError):
+            connector.get_vacancies("python", "вчера")
+
+
+if __name__ == "__main__":
+    unittest.main()
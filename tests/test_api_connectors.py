@@ -10,6 +10,7 @@ sys.path.insert(
 )
 
 from src.api_connectors import HHruConnector
+from src.http_client import HttpClient
 
 
 class TestHHruConnector(unittest.TestCase):
@@ -21,7 +22,7 @@ class TestHHruConnector(unittest.TestCase):
         if not hasattr(self.connector, "init"):
             self.connector.init = lambda self: None
 
-    @patch("src.api_connectors.requests.get")
+    @patch("requests.Session.get")
     def test_get_vacancies_success(self, mock_get):
         """Проверяет успешное получение вакансий."""
 
@@ -37,10 +38,61 @@ class TestHHruConnector(unittest.TestCase):
 
         mock_get.assert_called_once_with(
             self.connector.__base_url,
-            params={"text": "test", "area": 113, "per_page": 100},
+            params={"text": "test", "area": 113, "per_page": 100, "page": 0},
+            headers=None,
+            timeout=10.0,
         )
 
-    @patch("src.api_connectors.requests.get")
+    @patch("requests.Session.get")
+    def test_get_vacancies_date_from(self, mock_get):
+        """Проверяет передачу date_from и проброс ошибок при raise_errors."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"items": [], "pages": 1}
+        mock_get.return_value = mock_response
+
+        self.connector.get_vacancies("test", date_from="2026-01-01T00:00:00+0000")
+
+        params = mock_get.call_args.kwargs["params"]
+        self.assertEqual(params["date_from"], "2026-01-01T00:00:00+0000")
+
+        mock_get.side_effect = requests.exceptions.ConnectionError("нет связи")
+        connector = HHruConnector(http_client=HttpClient(retries=0), raise_errors=True)
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            connector.get_vacancies("test")
+
+    @patch("requests.Session.get")
+    def test_get_vacancies_all_pages_in_order(self, mock_get):
+        """Проверяет обход всех страниц выдачи с сохранением порядка."""
+
+        def fake_get(url, params, headers, timeout):
+            page = params["page"]
+            response = MagicMock()
+            response.json.return_value = {
+                "items": [{"id": page * 10 + i} for i in range(2)],
+                "pages": 4,
+            }
+            return response
+
+        mock_get.side_effect = fake_get
+        connector = HHruConnector(max_workers=3)
+
+        vacancies = connector.get_vacancies("test")
+
+        self.assertEqual([v["id"] for v in vacancies], [0, 1, 10, 11, 20, 21, 30, 31])
+        self.assertEqual(mock_get.call_count, 4)
+
+    @patch("requests.Session.get")
+    def test_get_vacancies_respects_result_cap(self, mock_get):
+        """Проверяет ограничение в 2000 результатов на запрос."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"items": [], "pages": 50}
+        mock_get.return_value = mock_response
+
+        HHruConnector(per_page=100, http_client=HttpClient()).get_vacancies("test")
+
+        self.assertEqual(mock_get.call_count, 20)
+
+    @patch("requests.Session.get")
     def test_get_vacancies_api_error(self, mock_get):
         """Проверяет обработку ошибки API."""
 
@@ -50,7 +102,7 @@ class TestHHruConnector(unittest.TestCase):
 
         self.assertEqual(len(vacancies), 0)
 
-    @patch("src.api_connectors.requests.get")
+    @patch("requests.Session.get")
     def test_get_vacancies_empty_response(self, mock_get):
         """Проверяет обработку пустого ответа от API."""
 
@@ -63,7 +115,7 @@ class TestHHruConnector(unittest.TestCase):
 
         self.assertEqual(len(vacancies), 0)
 
-    @patch("src.api_connectors.requests.get")
+    @patch("requests.Session.get")
     def test_send_request_success(self, mock_get):
         """Проверяет успешную отправку запроса."""
 
@@ -77,7 +129,7 @@ class TestHHruConnector(unittest.TestCase):
 
         self.assertEqual(response.status_code, 200)
 
-    @patch("src.api_connectors.requests.get")
+    @patch("requests.Session.get")
     def test_send_request_http_error(self, mock_get):
         """Проверяет обработку HTTP ошибки."""
 
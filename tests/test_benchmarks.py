@@ -0,0 +1,67 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+)
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
+)
+
+from benchmarks.generator import VacancyGenerator
+from benchmarks.hh_stub import HHStubServer
+from benchmarks.run import compare, run_benchmarks
+from src.api_connectors import HHruConnector
+from src.http_client import HttpClient
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_generator_is_deterministic(self):
+        """Проверяет, что один seed дает одни и те же вакансии."""
+        first = list(VacancyGenerator(7).records(50))
+        second = list(VacancyGenerator(7).records(50))
+        other = list(VacancyGenerator(8).records(50))
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+        self.assertEqual(len({record["url"] for record in first}), 50)
+
+    def test_stub_server_paginates_like_hh(self):
+        """Проверяет, что коннектор выкачивает все страницы локальной замены."""
+        client = HttpClient()
+        with HHStubServer(found=250) as server:
+            connector = HHruConnector(
+                per_page=100, http_client=client, base_url=server.url
+            )
+            items = connector.get_vacancies("python")
+            requests = server.requests
+        client.close()
+
+        self.assertEqual(len(items), 250)
+        self.assertEqual(requests, 3)
+        self.assertEqual(items[0]["alternate_url"], "https://hh.ru/vacancy/0")
+
+    def test_run_benchmarks_report(self):
+        """Проверяет структуру отчета и поиск регрессий."""
+        report = run_benchmarks([30], repeat=1, latency=0, connector_found=50)
+
+        names = {result["name"] for result in report["results"]}
+        self.assertIn("json_saver.load", names)
+        self.assertIn("json_saver.load_snapshot", names)
+        self.assertIn("json_saver.search_vacancies", names)
+        self.assertIn("hh_connector.iter_vacancies", names)
+        self.assertIn("storage_format.rows+gzip.decode", names)
+        for result in report["results"]:
+            self.assertGreaterEqual(result["median"], 0)
+
+        slower = {
+            "results": [dict(r, median=r["median"] / 10 - 1) for r in report["results"]]
+        }
+        self.assertEqual(compare(report, report, 1.2), [])
+        self.assertEqual(len(compare(report, slower, 1.2)), len(report["results"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
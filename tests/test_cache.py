@@ -0,0 +1,114 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+)
+
+from src.cache import ResponseCache
+from src.http_client import HttpClient
+
+
+class ETagHandler(BaseHTTPRequestHandler):
+    """Обработчик заглушки API, поддерживающий If-None-Match."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.requests += 1
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps({"items": [{"path": self.path}]}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        """Сетап для тестов"""
+        self.directory = tempfile.mkdtemp()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), ETagHandler)
+        self.server.requests = 0
+        self.thread = threading.Thread(
+            target=self.server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            daemon=True,
+        )
+        self.thread.start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/vacancies"
+
+    def tearDown(self):
+        """Выход"""
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_fresh_entry_served_from_cache(self):
+        """Проверяет, что повторный запрос не уходит в сеть."""
+        cache = ResponseCache(self.directory, ttl=60)
+        client = HttpClient(cache=cache)
+
+        first = client.get(self.url, params={"text": "python"})
+        second = client.get(self.url, params={"text": "  python "})
+
+        self.assertEqual(first.json(), second.json())
+        self.assertEqual(self.server.requests, 1)
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 1, "revalidations": 0})
+
+    def test_stale_entry_revalidated_with_etag(self):
+        """Проверяет ревалидацию устаревшей записи через ETag."""
+        cache = ResponseCache(self.directory, ttl=0)
+        client = HttpClient(cache=cache)
+
+        first = client.get(self.url, params={"text": "python"})
+        second = client.get(self.url, params={"text": "python"})
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(first.json(), second.json())
+        self.assertEqual(self.server.requests, 2)
+        self.assertEqual(cache.stats()["revalidations"], 1)
+
+    def test_lru_eviction(self):
+        """Проверяет вытеснение давно не использованных записей."""
+        cache = ResponseCache(self.directory, ttl=60, max_bytes=600)
+        client = HttpClient(cache=cache)
+
+        for page in range(5):
+            client.get(self.url, params={"page": page})
+
+        size = sum(
+            os.path.getsize(os.path.join(self.directory, name))
+            for name in os.listdir(self.directory)
+        )
+        self.assertLessEqual(size, 600)
+        self.assertIsNotNone(cache.get(cache.make_key(self.url, {"page": 4})))
+        self.assertIsNone(cache.get(cache.make_key(self.url, {"page": 0})))
+
+    def test_make_key_normalizes_params(self):
+        """Проверяет нормализацию параметров в ключе."""
+        self.assertEqual(
+            ResponseCache.make_key("u", {"b": 1, "a": " x  y ", "c": None}),
+            ResponseCache.make_key("u", {"a": "x y", "b": "1"}),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
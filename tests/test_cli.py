@@ -0,0 +1,206 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import requests
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+)
+
+from src.cli import EXIT_FAILURE, EXIT_OK, EXIT_USAGE, main, parse_where
+from tests.helpers import make_item
+
+
+class TestCli(unittest.TestCase):
+
+    def setUp(self):
+        """Сетап для тестов"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.storage = os.path.join(self.tmp.name, "vacancies.json")
+
+    def tearDown(self):
+        """Выход"""
+        self.tmp.cleanup()
+
+    def run_cli(self, *argv):
+        """Запускает CLI и возвращает код выхода, stdout и stderr."""
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout, patch(
+            "sys.stderr", new_callable=io.StringIO
+        ) as stderr:
+            code = main(["--storage", self.storage, *argv])
+        return code, stdout.getvalue(), stderr.getvalue()
+
+    @patch("src.cli.HHruConnector")
+    def test_fetch_many_queries_single_persist(self, mock_connector):
+        """Проверяет параллельную загрузку запросов и одно сохранение."""
+        pages = {
+            "python": [make_item(1, 100), make_item(2, 300)],
+            "java": [make_item(2, 300), make_item(3, 200)],
+        }
+        mock_connector.return_value.get_vacancies.side_effect = pages.__getitem__
+        queries_file = os.path.join(self.tmp.name, "queries.txt")
+        with open(queries_file, "w", encoding="utf-8") as f:
+            f.write("# комментарий\njava\n\n")
+
+        with patch("src.cli.JSONSaver._save_data") as mock_save:
+            code, stdout, stderr = self.run_cli(
+                "--format",
+                "json",
+                "fetch",
+                "python",
+                "--queries-file",
+                queries_file,
+                "--no-cache",
+            )
+
+        self.assertEqual(code, EXIT_OK)
+        self.assertEqual(mock_save.call_count, 1)
+        urls = [json.loads(line)["url"] for line in stdout.splitlines()]
+        self.assertEqual(
+            urls, ["http://test.com/1", "http://test.com/2", "http://test.com/3"]
+        )
+        self.assertIn("добавлено: 3", stderr)
+        self.assertEqual(mock_connector.call_count, 1)
+
+    @patch("src.cli.HHruConnector")
+    def test_fetch_partial_failure(self, mock_connector):
+        """Проверяет код выхода при сбое одного из запросов."""
+
+        def get_vacancies(query):
+            if query == "bad":
+                raise requests.exceptions.ConnectionError("нет связи")
+            return [make_item(1)]
+
+        mock_connector.return_value.get_vacancies.side_effect = get_vacancies
+
+        code, stdout, stderr = self.run_cli("fetch", "good", "bad", "--no-cache")
+
+        self.assertEqual(code, EXIT_FAILURE)
+        self.assertIn("Vacancy 1", stdout)
+        self.assertIn("Ошибка запроса 'bad'", stderr)
+
+    @patch("src.cli.HHruConnector")
+    def test_fetch_incremental(self, mock_connector):
+        """Проверяет инкрементальную загрузку с отметками и обновлениями."""
+        watermarks = os.path.join(self.tmp.name, "watermarks.json")
+        get_vacancies = mock_connector.return_value.get_vacancies
+        get_vacancies.return_value = [make_item(1, 100)]
+        args = ("fetch", "python", "--incremental", "--watermarks", watermarks)
+
+        code, _, stderr = self.run_cli(*args, "--no-cache")
+        self.assertEqual(code, EXIT_OK)
+        self.assertIn("добавлено: 1", stderr)
+        get_vacancies.assert_called_with("python", None)
+        with open(watermarks, encoding="utf-8") as f:
+            watermark = json.load(f)["python"]
+
+        get_vacancies.return_value = [make_item(1, 200)]
+        code, stdout, stderr = self.run_cli(*args, "--no-cache")
+        self.assertEqual(code, EXIT_OK)
+        self.assertIn("обновлено: 1", stderr)
+        self.assertIn("Vacancy 1", stdout)
+        get_vacancies.assert_called_with("python", watermark)
+
+    def test_top_search_export_delete(self):
+        """Проверяет команды чтения и удаления на сохраненных данных."""
+        records = [
+            {
+                "id": str(number),
+                "title": f"Vacancy {number}",
+                "url": f"http://test.com/{number}",
+                "salary_from": number * 100,
+                "salary_to": None,
+                "description": f"python {number}" if number % 2 else "java",
+            }
+            for number in range(1, 5)
+        ]
+        with open(self.storage, "w", encoding="utf-8") as f:
+            json.dump(records, f)
+
+        code, stdout, _ = self.run_cli("--format", "json", "top", "2")
+        self.assertEqual(code, EXIT_OK)
+        self.assertEqual(
+            [json.loads(line)["salary_from"] for line in stdout.splitlines()],
+            [400, 300],
+        )
+
+        code, stdout, _ = self.run_cli("--format", "json", "search", "python")
+        self.assertEqual(code, EXIT_OK)
+        self.assertEqual(len(stdout.splitlines()), 2)
+        self.assertEqual(self.run_cli("search", "rust")[0], EXIT_FAILURE)
+
+        output = os.path.join(self.tmp.name, "export.jsonl")
+        code, _, stderr = self.run_cli(
+            "--format",
+            "json",
+            "export",
+            "--where",
+            "salary_from__gte=300",
+            "-o",
+            output,
+        )
+        self.assertEqual(code, EXIT_OK)
+        with open(output, encoding="utf-8") as f:
+            self.assertEqual(len(f.readlines()), 2)
+
+        code, stdout, _ = self.run_cli(
+            "delete", "http://test.com/1", "http://test.com/missing"
+        )
+        self.assertEqual(code, EXIT_FAILURE)
+        self.assertIn("deleted\thttp://test.com/1", stdout)
+        self.assertIn("not_found\thttp://test.com/missing", stdout)
+
+    def test_dedupe(self):
+        """Проверяет удаление почти одинаковых вакансий."""
+        description = "Опыт разработки на Python от трех лет, Django и PostgreSQL"
+        records = [
+            {
+                "id": str(number),
+                "title": "Python Developer",
+                "url": f"http://test.com/{number}",
+                "salary_from": None,
+                "salary_to": None,
+                "description": description,
+            }
+            for number in range(1, 4)
+        ]
+        with open(self.storage, "w", encoding="utf-8") as f:
+            json.dump(records, f)
+
+        code, stdout, _ = self.run_cli("--format", "json", "dedupe", "--dry-run")
+        self.assertEqual(code, EXIT_OK)
+        self.assertEqual(
+            json.loads(stdout)["duplicates"],
+            ["http://test.com/2", "http://test.com/3"],
+        )
+
+        self.assertEqual(self.run_cli("dedupe")[0], EXIT_OK)
+        with open(self.storage, encoding="utf-8") as f:
+            self.assertEqual(len(json.load(f)), 1)
+
+    def test_usage_errors(self):
+        """Проверяет коды выхода при ошибках в аргументах."""
+        self.assertEqual(self.run_cli("fetch")[0], EXIT_USAGE)
+        self.assertEqual(self.run_cli("export", "--where", "broken")[0], EXIT_USAGE)
+        code, _, err = self.run_cli("export", "--where", "salary_from__foo=1")
+        self.assertEqual(code, EXIT_USAGE)
+        self.assertIn("Неизвестный оператор", err)
+        with self.assertRaises(SystemExit) as exit_info:
+            self.run_cli("unknown")
+        self.assertEqual(exit_info.exception.code, EXIT_USAGE)
+
+    def test_parse_where(self):
+        """Проверяет разбор условий выгрузки."""
+        self.assertEqual(
+            parse_where(["salary_from__between=100,200", "title__icontains=python"]),
+            {"salary_from__between": [100, 200], "title__icontains": "python"},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+)
+
+from src.columnar import ColumnarStore, np
+from src.data_savers import JSONSaver
+
+RECORDS = [
+    {"title": "Python Dev", "url": "a", "salary_from": 100, "salary_to": 200},
+    {"title": "Go Dev", "url": "b", "salary_from": 300, "salary_to": None},
+    {"title": "python QA", "url": "c", "salary_from": None, "salary_to": 150},
+    {"title": "Rust Dev", "url": "d", "salary_from": 300, "salary_to": 500},
+]
+for record in RECORDS:
+    record["description"] = None
+
+
+class ColumnarStoreCases:
+    """Общие проверки для обоих вариантов хранилища."""
+
+    use_numpy = False
+
+    def setUp(self):
+        """Сетап для тестов"""
+        self.store = ColumnarStore.from_records(RECORDS, use_numpy=self.use_numpy)
+
+    def test_filter_salary_range(self):
+        """Проверяет пакетную фильтрацию по зарплате."""
+        self.assertEqual(self.store.filter({"salary_from__gte": 200}), [1, 3])
+        self.assertEqual(self.store.filter({"salary_to__between": (150, 300)}), [0, 2])
+
+    def test_filter_mixed_predicates(self):
+        """Проверяет сочетание векторных и построчных условий."""
+        criteria = {"salary_from__gt": 50, "title__icontains": "dev"}
+        self.assertEqual(self.store.filter(criteria), [0, 1, 3])
+        criteria = {"or": [{"url": "c"}, {"salary_to__gte": 500}]}
+        self.assertEqual(self.store.filter(criteria), [2, 3])
+
+    def test_top_by_salary(self):
+        """Проверяет top-N с устойчивым порядком при равенстве."""
+        top = self.store.top_by_salary(3)
+        self.assertEqual([v.url for v in top], ["b", "d", "a"])
+        top = self.store.top_by_salary(2, field="midpoint")
+        self.assertEqual([v.url for v in top], ["d", "b"])
+
+    def test_missing_salary_is_null(self):
+        """Проверяет, что пустая зарплата не проходит сравнения, как в query.py."""
+        self.assertEqual(self.store.filter({"salary_from__lt": 200}), [0])
+        self.assertEqual(self.store.filter({"salary_to__lte": 200}), [0, 2])
+        self.assertEqual(self.store.filter({"salary_from__ne": 300}), [0, 2])
+        self.assertEqual(self.store.filter({"salary_from": 0}), [])
+        self.assertEqual(
+            self.store.filter({"or": [{"salary_from__lt": 200}, {"url": "d"}]}), [0, 3]
+        )
+        self.assertIsNone(self.store.row(2)["salary_from"])
+        self.assertEqual(self.store.vacancy(2).salary_from, 0)
+
+    def test_top_by_salary_with_ties(self):
+        """Проверяет частичный отбор на колонке с большим числом равных."""
+        records = [
+            {"title": f"Dev {i}", "url": str(i), "salary_from": (i * 7) % 5 * 100}
+            for i in range(40)
+        ]
+        store = ColumnarStore.from_records(records, use_numpy=self.use_numpy)
+        expected = sorted(range(40), key=lambda i: -records[i]["salary_from"])
+        for n in (1, 5, 8, 9, 40, 50):
+            top = store.top_by_salary(n)
+            self.assertEqual([v.url for v in top], [str(i) for i in expected[:n]])
+
+    def test_append_after_query(self):
+        """Проверяет, что добавление после выборки не рассогласует колонки."""
+        self.assertEqual(self.store.filter({"salary_from__gte": 200}), [1, 3])
+        self.store.top_by_salary(1)
+        self.store.salary_stats()
+
+        self.store.append(
+            {"title": "Java Dev", "url": "e", "salary_from": 400, "salary_to": 600}
+        )
+        columns = (
+            self.store.titles,
+            self.store.urls,
+            self.store.descriptions,
+            self.store.salary_from,
+            self.store.salary_to,
+        )
+        self.assertEqual({len(column) for column in columns}, {5})
+        self.assertEqual(self.store.filter({"salary_from__gte": 200}), [1, 3, 4])
+        self.assertEqual(self.store.row(4)["url"], "e")
+
+    def test_salary_stats(self):
+        """Проверяет агрегаты без учета пустых зарплат."""
+        stats = self.store.salary_stats("salary_from")
+        self.assertEqual(stats["count"], 3)
+        self.assertEqual(stats["min"], 100)
+        self.assertEqual(stats["max"], 300)
+        self.assertAlmostEqual(stats["mean"], 700 / 3)
+        self.assertEqual(stats["median"], 300)
+        self.assertEqual(self.store.salary_stats("salary_to", rows=[1])["count"], 0)
+
+
+class TestColumnarStoreArray(ColumnarStoreCases, unittest.TestCase):
+    use_numpy = False
+
+    def test_titles_are_interned(self):
+        """Проверяет интернирование строк."""
+        store = ColumnarStore.from_records(
+            [dict(RECORDS[0]), dict(RECORDS[0], url="e")], use_numpy=False
+        )
+        self.assertIs(store.titles[0], store.titles[1])
+
+    def test_from_saver(self):
+        """Проверяет загрузку колонок из хранилища."""
+        saver = JSONSaver()
+        saver.data = [dict(record) for record in RECORDS]
+
+        with patch.object(JSONSaver, "_dict_to_vacancy") as mock_convert:
+            store = ColumnarStore.from_saver(saver, use_numpy=False)
+            mock_convert.assert_not_called()
+
+        self.assertEqual(list(store.salary_from), [100, 300, 0, 300])
+        self.assertEqual(store.urls, ["a", "b", "c", "d"])
+
+
+@unittest.skipIf(np is None, "NumPy не установлен")
+class TestColumnarStoreNumpy(ColumnarStoreCases, unittest.TestCase):
+    use_numpy = True
+
+
+if __name__ == "__main__":
+    unittest.main()
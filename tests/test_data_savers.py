@@ -1,6 +1,8 @@
 import json
 import os
+import shutil
 import sys
+import tempfile
 import unittest
 from unittest.mock import mock_open, patch
 
@@ -8,8 +10,19 @@ sys.path.insert(
     0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
 )
 
-from src.data_savers import DataSaver, JSONSaver
-from src.vacancy import Vacancy
+from src.data_savers import (
+    FAILED,
+    DataSaver,
+    JSONLSaver,
+    JSONSaver,
+    ShardedSaver,
+    SQLiteSaver,
+    convert_json_to_jsonl,
+    migrate_json_to_shards,
+    migrate_json_to_sqlite,
+    shard_of,
+)
+from vacancy import Vacancy
 
 
 class TestJSONSaver(unittest.TestCase):
@@ -20,15 +33,16 @@ class TestJSONSaver(unittest.TestCase):
         self.saver = JSONSaver()
         self.saver.filename = self.TEST_FILENAME
 
-        self.saver.__init__(filename=self.TEST_FILENAME)
+        self.saver.__init__(filename=self.TEST_FILENAME, binary_cache=False)
 
         self.saver.data = []
         self.mock_file = None
 
     def tearDown(self):
         """Выход"""
-        if os.path.exists(self.TEST_FILENAME):
-            os.remove(self.TEST_FILENAME)
+        for filename in (self.TEST_FILENAME, f"{self.TEST_FILENAME}.lock"):
+            if os.path.exists(filename):
+                os.remove(filename)
 
     @patch("src.data_savers.open", new_callable=mock_open, read_data="[]")
     def test_load_data_empty_file(self, mock_open_func):
@@ -51,6 +65,742 @@ class TestJSONSaver(unittest.TestCase):
         data = self.saver._JSONSaver__load_data()
         self.assertEqual(data, [])
 
+    def test_add_vacancy_rejects_duplicates(self):
+        """Проверяет отказ при совпадении URL или названия."""
+        self.assertTrue(self.saver.add_vacancy(Vacancy("Python Dev", "http://a.com")))
+        self.assertFalse(self.saver.add_vacancy(Vacancy("Other", "http://a.com")))
+        self.assertFalse(
+            self.saver.add_vacancy(Vacancy(" python  dev", "http://b.com"))
+        )
+        self.assertEqual(len(self.saver.data), 1)
+
+    def test_delete_vacancy_updates_indexes(self):
+        """Проверяет, что после удаления вакансию можно добавить снова."""
+        vacancy = Vacancy("Python Dev", "http://a.com")
+        self.saver.add_vacancy(vacancy)
+
+        self.assertTrue(self.saver.delete_vacancy(vacancy))
+        self.assertFalse(self.saver.delete_vacancy(vacancy))
+        self.assertTrue(self.saver.add_vacancy(vacancy))
+
+    def test_indexes_rebuilt_on_data_assignment(self):
+        """Проверяет перестроение индексов при замене данных."""
+        self.saver.data = [
+            {
+                "title": "Go Dev",
+                "url": "http://go.com",
+                "salary_from": None,
+                "salary_to": None,
+                "description": None,
+            }
+        ]
+
+        self.assertFalse(self.saver.add_vacancy(Vacancy("Other", "http://go.com")))
+        self.assertTrue(self.saver.delete_vacancy(Vacancy("", "http://go.com")))
+        self.assertEqual(self.saver.data, [])
+
+    @patch.object(JSONSaver, "_save_data")
+    def test_add_vacancies_saves_once(self, mock_save):
+        """Проверяет, что пакетное добавление пишет файл один раз."""
+        vacancies = [
+            Vacancy("Python Dev", "http://a.com"),
+            Vacancy("Go Dev", "http://b.com"),
+            Vacancy("Python Dev", "http://c.com"),
+            Vacancy("Rust Dev", "http://a.com"),
+        ]
+
+        results = self.saver.add_vacancies(vacancies)
+
+        self.assertEqual(results, [True, True, False, False])
+        self.assertEqual(len(self.saver.data), 2)
+        mock_save.assert_called_once()
+
+    @patch.object(JSONSaver, "_save_data")
+    def test_delete_vacancies_saves_once(self, mock_save):
+        """Проверяет, что пакетное удаление пишет файл один раз."""
+        self.saver.add_vacancies(
+            [Vacancy("Python Dev", "http://a.com"), Vacancy("Go Dev", "http://b.com")]
+        )
+        mock_save.reset_mock()
+
+        results = self.saver.delete_vacancies(
+            [Vacancy("", "http://a.com"), Vacancy("", "http://x.com")]
+        )
+
+        self.assertEqual(results, [True, False])
+        self.assertEqual([v["url"] for v in self.saver.data], ["http://b.com"])
+        mock_save.assert_called_once()
+
+    @patch.object(JSONSaver, "_save_data", side_effect=RuntimeError("disk full"))
+    def test_add_vacancies_rolls_back_on_save_error(self, mock_save):
+        """Проверяет откат пакета при ошибке сохранения."""
+        results = self.saver.add_vacancies([Vacancy("Python Dev", "http://a.com")])
+
+        self.assertEqual(results, [False])
+        self.assertEqual(self.saver.data, [])
+        self.assertNotIn("http://a.com", self.saver._url_index)
+
+    def test_delete_vacancies_rolls_back_on_save_error(self):
+        """Проверяет, что несохраненное удаление возвращает записи и индексы."""
+        self.saver.add_vacancies(
+            [
+                Vacancy("Python Dev", "http://a.com"),
+                Vacancy("Go Dev", "http://b.com"),
+                Vacancy("QA", "http://c.com"),
+            ]
+        )
+        with patch.object(JSONSaver, "_save_data", side_effect=RuntimeError("диск")):
+            results = self.saver.delete_vacancies(
+                [Vacancy("", "http://a.com"), Vacancy("", "http://c.com")]
+            )
+
+        self.assertEqual(results, [False, False])
+        self.assertEqual(
+            [v["url"] for v in self.saver.data],
+            ["http://a.com", "http://b.com", "http://c.com"],
+        )
+        self.assertIn("http://a.com", self.saver._url_index)
+        self.assertFalse(self.saver.add_vacancy(Vacancy("qa", "http://d.com")))
+
+    def test_top_by_salary(self):
+        """Проверяет отбор лучших по зарплате с устойчивым порядком при равенстве."""
+        self.saver.data = [
+            {"title": "A", "url": "a", "salary_from": 100, "salary_to": 500},
+            {"title": "B", "url": "b", "salary_from": 300, "salary_to": None},
+            {"title": "C", "url": "c", "salary_from": 100, "salary_to": 200},
+            {"title": "D", "url": "d", "salary_from": None, "salary_to": 400},
+        ]
+        for record in self.saver.data:
+            record["description"] = None
+
+        top = self.saver.top_by_salary(3)
+        self.assertEqual([v.title for v in top], ["B", "A", "C"])
+
+        top = self.saver.top_by_salary(3, field="midpoint")
+        self.assertEqual([v.title for v in top], ["D", "A", "B"])
+
+        with self.assertRaises(ValueError):
+            self.saver.top_by_salary(1, field="salary")
+
+    def test_search_vacancies_updates_incrementally(self):
+        """Проверяет поиск по описанию и обновление индекса при изменениях."""
+        directory = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(directory, "vacancies.json")
+            saver = JSONSaver(filename)
+            saver.add_vacancy(
+                Vacancy("Python Dev", "http://a.com", description="Django")
+            )
+            self.assertEqual(
+                [v.url for v in saver.search_vacancies("django")], ["http://a.com"]
+            )
+
+            saver.add_vacancy(Vacancy("Go Dev", "http://b.com", description="Django"))
+            saver.delete_vacancy(Vacancy("", "http://a.com"))
+            saver.close()
+            self.assertTrue(os.path.exists(saver.index_filename))
+
+            reloaded = JSONSaver(filename)
+            self.assertEqual(
+                [v.url for v in reloaded.search_vacancies("django")], ["http://b.com"]
+            )
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def test_get_vacancies_with_range_and_prefix(self):
+        """Проверяет запросы, отвечаемые через отсортированные индексы."""
+        self.saver.data = [
+            {"title": "Python Dev", "url": "a", "salary_from": 100},
+            {"title": "Go Dev", "url": "b", "salary_from": 300},
+            {"title": "python QA", "url": "c", "salary_from": None},
+            {"title": "Pythonista", "url": "d", "salary_from": 200},
+        ]
+        for record in self.saver.data:
+            record.update({"salary_to": None, "description": None})
+
+        vacancies = self.saver.get_vacancies({"salary_from__gte": 150})
+        self.assertEqual([v.url for v in vacancies], ["b", "d"])
+
+        vacancies = self.saver.get_vacancies({"title__istartswith": "python"})
+        self.assertEqual([v.url for v in vacancies], ["a", "c", "d"])
+
+        with patch.object(JSONSaver, "_save_data"):
+            self.saver.add_vacancy(Vacancy("Rust Dev", "e", 500))
+        vacancies = self.saver.get_vacancies({"salary_from__between": (250, 600)})
+        self.assertEqual([v.url for v in vacancies], ["b", "e"])
+
+    def test_lazy_vacancies_and_projection(self):
+        """Проверяет ленивую выборку и чтение одного поля."""
+        self.saver.data = [
+            {"title": "A", "url": "a", "salary_from": None},
+            {"title": "B", "url": "b", "salary_from": 300},
+        ]
+
+        with patch.object(JSONSaver, "_dict_to_vacancy") as mock_convert:
+            vacancies = self.saver.get_vacancies({"salary_from__gte": 100}, lazy=True)
+            self.assertEqual(self.saver.get_values("url"), ["a", "b"])
+            self.assertEqual(self.saver.get_values("salary_from"), [0, 300])
+            mock_convert.assert_not_called()
+
+        self.assertEqual([v.title for v in vacancies], ["B"])
+        with self.assertRaises(ValueError):
+            self.saver.get_values("salary")
+
+
+class TestJSONSaverJournal(unittest.TestCase):
+
+    def setUp(self):
+        """Сетап для тестов"""
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, "vacancies.json")
+        with open(self.filename, "w", encoding="utf-8") as f:
+            json.dump([], f)
+
+    def tearDown(self):
+        """Выход"""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_mutations_go_to_journal(self):
+        """Проверяет, что изменения дописываются в журнал, а не в снимок."""
+        saver = JSONSaver(self.filename, journal=True)
+        saver.add_vacancies(
+            [Vacancy("Python Dev", "http://a.com"), Vacancy("Go Dev", "http://b.com")]
+        )
+        saver.delete_vacancy(Vacancy("", "http://a.com"))
+
+        with open(self.filename, encoding="utf-8") as f:
+            self.assertEqual(json.load(f), [])
+        with open(saver.journal_filename, encoding="utf-8") as f:
+            self.assertEqual(len(f.readlines()), 3)
+
+        reloaded = JSONSaver(self.filename, journal=True)
+        self.assertEqual([v.url for v in reloaded.get_vacancies()], ["http://b.com"])
+
+    def test_compaction_after_threshold(self):
+        """Проверяет сворачивание журнала в снимок."""
+        saver = JSONSaver(self.filename, journal=True, compact_threshold=2)
+        saver.add_vacancy(Vacancy("Python Dev", "http://a.com"))
+        saver.add_vacancy(Vacancy("Go Dev", "http://b.com"))
+        saver.close()
+
+        with open(self.filename, encoding="utf-8") as f:
+            self.assertEqual(len(json.load(f)), 2)
+        self.assertFalse(os.path.exists(saver.journal_filename))
+        self.assertEqual(len(JSONSaver(self.filename, journal=True).data), 2)
+
+    def test_torn_journal_line_is_skipped(self):
+        """Проверяет пропуск недописанной строки журнала."""
+        saver = JSONSaver(self.filename, journal=True)
+        saver.add_vacancy(Vacancy("Python Dev", "http://a.com"))
+        with open(saver.journal_filename, "a", encoding="utf-8") as f:
+            f.write('{"op": "add", "rec')
+
+        reloaded = JSONSaver(self.filename, journal=True)
+        self.assertEqual([v.url for v in reloaded.get_vacancies()], ["http://a.com"])
+        reloaded.add_vacancy(Vacancy("Go Dev", "http://b.com"))
+
+        urls = [v.url for v in JSONSaver(self.filename, journal=True).get_vacancies()]
+        self.assertEqual(urls, ["http://a.com", "http://b.com"])
+
+    def test_upsert_vacancies(self):
+        """Проверяет добавление, обновление на месте и повтор журнала."""
+        saver = JSONSaver(self.filename, journal=True)
+        saver.add_vacancies(
+            [
+                Vacancy("Python Dev", "http://a.com", 100),
+                Vacancy("Go Dev", "http://b.com"),
+            ]
+        )
+        record_id = saver.data[0]["id"]
+
+        statuses = saver.upsert_vacancies(
+            [
+                Vacancy("Python Dev", "http://a.com", 150, None, "Django"),
+                Vacancy("Go Dev", "http://b.com"),
+                Vacancy("Rust Dev", "http://c.com", 300),
+                Vacancy("go dev", "http://d.com"),
+            ]
+        )
+
+        self.assertEqual(statuses, ["updated", "unchanged", "added", "skipped"])
+        self.assertEqual(saver.data[0]["id"], record_id)
+        self.assertEqual(saver.data[0]["salary_from"], 150)
+        self.assertEqual(
+            [v.url for v in saver.get_vacancies({"salary_from__gte": 150})],
+            ["http://a.com", "http://c.com"],
+        )
+        self.assertEqual(
+            [v.url for v in saver.search_vacancies("django")], ["http://a.com"]
+        )
+
+        reloaded = JSONSaver(self.filename, journal=True)
+        self.assertEqual(
+            [(v.url, v.salary_from) for v in reloaded.get_vacancies()],
+            [("http://a.com", 150), ("http://b.com", 0), ("http://c.com", 300)],
+        )
+
+    def test_upsert_rolls_back_on_commit_error(self):
+        """Проверяет откат обновлений, если запись не удалась."""
+        saver = JSONSaver(self.filename)
+        saver.add_vacancy(Vacancy("Python Dev", "http://a.com", 100))
+
+        with patch.object(JSONSaver, "_save_data", side_effect=RuntimeError("диск")):
+            statuses = saver.upsert_vacancies(
+                [
+                    Vacancy("Python Dev", "http://a.com", 200),
+                    Vacancy("Go Dev", "http://b.com"),
+                ]
+            )
+
+        self.assertEqual(statuses, ["failed", "failed"])
+        self.assertEqual(
+            [(v.url, v.salary_from) for v in saver.get_vacancies()],
+            [("http://a.com", 100)],
+        )
+
+
+class TestSQLiteSaver(unittest.TestCase):
+
+    def setUp(self):
+        """Сетап для тестов"""
+        self.saver = SQLiteSaver(":memory:")
+        self.saver.add_vacancies(
+            [
+                Vacancy("Python Dev", "http://a.com", 100, 200, "Знание Django"),
+                Vacancy("Go Dev", "http://b.com", 300, 400, "Опыт с PostgreSQL"),
+                Vacancy("QA", "http://c.com", 100, None, "Ручное тестирование"),
+            ]
+        )
+
+    def tearDown(self):
+        """Выход"""
+        self.saver.close()
+
+    def test_add_vacancy_rejects_duplicates(self):
+        """Проверяет уникальность URL и названия."""
+        self.assertFalse(self.saver.add_vacancy(Vacancy("Other", "http://a.com")))
+        self.assertFalse(self.saver.add_vacancy(Vacancy("python dev", "http://d.com")))
+        self.assertEqual(self.saver.count(), 3)
+
+    def test_batch_failing_partway(self):
+        """Проверяет результат для каждой вакансии пакета при ошибке в середине."""
+        batch = [
+            Vacancy("Java Dev", "http://d.com"),
+            Vacancy(None, "http://e.com"),
+            Vacancy("Rust Dev", "http://f.com"),
+            Vacancy("C Dev", "http://g.com"),
+        ]
+        self.assertEqual(self.saver.add_vacancies(batch), [False] * 4)
+        self.assertEqual(self.saver.upsert_vacancies(batch), [FAILED] * 4)
+        self.assertEqual(self.saver.count(), 3)
+
+        batch = [Vacancy("", "http://a.com"), Vacancy("", object()), Vacancy("", "x")]
+        self.assertEqual(self.saver.delete_vacancies(batch), [False] * 3)
+        self.assertEqual(self.saver.count(), 3)
+
+    def test_get_vacancies_by_criteria(self):
+        """Проверяет фильтрацию по критериям в SQL."""
+        vacancies = self.saver.get_vacancies({"salary_from": 100, "title": None})
+
+        self.assertEqual([v.url for v in vacancies], ["http://a.com", "http://c.com"])
+        self.assertEqual(self.saver.get_vacancies({"unknown": 1}), [])
+        self.assertEqual(len(self.saver.get_vacancies()), 3)
+
+    def test_get_vacancies_with_predicates(self):
+        """Проверяет перевод диапазонов и префиксов в SQL."""
+        vacancies = self.saver.get_vacancies(
+            {"or": [{"salary_from__gt": 200}, {"description__icontains": "РУЧНОЕ"}]}
+        )
+        self.assertEqual([v.url for v in vacancies], ["http://b.com", "http://c.com"])
+
+        vacancies = self.saver.get_vacancies({"title__startswith": "Py"})
+        self.assertEqual([v.url for v in vacancies], ["http://a.com"])
+
+    def test_lazy_vacancies_and_projection(self):
+        """Проверяет ленивую выборку и чтение одной колонки."""
+        self.assertEqual(
+            self.saver.get_values("url", {"salary_from": 100}),
+            ["http://a.com", "http://c.com"],
+        )
+        vacancies = self.saver.get_vacancies({"title": "QA"}, lazy=True)
+        self.assertEqual([v.salary_to for v in vacancies], [0])
+
+    def test_top_by_salary(self):
+        """Проверяет отбор лучших по зарплате через ORDER BY ... LIMIT."""
+        top = self.saver.top_by_salary(2)
+        self.assertEqual([v.url for v in top], ["http://b.com", "http://a.com"])
+
+        top = self.saver.top_by_salary(3, field="salary_to")
+        self.assertEqual([v.url for v in top][0], "http://b.com")
+
+    def test_search_vacancies(self):
+        """Проверяет полнотекстовый поиск по описанию."""
+        vacancies = self.saver.search_vacancies("django")
+
+        self.assertEqual([v.url for v in vacancies], ["http://a.com"])
+        self.assertEqual(self.saver.search_vacancies('"; DROP'), [])
+
+    def test_delete_vacancies(self):
+        """Проверяет удаление и обновление полнотекстового индекса."""
+        results = self.saver.delete_vacancies(
+            [Vacancy("", "http://a.com"), Vacancy("", "http://x.com")]
+        )
+
+        self.assertEqual(results, [True, False])
+        self.assertEqual(self.saver.search_vacancies("django"), [])
+
+    def test_upsert_vacancies(self):
+        """Проверяет обновление строки и полнотекстового индекса."""
+        statuses = self.saver.upsert_vacancies(
+            [
+                Vacancy("Python Dev", "http://a.com", 150, 200, "Знание FastAPI"),
+                Vacancy("Go Dev", "http://b.com", 300, 400, "Опыт с PostgreSQL"),
+                Vacancy("Rust Dev", "http://d.com", 500),
+            ]
+        )
+
+        self.assertEqual(statuses, ["updated", "unchanged", "added"])
+        self.assertEqual(
+            self.saver.get_values("salary_from", {"url": "http://a.com"}), [150]
+        )
+        self.assertEqual(self.saver.search_vacancies("Django"), [])
+        self.assertEqual(
+            [v.url for v in self.saver.search_vacancies("FastAPI")], ["http://a.com"]
+        )
+
+    def test_migrate_json_to_sqlite(self):
+        """Проверяет перенос вакансий из JSON-файла."""
+        directory = tempfile.mkdtemp()
+        try:
+            json_filename = os.path.join(directory, "vacancies.json")
+            db_filename = os.path.join(directory, "vacancies.db")
+            records = [
+                {
+                    "title": "Dev",
+                    "url": f"http://{i}.com",
+                    "salary_from": i,
+                    "salary_to": None,
+                    "description": "Описание",
+                }
+                for i in range(3)
+            ]
+            with open(json_filename, "w", encoding="utf-8") as f:
+                json.dump(records, f)
+
+            self.assertEqual(migrate_json_to_sqlite(json_filename, db_filename), 3)
+
+            saver = SQLiteSaver(db_filename)
+            self.assertEqual(len(saver.get_vacancies({"salary_from": 2})), 1)
+            saver.close()
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+class TestJSONLSaver(unittest.TestCase):
+
+    def setUp(self):
+        """Сетап для тестов"""
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, "vacancies.jsonl")
+        self.saver = JSONLSaver(self.filename)
+        self.saver.add_vacancies(
+            [
+                Vacancy("Python Dev", "http://a.com", 100, 200, "Django"),
+                Vacancy("Go Dev", "http://b.com", 300, 400, "PostgreSQL"),
+                Vacancy("QA", "http://c.com", 100, None, "Тестирование"),
+            ]
+        )
+
+    def tearDown(self):
+        """Выход"""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_iter_vacancies_is_lazy(self):
+        """Проверяет, что вакансии отдаются по одной."""
+        iterator = self.saver.iter_vacancies({"salary_from": 100})
+
+        self.assertEqual(next(iterator).url, "http://a.com")
+        self.assertEqual(next(iterator).url, "http://c.com")
+
+    def test_top_by_salary(self):
+        """Проверяет отбор лучших по зарплате при ленивом чтении."""
+        top = self.saver.top_by_salary(2)
+        self.assertEqual([v.url for v in top], ["http://b.com", "http://a.com"])
+
+    def test_add_vacancy_rejects_duplicates(self):
+        """Проверяет отказ при совпадении URL или названия."""
+        reopened = JSONLSaver(self.filename)
+
+        self.assertFalse(reopened.add_vacancy(Vacancy("Other", "http://a.com")))
+        self.assertFalse(reopened.add_vacancy(Vacancy("go dev", "http://d.com")))
+        self.assertEqual(len(reopened), 3)
+
+    def test_delete_vacancy_blanks_line(self):
+        """Проверяет удаление вакансии без перезаписи файла."""
+        size = os.path.getsize(self.filename)
+
+        self.assertTrue(self.saver.delete_vacancy(Vacancy("", "http://b.com")))
+        self.assertFalse(self.saver.delete_vacancy(Vacancy("", "http://b.com")))
+
+        self.assertEqual(os.path.getsize(self.filename), size)
+        urls = [v.url for v in JSONLSaver(self.filename).get_vacancies()]
+        self.assertEqual(urls, ["http://a.com", "http://c.com"])
+
+        self.saver.compact()
+        self.assertLess(os.path.getsize(self.filename), size)
+        self.assertEqual(len(self.saver.get_vacancies()), 2)
+
+    def test_delete_many_vacancies(self):
+        """Проверяет пакетное удаление и согласованность смещений."""
+        self.saver.add_vacancies(
+            [Vacancy(f"Dev {i}", f"http://{i}.org") for i in range(50)]
+        )
+        batch = [Vacancy("", f"http://{i}.org") for i in range(0, 50, 2)]
+        self.assertEqual(self.saver.delete_vacancies(batch), [True] * 25)
+
+        self.assertEqual(len(self.saver), 28)
+        self.assertEqual(len(JSONLSaver(self.filename)), 28)
+        self.assertEqual(len(self.saver.get_vacancies()), 28)
+
+    def test_delete_failing_partway_keeps_indexes(self):
+        """Проверяет, что после сбоя удаления индексы совпадают с файлом."""
+        erase = JSONLSaver._JSONLSaver__erase
+        calls = []
+
+        def fail_second(saver, f, offset):
+            calls.append(offset)
+            if len(calls) == 2:
+                raise OSError("диск заполнен")
+            return erase(saver, f, offset)
+
+        with patch.object(JSONLSaver, "_JSONLSaver__erase", fail_second):
+            results = self.saver.delete_vacancies(
+                [Vacancy("", "http://a.com"), Vacancy("", "http://b.com")]
+            )
+
+        self.assertEqual(results, [True, False])
+        self.assertEqual(len(self.saver), 2)
+        self.assertEqual(len(JSONLSaver(self.filename)), 2)
+        self.assertTrue(self.saver.add_vacancy(Vacancy("Python Dev", "http://f.com")))
+        self.assertTrue(self.saver.delete_vacancy(Vacancy("", "http://b.com")))
+        self.assertEqual(
+            [v.url for v in self.saver.get_vacancies()],
+            ["http://c.com", "http://f.com"],
+        )
+
+    def test_upsert_vacancies(self):
+        """Проверяет обновление по индексу URL без полного просмотра файла."""
+        old_id = next(record["id"] for _, record in self.saver._iter_records())
+        with patch.object(
+            JSONLSaver, "get_vacancies", side_effect=AssertionError("просмотр файла")
+        ):
+            statuses = self.saver.upsert_vacancies(
+                [
+                    Vacancy("Python Dev", "http://a.com", 150, 200, "FastAPI"),
+                    Vacancy("Go Dev", "http://b.com", 300, 400, "PostgreSQL"),
+                    Vacancy("Rust Dev", "http://d.com", 500),
+                    Vacancy("qa", "http://e.com"),
+                ]
+            )
+
+        self.assertEqual(statuses, ["updated", "unchanged", "added", "skipped"])
+        reopened = JSONLSaver(self.filename)
+        self.assertEqual(len(reopened), 4)
+        records = {record["url"]: record for _, record in reopened._iter_records()}
+        self.assertEqual(records["http://a.com"]["salary_from"], 150)
+        self.assertEqual(records["http://a.com"]["id"], old_id)
+        self.assertFalse(reopened.add_vacancy(Vacancy("python dev", "http://f.com")))
+
+    def test_default_upsert_restores_rejected_update(self):
+        """Проверяет, что общий upsert возвращает запись, если новую версию не приняли."""
+        statuses = DataSaver.upsert_vacancies(
+            self.saver, [Vacancy("Go Dev", "http://a.com", 150)]
+        )
+
+        self.assertEqual(statuses, ["failed"])
+        values = JSONLSaver(self.filename).get_values(
+            "salary_from", {"url": "http://a.com"}
+        )
+        self.assertEqual(values, [100])
+
+    def test_upsert_keeps_record_when_append_fails(self):
+        """Проверяет, что сбой дозаписи не теряет старую версию вакансии."""
+        with patch("builtins.open", side_effect=[open(self.filename, "rb"), OSError]):
+            statuses = self.saver.upsert_vacancies(
+                [Vacancy("Python Dev", "http://a.com", 150)]
+            )
+
+        self.assertEqual(statuses, ["failed"])
+        values = JSONLSaver(self.filename).get_values(
+            "salary_from", {"url": "http://a.com"}
+        )
+        self.assertEqual(values, [100])
+
+    def test_convert_json_to_jsonl(self):
+        """Проверяет перенос вакансий из JSON-файла."""
+        json_filename = os.path.join(self.directory, "vacancies.json")
+        jsonl_filename = os.path.join(self.directory, "converted.jsonl")
+        records = [
+            {
+                "title": f"Dev {i}",
+                "url": f"http://{i}.com",
+                "salary_from": i,
+                "salary_to": None,
+                "description": None,
+            }
+            for i in range(3)
+        ]
+        with open(json_filename, "w", encoding="utf-8") as f:
+            json.dump(records, f)
+
+        self.assertEqual(convert_json_to_jsonl(json_filename, jsonl_filename), 3)
+        urls = [v.url for v in JSONLSaver(jsonl_filename).iter_vacancies()]
+        self.assertEqual(urls, ["http://0.com", "http://1.com", "http://2.com"])
+
+
+class TestShardedSaver(unittest.TestCase):
+
+    def setUp(self):
+        """Сетап для тестов"""
+        self.directory = os.path.join(tempfile.mkdtemp(), "vacancies.shards")
+        self.saver = ShardedSaver(self.directory, shards=4, workers=2)
+        self.saver.add_vacancies(
+            [
+                Vacancy(f"Dev {number}", f"http://{number}.com", number * 100)
+                for number in range(12)
+            ]
+        )
+
+    def tearDown(self):
+        """Выход"""
+        self.saver.close()
+        shutil.rmtree(os.path.dirname(self.directory), ignore_errors=True)
+
+    def test_records_are_partitioned_by_url(self):
+        """Проверяет раскладку записей по шардам и повторное открытие."""
+        for shard in range(4):
+            filename = self.saver.shard_filename(shard)
+            if not os.path.exists(filename):
+                continue  # пустой шард не записывается
+            with open(filename, encoding="utf-8") as f:
+                for record in json.load(f):
+                    self.assertEqual(shard_of(record["url"], 4), shard)
+
+        reopened = ShardedSaver(self.directory, workers=2)
+        self.assertEqual(reopened.shards, 4)
+        self.assertEqual(len(reopened.get_vacancies()), 12)
+        self.assertEqual(reopened.top_by_salary(1)[0].url, "http://11.com")
+        self.assertFalse(reopened.add_vacancy(Vacancy("Other", "http://3.com")))
+
+    def test_scan_without_loading(self):
+        """Проверяет фильтрацию шардов в пуле процессов без загрузки в память."""
+        reopened = ShardedSaver(self.directory, workers=2)
+        urls = {v.url for v in reopened.iter_vacancies({"salary_from__gte": 1000})}
+        self.assertEqual(urls, {"http://10.com", "http://11.com"})
+        self.assertIsNone(reopened._shards)
+
+        # Загрузка и повторный просмотр используют тот же пул процессов
+        executor = reopened._executor
+        reopened.load()
+        self.assertEqual(len(reopened), 12)
+        self.assertIs(reopened._executor, executor)
+        reopened.close()
+        self.assertIsNone(reopened._executor)
+
+    def test_small_store_loads_without_pool(self):
+        """Проверяет, что небольшое хранилище без workers читается без пула."""
+        reopened = ShardedSaver(self.directory)
+        self.assertEqual(len(reopened.get_vacancies()), 12)
+        self.assertIsNone(reopened._executor)
+
+    def test_upsert_discards_changes_on_type_error(self):
+        """Проверяет откат изменений в памяти при ошибке посреди пакета."""
+        with self.assertRaises(TypeError):
+            self.saver.upsert_vacancies(
+                [
+                    Vacancy("New", "http://new.com"),
+                    Vacancy("Dev 1", "http://1.com", 999),
+                    "не вакансия",
+                ]
+            )
+
+        self.assertEqual(self.saver.get_vacancies({"url": "http://new.com"}), [])
+        self.assertEqual(
+            self.saver.get_values("salary_from", {"url": "http://1.com"}), [100]
+        )
+        self.assertEqual(len(self.saver), 12)
+        self.assertTrue(self.saver.add_vacancy(Vacancy("New", "http://new.com")))
+
+    def test_add_reports_shards_written_before_error(self):
+        """Проверяет, что при сбое записи второго шарда первый остается добавленным."""
+        first = "http://new-0.com"
+        second = next(
+            f"http://new-{number}.com"
+            for number in range(1, 100)
+            if shard_of(f"http://new-{number}.com", 4) != shard_of(first, 4)
+        )
+        first, second = sorted((first, second), key=lambda url: shard_of(url, 4))
+        replace = os.replace
+
+        def fail_second(source, target):
+            if target == self.saver.shard_filename(shard_of(second, 4)):
+                raise OSError("диск заполнен")
+            replace(source, target)
+
+        with patch("src.data_savers.os.replace", side_effect=fail_second):
+            results = self.saver.add_vacancies(
+                [Vacancy("First", first), Vacancy("Second", second)]
+            )
+
+        self.assertEqual(results, [True, False])
+        self.assertEqual(len(self.saver), 13)
+        self.assertEqual(len(ShardedSaver(self.directory).get_vacancies()), 13)
+        self.assertTrue(self.saver.add_vacancy(Vacancy("Second", second)))
+
+    def test_mutation_rewrites_only_affected_shard(self):
+        """Проверяет, что изменение переписывает только шард вакансии."""
+        url = "http://new.com"
+        affected = shard_of(url, 4)
+        with patch("src.data_savers.os.replace", wraps=os.replace) as mock_replace:
+            self.assertTrue(self.saver.add_vacancy(Vacancy("New", url)))
+            self.assertEqual(
+                [call.args[1] for call in mock_replace.call_args_list],
+                [self.saver.shard_filename(affected)],
+            )
+
+            mock_replace.reset_mock()
+            self.assertEqual(
+                self.saver.upsert_vacancies(
+                    [Vacancy("New", url, 500), Vacancy("Dev 1", "http://1.com", 100)]
+                ),
+                ["updated", "unchanged"],
+            )
+            self.assertEqual(mock_replace.call_count, 1)
+
+        self.assertTrue(self.saver.delete_vacancy(Vacancy("", url)))
+        self.assertEqual(len(ShardedSaver(self.directory).get_vacancies()), 12)
+
+    def test_migrate_json_to_shards(self):
+        """Проверяет перенос вакансий из JSON-файла в шарды."""
+        json_filename = os.path.join(os.path.dirname(self.directory), "v.json")
+        with open(json_filename, "w", encoding="utf-8") as f:
+            json.dump(
+                [
+                    {
+                        "title": "Dev",
+                        "url": f"http://{i}.org",
+                        "salary_from": i,
+                        "salary_to": None,
+                        "description": None,
+                    }
+                    for i in range(5)
+                ],
+                f,
+            )
+        target = os.path.join(os.path.dirname(self.directory), "migrated.shards")
+        self.assertEqual(migrate_json_to_shards(json_filename, target, 2), 5)
+        self.assertEqual(len(ShardedSaver(target, workers=1)), 5)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,175 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+)
+
+from src import dedup
+from src.data_savers import JSONSaver
+from src.dedup import (
+    LSHIndex,
+    MinHasher,
+    NearDuplicateDetector,
+    choose_bands,
+    find_duplicate_groups,
+    remove_near_duplicates,
+    shingles,
+)
+from vacancy import Vacancy
+
+DESCRIPTION = (
+    "Опыт коммерческой разработки на Python от трех лет. Знание Django и "
+    "PostgreSQL. Умение писать тесты и работать с Docker в команде"
+)
+
+
+class TestMinHash(unittest.TestCase):
+
+    def test_similarity_estimates_jaccard(self):
+        """Проверяет, что похожие тексты дают близкие сигнатуры."""
+        hasher = MinHasher(num_perm=128)
+        first = shingles(DESCRIPTION)
+        second = shingles(DESCRIPTION + " и Kafka")
+        other = shingles("Продавец-консультант в магазин одежды, график 2/2")
+
+        similar = MinHasher.similarity(
+            hasher.signature(first), hasher.signature(second)
+        )
+        different = MinHasher.similarity(
+            hasher.signature(first), hasher.signature(other)
+        )
+
+        jaccard = len(first & second) / len(first | second)
+        self.assertAlmostEqual(similar, jaccard, delta=0.15)
+        self.assertLess(different, 0.1)
+
+    @unittest.skipIf(dedup.np is None, "NumPy не установлен")
+    def test_numpy_and_python_signatures_match(self):
+        """Проверяет совпадение сигнатур с NumPy и без него."""
+        hasher = MinHasher(num_perm=32)
+        values = shingles(DESCRIPTION)
+        expected = hasher.signature(values)
+        with patch.object(dedup, "np", None):
+            self.assertEqual(MinHasher(num_perm=32).signature(values), expected)
+
+    def test_choose_bands(self):
+        """Проверяет подбор полос под порог похожести."""
+        self.assertEqual(choose_bands(0.8, 128), 16)
+        self.assertEqual(choose_bands(0.5, 128), 32)
+
+    def test_lsh_index_add_remove(self):
+        """Проверяет поиск кандидатов по полосам и удаление."""
+        index = LSHIndex(bands=2, rows=2)
+        index.add("a", (1, 2, 3, 4))
+        index.add("b", (1, 2, 9, 9))
+        index.add("c", (5, 6, 7, 8))
+
+        self.assertEqual(index.candidates((1, 2, 0, 0)), {"a", "b"})
+        index.remove("a")
+        self.assertEqual(index.candidates((1, 2, 3, 4)), {"b"})
+        self.assertEqual(len(index), 2)
+
+
+class TestNearDuplicates(unittest.TestCase):
+
+    def test_find_duplicate_groups(self):
+        """Проверяет группировку перепостов с измененным названием."""
+        vacancies = [
+            Vacancy("Python-разработчик", "http://a.com", description=DESCRIPTION),
+            Vacancy("Python разработчик", "http://b.com", description=DESCRIPTION),
+            Vacancy("Python-разработчик", "http://c.com", description="Продажи"),
+            Vacancy(
+                "Python-разработчик!", "http://d.com", description=DESCRIPTION + "."
+            ),
+        ]
+
+        groups = find_duplicate_groups(vacancies)
+
+        self.assertEqual(
+            [[v.url for v in group] for group in groups],
+            [["http://a.com", "http://b.com", "http://d.com"]],
+        )
+
+    def test_detector_threshold(self):
+        """Проверяет порог похожести детектора."""
+        detector = NearDuplicateDetector(threshold=0.8)
+        detector.add("a", "Python Dev", DESCRIPTION)
+
+        self.assertEqual(detector.find("Python Dev", DESCRIPTION)[0][0], "a")
+        self.assertEqual(detector.find("Python Dev", "Совсем другая вакансия"), [])
+
+
+class TestJSONSaverNearMode(unittest.TestCase):
+
+    def setUp(self):
+        """Сетап для тестов"""
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, "vacancies.json")
+
+    def tearDown(self):
+        """Выход"""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_near_mode_allows_same_title_rejects_reposts(self):
+        """Проверяет, что near-режим различает работодателей и ловит перепосты."""
+        saver = JSONSaver(self.filename, dedup="near")
+        results = saver.add_vacancies(
+            [
+                Vacancy("Python Dev", "http://a.com", description=DESCRIPTION),
+                Vacancy("Python Dev", "http://b.com", description="Аналитика, SQL"),
+                Vacancy("Python  Dev!", "http://c.com", description=DESCRIPTION),
+            ]
+        )
+        self.assertEqual(results, [True, True, False])
+
+        saver.delete_vacancy(Vacancy("", "http://a.com"))
+        self.assertTrue(
+            saver.add_vacancy(
+                Vacancy("Python Dev", "http://c.com", description=DESCRIPTION)
+            )
+        )
+
+    def test_unknown_mode(self):
+        """Проверяет проверку режима поиска дублей."""
+        with self.assertRaises(ValueError):
+            JSONSaver(self.filename, dedup="fuzzy")
+
+    def test_remove_near_duplicates(self):
+        """Проверяет массовое удаление дублей из хранилища."""
+        saver = JSONSaver(self.filename)
+        saver.data = [
+            {
+                "id": str(number),
+                "title": title,
+                "url": f"http://test.com/{number}",
+                "salary_from": None,
+                "salary_to": None,
+                "description": description,
+            }
+            for number, (title, description) in enumerate(
+                [
+                    ("Python Dev", DESCRIPTION),
+                    ("Go Dev", "Разработка микросервисов на Go"),
+                    ("Python Developer", DESCRIPTION),
+                ]
+            )
+        ]
+
+        groups = remove_near_duplicates(saver, threshold=0.7, dry_run=True)
+        self.assertEqual(len(groups), 1)
+        self.assertEqual(len(saver.data), 3)
+
+        remove_near_duplicates(saver, threshold=0.7)
+        self.assertEqual(
+            [v.url for v in saver.get_vacancies()],
+            ["http://test.com/0", "http://test.com/1"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+)
+
+from src.data_savers import JSONSaver
+from src.file_lock import FileLock
+from vacancy import Vacancy
+
+
+def add_worker(filename, worker, count, journal):
+    """Добавляет count вакансий по одной, как отдельный процесс сборщика."""
+    saver = JSONSaver(filename, journal=journal, compact_threshold=7)
+    for number in range(count):
+        saver.add_vacancy(
+            Vacancy(f"Worker {worker} vacancy {number}", f"http://{worker}/{number}")
+        )
+    saver.close()
+
+
+def add_one_worker(filename, title, url, description):
+    """Добавляет одну вакансию из отдельного процесса."""
+    saver = JSONSaver(filename)
+    saver.add_vacancy(Vacancy(title, url, description=description))
+    saver.close()
+
+
+class TestFileLock(unittest.TestCase):
+
+    def setUp(self):
+        """Сетап для тестов"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp.name, "vacancies.json")
+
+    def tearDown(self):
+        """Выход"""
+        self.tmp.cleanup()
+
+    def test_exclusive_lock_blocks_other_holders(self):
+        """Проверяет, что исключительная блокировка ждет освобождения."""
+        lock_filename = f"{self.filename}.lock"
+        events = []
+
+        def hold():
+            with FileLock(lock_filename, shared=True):
+                events.append("reader")
+                time.sleep(0.1)
+            events.append("reader done")
+
+        thread = threading.Thread(target=hold)
+        with FileLock(lock_filename):
+            thread.start()
+            time.sleep(0.05)
+            events.append("writer done")
+        thread.join()
+
+        self.assertEqual(events, ["writer done", "reader", "reader done"])
+
+    def test_reader_sees_other_writer(self):
+        """Проверяет перечитывание файла только после чужой записи."""
+        writer = JSONSaver(self.filename)
+        reader = JSONSaver(self.filename)
+        self.assertFalse(reader.refresh())
+
+        writer.add_vacancy(Vacancy("Python Dev", "http://a.com"))
+        self.assertEqual([v.url for v in reader.get_vacancies()], ["http://a.com"])
+        self.assertFalse(reader.refresh())
+
+        # Запись начинается с подхвата чужих изменений: дубль не пройдет
+        self.assertFalse(reader.add_vacancy(Vacancy("Other", "http://a.com")))
+
+    def test_journal_tail_is_applied_incrementally(self):
+        """Проверяет подхват дописанного журнала без полной перезагрузки."""
+        writer = JSONSaver(self.filename, journal=True)
+        reader = JSONSaver(self.filename, journal=True)
+        writer.add_vacancy(Vacancy("Python Dev", "http://a.com"))
+        reader.get_vacancies()
+        writer.add_vacancy(Vacancy("Go Dev", "http://b.com"))
+
+        with patch.object(
+            JSONSaver, "_reload", side_effect=AssertionError("полная загрузка")
+        ):
+            urls = [v.url for v in reader.get_vacancies()]
+        self.assertEqual(urls, ["http://a.com", "http://b.com"])
+
+    def test_concurrent_processes_do_not_lose_writes(self):
+        """Проверяет, что параллельные процессы не затирают добавления друг друга."""
+        context = multiprocessing.get_context()
+        for journal in (False, True):
+            with self.subTest(journal=journal):
+                filename = os.path.join(self.tmp.name, f"journal_{journal}.json")
+                processes = [
+                    context.Process(
+                        target=add_worker, args=(filename, worker, 15, journal)
+                    )
+                    for worker in range(4)
+                ]
+                for process in processes:
+                    process.start()
+                for process in processes:
+                    process.join(timeout=60)
+                    self.assertEqual(process.exitcode, 0)
+
+                saver = JSONSaver(filename, journal=journal)
+                urls = {record["url"] for record in saver.data}
+                self.assertEqual(len(urls), 60)
+
+    def test_search_index_not_saved_over_other_writer(self):
+        """Проверяет, что устаревший поисковый индекс не сохраняется как актуальный."""
+        saver = JSONSaver(self.filename)
+        saver.add_vacancy(Vacancy("Python Dev", "http://u1", description="python"))
+        self.assertEqual(
+            [v.url for v in saver.search_vacancies("python")], ["http://u1"]
+        )
+
+        process = multiprocessing.get_context().Process(
+            target=add_one_worker,
+            args=(self.filename, "Django Dev", "http://u2", "python django"),
+        )
+        process.start()
+        process.join(timeout=60)
+        self.assertEqual(process.exitcode, 0)
+        saver.close()
+
+        reader = JSONSaver(self.filename)
+        self.assertEqual(len(reader.get_vacancies()), 2)
+        self.assertEqual(
+            sorted(v.url for v in reader.search_vacancies("python")),
+            ["http://u1", "http://u2"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
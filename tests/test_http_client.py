@@ -0,0 +1,131 @@
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+)
+
+from src.http_client import HttpClient, TokenBucket
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Обработчик заглушки API: отдает заранее заданные статусы по очереди."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            server.ports.add(self.client_address[1])
+            status = server.statuses.pop(0) if server.statuses else 200
+        body = json.dumps({"status": status}).encode("utf-8")
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHttpClient(unittest.TestCase):
+
+    def setUp(self):
+        """Сетап для тестов"""
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.lock = threading.Lock()
+        self.server.requests = 0
+        self.server.ports = set()
+        self.server.statuses = []
+        self.thread = threading.Thread(
+            target=self.server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            daemon=True,
+        )
+        self.thread.start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/vacancies"
+        self.client = HttpClient(retries=3, backoff_factor=0)
+
+    def tearDown(self):
+        """Выход"""
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_retries_on_server_error(self):
+        """Проверяет повтор запроса после 5xx."""
+        self.server.statuses = [503, 502]
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.json(), {"status": 200})
+        self.assertEqual(self.server.requests, 3)
+
+    def test_retries_on_too_many_requests(self):
+        """Проверяет повтор запроса после 429 с учетом Retry-After."""
+        self.server.statuses = [429]
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.server.requests, 2)
+
+    def test_raises_after_retries_exhausted(self):
+        """Проверяет ошибку после исчерпания повторов."""
+        self.server.statuses = [500] * 10
+
+        with self.assertRaises(requests.exceptions.HTTPError):
+            self.client.get(self.url)
+        self.assertEqual(self.server.requests, 4)
+
+    def test_reuses_connection(self):
+        """Проверяет, что запросы идут через одно keep-alive соединение."""
+        for _ in range(5):
+            self.client.get(self.url)
+
+        self.assertEqual(self.server.requests, 5)
+        self.assertEqual(len(self.server.ports), 1)
+
+    def test_rate_limiter_is_applied(self):
+        """Проверяет, что запросы проходят через ограничитель частоты."""
+        self.client.rate_limiter = TokenBucket(rate=20, capacity=1)
+
+        started = time.monotonic()
+        for _ in range(3):
+            self.client.get(self.url)
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.09)
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_burst_within_capacity(self):
+        """Проверяет, что запросы в пределах емкости не ждут."""
+        bucket = TokenBucket(rate=1, capacity=3)
+        self.assertEqual(sum(bucket.acquire() for _ in range(3)), 0)
+
+    def test_waits_when_empty(self):
+        """Проверяет ожидание при пустой корзине."""
+        bucket = TokenBucket(rate=50, capacity=1)
+        bucket.acquire()
+        self.assertGreater(bucket.acquire(), 0)
+
+    def test_invalid_rate(self):
+        """Проверяет ошибку при неположительной частоте."""
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
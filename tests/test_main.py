@@ -30,7 +30,7 @@ class TestInteractWithUser(unittest.TestCase):
         """Проверяет поиск вакансий на hh.ru."""
         json_saver_mock = MagicMock(spec=JSONSaver)
         hh_connector_mock = MagicMock(spec=HHruConnector)
-        hh_connector_mock.get_vacancies.return_value = [
+        hh_connector_mock.iter_vacancies.return_value = [
             {
                 "name": "Test Vacancy",
                 "alternate_url": "http://test.com",
@@ -38,10 +38,11 @@ class TestInteractWithUser(unittest.TestCase):
                 "snippet": {"requirement": "Test requirement"},
             }
         ]
+        json_saver_mock.add_vacancies.return_value = [True]
         with patch("sys.stdout", new_callable=io.StringIO) as stdout:
             interact_with_user(json_saver_mock, hh_connector_mock)
-        hh_connector_mock.get_vacancies.assert_called_once_with("test query")
-        json_saver_mock.add_vacancy.assert_called_once()
+        hh_connector_mock.iter_vacancies.assert_called_once_with("test query")
+        json_saver_mock.add_vacancies.assert_called_once()
         self.assertIn("Test Vacancy", stdout.getvalue())
 
     @patch("src.main.input", side_effect=["2", "2", "6"])
@@ -63,10 +64,10 @@ class TestInteractWithUser(unittest.TestCase):
             salary_to=200,
             description="Test Description2",
         )
-        json_saver_mock.get_vacancies.return_value = [vacancy1, vacancy2]
+        json_saver_mock.top_by_salary.return_value = [vacancy1, vacancy2]
         with patch("sys.stdout", new_callable=io.StringIO) as stdout:
             interact_with_user(json_saver_mock, hh_connector_mock)
-        json_saver_mock.get_vacancies.assert_called_once_with({})
+        json_saver_mock.top_by_salary.assert_called_once_with(2)
         self.assertIn("Test Title1", stdout.getvalue())
         self.assertIn("Test Title2", stdout.getvalue())
 
@@ -89,10 +90,12 @@ class TestInteractWithUser(unittest.TestCase):
             salary_to=200,
             description="Test Description2",
         )
-        json_saver_mock.get_vacancies.return_value = [vacancy1, vacancy2]
+        json_saver_mock.search_vacancies.side_effect = lambda keyword: [
+            v for v in (vacancy1, vacancy2) if keyword in v.description
+        ]
         with patch("sys.stdout", new_callable=io.StringIO) as stdout:
             interact_with_user(json_saver_mock, hh_connector_mock)
-        json_saver_mock.get_vacancies.assert_called_once_with({})
+        json_saver_mock.search_vacancies.assert_called_once_with("keyword")
         self.assertIn("Test Title1", stdout.getvalue())
         self.assertNotIn("Test Title2", stdout.getvalue())
 
@@ -118,17 +121,21 @@ class TestInteractWithUser(unittest.TestCase):
         json_saver_mock.get_vacancies.return_value = [vacancy1, vacancy2]
         with patch("sys.stdout", new_callable=io.StringIO) as stdout:
             interact_with_user(json_saver_mock, hh_connector_mock)
-        json_saver_mock.get_vacancies.assert_called_once_with({})
+        json_saver_mock.get_vacancies.assert_called_once_with({}, lazy=True)
         self.assertIn("Test Title1", stdout.getvalue())
         self.assertIn("Test Title2", stdout.getvalue())
 
-    @patch("src.main.input", side_effect=["5", "http://test.com", "6"])
+    @patch("src.main.input", side_effect=["5", "http://test.com http://t2.com", "6"])
     def test_delete_vacancy(self, mock_input):
-        """Проверяет удаление вакансии."""
+        """Проверяет удаление вакансий."""
         json_saver_mock = MagicMock(spec=JSONSaver)
+        json_saver_mock.delete_vacancies.side_effect = lambda v: [True, False]
         hh_connector_mock = MagicMock(spec=HHruConnector)
-        interact_with_user(json_saver_mock, hh_connector_mock)
-        json_saver_mock.delete_vacancy.assert_called_once()
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            interact_with_user(json_saver_mock, hh_connector_mock)
+        json_saver_mock.delete_vacancies.assert_called_once()
+        self.assertIn("Вакансия удалена: http://test.com", stdout.getvalue())
+        self.assertIn("Вакансия не найдена: http://t2.com", stdout.getvalue())
 
     @patch("src.main.input", side_effect=["7", "6"])
     def test_invalid_choice(self, mock_input):
@@ -0,0 +1,140 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+)
+
+from src.data_savers import JSONSaver
+from src.http_client import HttpClient
+from src.metrics import NULL_TIMER, MetricsRegistry, timer
+
+
+def make_response(status, content=b"{}"):
+    response = MagicMock()
+    response.status_code = status
+    response.content = content
+    response.headers = {}
+    if status >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(status)
+    return response
+
+
+class TestMetricsRegistry(unittest.TestCase):
+
+    def test_prometheus_text_format(self):
+        """Проверяет выгрузку счетчиков, гистограмм и экранирование меток."""
+        registry = MetricsRegistry()
+        registry.counter("requests_total", "Запросы").inc(2, path='/a"b')
+        registry.gauge("records").set(5)
+        histogram = registry.histogram("latency_seconds", buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(3)
+
+        text = registry.to_prometheus()
+
+        self.assertIn("# TYPE requests_total counter", text)
+        self.assertIn('requests_total{path="/a\\"b"} 2', text)
+        self.assertIn("records 5", text)
+        self.assertIn('latency_seconds_bucket{le="0.1"} 1', text)
+        self.assertIn('latency_seconds_bucket{le="1"} 2', text)
+        self.assertIn('latency_seconds_bucket{le="+Inf"} 3', text)
+        self.assertIn("latency_seconds_count 3", text)
+
+    def test_dump_to_file_and_stdout(self):
+        """Проверяет запись метрик в файл и в stdout."""
+        registry = MetricsRegistry()
+        registry.counter("events_total").inc()
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "metrics.prom")
+            registry.dump(filename)
+            with open(filename, encoding="utf-8") as f:
+                self.assertIn("events_total 1", f.read())
+
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            registry.dump()
+        self.assertIn("events_total 1", stdout.getvalue())
+
+    def test_disabled_timer_is_noop(self):
+        """Проверяет, что без реестра используется общий пустой таймер."""
+        self.assertIs(timer(None, "anything_seconds"), NULL_TIMER)
+        with timer(None, "anything_seconds"):
+            pass
+
+    def test_type_conflict(self):
+        """Проверяет запрет регистрации метрики с тем же именем другого типа."""
+        registry = MetricsRegistry()
+        registry.counter("value")
+        with self.assertRaises(ValueError):
+            registry.histogram("value")
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    @patch("requests.Session.get")
+    def test_http_client_metrics(self, mock_get):
+        """Проверяет метрики задержек, байтов, повторов и ошибок HTTP."""
+        registry = MetricsRegistry()
+        client = HttpClient(retries=1, backoff_factor=0, metrics=registry)
+        mock_get.side_effect = [make_response(503), make_response(200, b"12345")]
+
+        client.get("http://test/vacancies", params={"page": 0})
+
+        labels = {"endpoint": "test/vacancies"}
+        self.assertEqual(
+            registry.get("http_request_duration_seconds").count(**labels), 2
+        )
+        self.assertEqual(registry.get("http_response_bytes_total").value(**labels), 7)
+        self.assertEqual(
+            registry.get("http_retries_total").value(reason=503, **labels), 1
+        )
+
+        mock_get.side_effect = [make_response(404)]
+        with self.assertRaises(requests.exceptions.HTTPError):
+            client.get("http://test/vacancies")
+        self.assertEqual(
+            registry.get("http_errors_total").value(reason=404, **labels), 1
+        )
+
+    def test_json_saver_metrics(self):
+        """Проверяет метрики загрузки, записи и запросов JSONSaver."""
+        registry = MetricsRegistry()
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "vacancies.json")
+            records = [
+                {
+                    "id": "1",
+                    "title": "Python",
+                    "url": "u1",
+                    "salary_from": 100,
+                    "salary_to": None,
+                    "description": "python",
+                }
+            ]
+            with open(filename, "w", encoding="utf-8") as f:
+                json.dump(records, f)
+
+            saver = JSONSaver(filename, metrics=registry)
+            saver.get_vacancies({"salary_from__gte": 50})
+            saver.top_by_salary(1)
+            saver.data = saver.data + [dict(records[0], url="u2", title="Go")]
+            saver._save_data()
+
+        self.assertEqual(registry.get("saver_load_seconds").count(saver="json"), 1)
+        self.assertEqual(registry.get("saver_save_seconds").count(saver="json"), 1)
+        query = registry.get("saver_query_seconds")
+        self.assertEqual(query.count(saver="json", operation="get_vacancies"), 1)
+        self.assertEqual(query.count(saver="json", operation="top_by_salary"), 1)
+        self.assertEqual(registry.get("saver_records").value(saver="json"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
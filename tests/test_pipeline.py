@@ -0,0 +1,91 @@
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+)
+
+from src.pipeline import (
+    chunked,
+    dedupe,
+    hh_item_to_vacancy,
+    parse_items,
+    persist,
+    vacancy_pipeline,
+)
+from src.vacancy import Vacancy
+from tests.helpers import make_item
+
+
+class TestPipeline(unittest.TestCase):
+
+    def test_hh_item_to_vacancy(self):
+        """Проверяет преобразование вакансии hh.ru в Vacancy."""
+        vacancy = hh_item_to_vacancy(make_item(1, 100, 200, "Requirement 1"))
+
+        self.assertEqual(vacancy.title, "Vacancy 1")
+        self.assertEqual(vacancy.url, "http://test.com/1")
+        self.assertEqual(vacancy.salary_from, 100)
+        self.assertEqual(vacancy.salary_to, 200)
+        self.assertEqual(vacancy.description, "Requirement 1")
+
+    def test_hh_item_without_salary_and_snippet(self):
+        """Проверяет преобразование вакансии без зарплаты и описания."""
+        item = {"name": "Vacancy", "alternate_url": "http://test.com", "snippet": None}
+
+        vacancy = hh_item_to_vacancy(item)
+
+        self.assertEqual(vacancy.salary_from, 0)
+        self.assertIsNone(vacancy.description)
+
+    def test_parse_items_skips_broken(self):
+        """Проверяет пропуск некорректных записей."""
+        vacancies = list(parse_items([make_item(1), {"name": "no url"}, make_item(2)]))
+
+        self.assertEqual([v.title for v in vacancies], ["Vacancy 1", "Vacancy 2"])
+
+    def test_dedupe(self):
+        """Проверяет отбрасывание повторяющихся URL."""
+        vacancies = [Vacancy("a", "u1"), Vacancy("b", "u2"), Vacancy("c", "u1")]
+
+        self.assertEqual([v.title for v in dedupe(vacancies)], ["a", "b"])
+
+    def test_chunked(self):
+        """Проверяет разбиение потока на порции."""
+        self.assertEqual(list(chunked(range(5), 2)), [[0, 1], [2, 3], [4]])
+
+    def test_persist_yields_only_added(self):
+        """Проверяет, что отдаются только сохраненные вакансии."""
+        saver = MagicMock()
+        saver.add_vacancies.side_effect = [[True, False], [True]]
+        vacancies = [Vacancy("a", "u1"), Vacancy("b", "u2"), Vacancy("c", "u3")]
+
+        added = list(persist(vacancies, saver, chunk_size=2))
+
+        self.assertEqual([v.title for v in added], ["a", "c"])
+        self.assertEqual(saver.add_vacancies.call_count, 2)
+
+    def test_pipeline_is_lazy(self):
+        """Проверяет, что конвейер не читает поток целиком заранее."""
+        consumed = []
+
+        def items():
+            for number in range(1000):
+                consumed.append(number)
+                yield make_item(number)
+
+        connector = MagicMock()
+        connector.iter_vacancies.return_value = items()
+        saver = MagicMock()
+        saver.add_vacancies.side_effect = lambda chunk: [True] * len(chunk)
+
+        pipeline = vacancy_pipeline(connector, saver, "python", chunk_size=10)
+        next(pipeline)
+
+        self.assertLessEqual(len(consumed), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
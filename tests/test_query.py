@@ -0,0 +1,98 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+)
+
+from src.query import compile_query
+
+RECORDS = [
+    {"title": "Python Dev", "url": "a", "salary_from": 100, "salary_to": 200},
+    {"title": "Go Dev", "url": "b", "salary_from": 300, "salary_to": None},
+    {"title": "python QA", "url": "c", "salary_from": None, "salary_to": 150},
+]
+
+
+def select(criteria):
+    plan = compile_query(criteria)
+    return [record["url"] for record in RECORDS if plan.matches(record)]
+
+
+class TestQuery(unittest.TestCase):
+
+    def test_equality_keeps_old_semantics(self):
+        """Проверяет точное совпадение, пропуск None и отсутствующие поля."""
+        self.assertEqual(select({"salary_from": 100, "title": None}), ["a"])
+        self.assertEqual(select({"unknown": 1}), [])
+        self.assertEqual(select({}), ["a", "b", "c"])
+
+    def test_range_predicates(self):
+        """Проверяет операторы диапазона."""
+        self.assertEqual(select({"salary_from__gte": 200}), ["b"])
+        self.assertEqual(select({"salary_from__lt": 300}), ["a"])
+        self.assertEqual(select({"salary_to__between": (150, 200)}), ["a", "c"])
+
+    def test_prefix_predicates(self):
+        """Проверяет поиск по префиксу с учетом и без учета регистра."""
+        self.assertEqual(select({"title__startswith": "Python"}), ["a"])
+        self.assertEqual(select({"title__istartswith": "PYTHON"}), ["a", "c"])
+
+    def test_text_predicates_skip_null(self):
+        """Проверяет, что пустое поле не совпадает с подстрокой, как в SQL."""
+        record = {"description": None}
+        for op in ("contains", "icontains", "startswith", "istartswith"):
+            with self.subTest(op=op):
+                plan = compile_query({f"description__{op}": "non"})
+                self.assertFalse(plan.matches(record))
+
+    def test_or_and_groups(self):
+        """Проверяет объединение условий по ИЛИ и И."""
+        criteria = {
+            "or": [{"salary_from__gte": 300}, {"title__icontains": "qa"}],
+            "url__ne": "c",
+        }
+        self.assertEqual(select(criteria), ["b"])
+
+    def test_unknown_operator(self):
+        """Проверяет ошибку при неизвестном операторе."""
+        with self.assertRaises(ValueError):
+            compile_query({"salary_from__approx": 1})
+
+    def test_access_path(self):
+        """Проверяет выбор индекса для запроса."""
+        self.assertEqual(compile_query({"url": "a"}).access_path, ("url", "a"))
+        self.assertEqual(
+            compile_query({"title": "x", "salary_from__gt": 10}).access_path,
+            ("range", "salary_from", 10, None, False, True),
+        )
+        self.assertEqual(
+            compile_query({"title__istartswith": "py"}).access_path,
+            ("prefix", "title", "py", True),
+        )
+        self.assertEqual(
+            compile_query({"or": [{"url": "a"}, {"url": "b"}]}).access_path, ("scan",)
+        )
+
+    def test_plans_are_cached(self):
+        """Проверяет, что одинаковые критерии компилируются один раз."""
+        self.assertIs(
+            compile_query({"salary_from__gte": 1}),
+            compile_query({"salary_from__gte": 1}),
+        )
+
+    def test_to_sql(self):
+        """Проверяет перевод запроса в SQL."""
+        where, params = compile_query(
+            {"salary_from__between": [1, 2], "title__startswith": "Py"}
+        ).to_sql({"salary_from": "salary_from", "title": "title"})
+
+        self.assertEqual(
+            where, "(salary_from BETWEEN ? AND ? AND substr(title, 1, ?) = ?)"
+        )
+        self.assertEqual(params, [1, 2, 2, "Py"])
+
+
+if __name__ == "__main__":
+    unittest.main()
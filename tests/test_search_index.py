@@ -0,0 +1,82 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+)
+
+from src.search_index import InvertedIndex, parse_query, tokenize
+
+
+class TestSearchIndex(unittest.TestCase):
+
+    def setUp(self):
+        """Сетап для тестов"""
+        self.index = InvertedIndex()
+        self.index.add("1", "Опыт работы с <highlighttext>Python</highlighttext>")
+        self.index.add("2", "Знание Python и Django, опыт с PostgreSQL")
+        self.index.add("3", "Ручное тестирование, знание SQL")
+        self.index.add("4", "Python Python Python")
+
+    def test_tokenize(self):
+        """Проверяет разбиение текста и удаление разметки hh.ru."""
+        self.assertEqual(
+            tokenize("<highlighttext>Ёлка</highlighttext>, Python-разработчик!"),
+            ["елка", "python", "разработчик"],
+        )
+
+    def test_parse_query(self):
+        """Проверяет разбор запроса на группы и фразы."""
+        self.assertEqual(
+            parse_query('python "опыт работы" OR sql'),
+            [["python", ("опыт", "работы")], ["sql"]],
+        )
+
+    def test_and_query(self):
+        """Проверяет пересечение по всем словам запроса."""
+        self.assertEqual(self.index.search("python django"), ["2"])
+
+    def test_or_query(self):
+        """Проверяет объединение групп ИЛИ."""
+        self.assertEqual(set(self.index.search("django или sql")), {"2", "3"})
+
+    def test_phrase_query(self):
+        """Проверяет поиск фразы."""
+        self.assertEqual(self.index.search('"опыт работы"'), ["1"])
+        self.assertEqual(self.index.search('"работы опыт"'), [])
+
+    def test_ranking(self):
+        """Проверяет, что частое слово в коротком тексте ранжируется выше."""
+        self.assertEqual(self.index.search("python")[0], "4")
+
+    def test_regex_characters_are_plain_text(self):
+        """Проверяет, что спецсимволы запроса не ломают поиск."""
+        self.assertEqual(self.index.search("(python"), self.index.search("python"))
+        self.assertEqual(self.index.search("[*"), [])
+
+    def test_remove(self):
+        """Проверяет удаление документа из индекса."""
+        self.index.remove("2", "Знание Python и Django, опыт с PostgreSQL")
+
+        self.assertEqual(self.index.search("django"), [])
+        self.assertEqual(len(self.index), 3)
+
+    def test_save_and_load(self):
+        """Проверяет сохранение и загрузку с проверкой подписи данных."""
+        directory = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(directory, "vacancies.json.index")
+            self.index.save(filename, [[10, 20], None])
+
+            loaded = InvertedIndex.load(filename, [[10, 20], None])
+            self.assertEqual(loaded.search("python django"), ["2"])
+            self.assertIsNone(InvertedIndex.load(filename, [[11, 20], None]))
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
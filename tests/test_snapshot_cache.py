@@ -0,0 +1,87 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+)
+
+from src.data_savers import JSONSaver
+from src.snapshot_cache import SnapshotCache
+from vacancy import Vacancy
+
+RECORDS = [
+    {
+        "id": "1",
+        "title": "Python Dev",
+        "url": "http://a.com",
+        "salary_from": 100,
+        "salary_to": None,
+        "description": "Django",
+    }
+]
+
+
+class TestSnapshotCache(unittest.TestCase):
+
+    def setUp(self):
+        """Сетап для тестов"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp.name, "vacancies.json")
+        with open(self.filename, "w", encoding="utf-8") as f:
+            json.dump(RECORDS, f)
+
+    def tearDown(self):
+        """Выход"""
+        self.tmp.cleanup()
+
+    def test_second_load_skips_json(self):
+        """Проверяет чтение из двоичной копии, пока файл не менялся."""
+        self.assertEqual(SnapshotCache(self.filename).load(), RECORDS)
+        self.assertTrue(os.path.exists(f"{self.filename}.snapshot"))
+
+        cache = SnapshotCache(self.filename)
+        with patch("snapshot_cache.json.loads") as mock_loads:
+            self.assertEqual(cache.load(), RECORDS)
+        mock_loads.assert_not_called()
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_stale_copy_is_rebuilt(self):
+        """Проверяет пересборку копии после изменения файла."""
+        SnapshotCache(self.filename).load()
+        changed = [dict(RECORDS[0], title="Go Dev")]
+        with open(self.filename, "w", encoding="utf-8") as f:
+            json.dump(changed, f)
+
+        cache = SnapshotCache(self.filename)
+        self.assertEqual(cache.load(), changed)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(SnapshotCache(self.filename).load(), changed)
+
+    def test_corrupt_copy_is_ignored(self):
+        """Проверяет, что поврежденная копия не мешает загрузке."""
+        with open(f"{self.filename}.snapshot", "wb") as f:
+            f.write(b"\x00garbage")
+        self.assertEqual(SnapshotCache(self.filename).load(), RECORDS)
+
+    def test_saver_refreshes_copy_on_write(self):
+        """Проверяет, что после записи хранилища копия сразу актуальна."""
+        saver = JSONSaver(self.filename)
+        saver.add_vacancy(Vacancy("Go Dev", "http://b.com"))
+
+        cache = SnapshotCache(self.filename)
+        self.assertEqual(
+            [r["url"] for r in cache.load()], ["http://a.com", "http://b.com"]
+        )
+        self.assertEqual(cache.hits, 1)
+
+        with patch("snapshot_cache.SnapshotCache.load") as mock_load:
+            JSONSaver(self.filename, binary_cache=False)
+        mock_load.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+)
+
+from src.cli import main
+from src.data_savers import JSONSaver
+from src.http_client import HttpClient
+from src.lazy_import import lazy_import
+from src.startup_profile import StartupProfile, parse_import_times
+from vacancy import Vacancy
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+IMPORTTIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      1500 |       2000 | site
+import time:       300 |        300 |     re._parser
+import time:       700 |       1000 |   re
+import time:      4000 |       5000 | cli
+"""
+
+
+class TestStartupProfile(unittest.TestCase):
+
+    def setUp(self):
+        """Сетап для тестов"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp.name, "vacancies.json")
+
+    def tearDown(self):
+        """Выход"""
+        self.tmp.cleanup()
+
+    def test_parse_import_times(self):
+        """Проверяет разбор вывода -X importtime."""
+        records = parse_import_times(IMPORTTIME_OUTPUT)
+        self.assertEqual(
+            records,
+            [
+                ("_io", 0.00012, 0.00012, 1),
+                ("site", 0.0015, 0.002, 0),
+                ("re._parser", 0.0003, 0.0003, 2),
+                ("re", 0.0007, 0.001, 1),
+                ("cli", 0.004, 0.005, 0),
+            ],
+        )
+
+    def test_report_phases(self):
+        """Проверяет печать этапов без замера импортов."""
+        profile = StartupProfile()
+        with profile.phase("разбор аргументов"):
+            pass
+        out = io.StringIO()
+        profile.report(out)
+        self.assertIn("разбор аргументов", out.getvalue())
+        self.assertIn("всего", out.getvalue())
+        self.assertNotIn("Самые долгие импорты", out.getvalue())
+
+    def test_lazy_import_missing_module(self):
+        """Проверяет, что отсутствующий модуль дает None."""
+        self.assertIsNone(lazy_import("no_such_module_for_tests"))
+
+    def test_cli_import_skips_heavy_modules(self):
+        """Проверяет, что импорт cli не загружает numpy и requests."""
+        code = (
+            "import sys, cli; "
+            "print(sorted(m for m in ('numpy', 'requests') "
+            "if m in sys.modules "
+            "and type(sys.modules[m]).__name__ != '_LazyModule'))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=SRC_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_json_saver_loads_on_first_access(self):
+        """Проверяет, что JSONSaver читает файл только при обращении к данным."""
+        JSONSaver(self.filename, binary_cache=False).add_vacancy(
+            Vacancy("Python Dev", "http://a.com")
+        )
+
+        with patch.object(JSONSaver, "_reload", autospec=True) as reload:
+            saver = JSONSaver(self.filename, binary_cache=False)
+        reload.assert_not_called()
+
+        self.assertEqual([v.url for v in saver.get_vacancies()], ["http://a.com"])
+
+    def test_http_session_created_lazily(self):
+        """Проверяет, что сессия создается при первом обращении и одна."""
+        client = HttpClient(pool_size=3)
+        self.assertIsNone(client._HttpClient__session)
+        client.close()
+
+        session = client.session
+        self.assertIs(client.session, session)
+        self.assertEqual(session.headers["User-Agent"], client.user_agent)
+        client.close()
+
+    def test_cli_profile_startup(self):
+        """Проверяет вывод профиля запуска в stderr, а не в stdout."""
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout, patch(
+            "sys.stderr", new_callable=io.StringIO
+        ) as stderr, patch("src.cli.StartupProfile.report", autospec=True) as report:
+            report.side_effect = lambda self, out, module=None, top=10: print(
+                [name for name, _ in self.phases], module, file=out
+            )
+            code = main(["--storage", self.filename, "--profile-startup", "top", "1"])
+
+        self.assertEqual(code, 0)
+        self.assertNotIn("разбор аргументов", stdout.getvalue())
+        self.assertIn(
+            "['разбор аргументов', 'загрузка хранилища', 'команда top'] cli",
+            stderr.getvalue(),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
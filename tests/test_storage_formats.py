@@ -0,0 +1,134 @@
+import gzip
+import io
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+)
+
+from src.cli import main
+from src.data_savers import JSONSaver
+from src.storage_formats import (
+    FORMATS,
+    decode,
+    detect_format,
+    encode,
+    parse_format,
+    sniff,
+)
+from vacancy import Vacancy
+
+
+def make_records(count):
+    """Создает записи в формате JSONSaver с кириллицей в описаниях."""
+    return [
+        {
+            "title": f"Разработчик {number}",
+            "url": f"http://test.com/{number}",
+            "salary_from": number * 1000 or None,
+            "salary_to": None,
+            "description": "Опыт работы с Python и PostgreSQL " * 3,
+            "id": f"id{number}",
+        }
+        for number in range(count)
+    ]
+
+
+class TestStorageFormats(unittest.TestCase):
+
+    def setUp(self):
+        """Сетап для тестов"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp.name, "vacancies.json")
+        self.records = make_records(2500)
+
+    def tearDown(self):
+        """Выход"""
+        self.tmp.cleanup()
+
+    def test_round_trip_and_detection(self):
+        """Проверяет, что каждый формат читается обратно и определяется сам."""
+        sizes = {}
+        for fmt in FORMATS:
+            with self.subTest(fmt=fmt):
+                content = encode(self.records, fmt)
+                sizes[fmt] = len(content)
+                self.assertEqual(decode(content), self.records)
+                self.assertEqual(detect_format(content[:4096]), fmt)
+
+        self.assertLess(sizes["compact"], sizes["pretty"])
+        self.assertLess(sizes["rows"], sizes["compact"])
+        self.assertLess(sizes["gzip"], sizes["rows"])
+        self.assertLess(sizes["lzma"], sizes["rows"])
+
+    def test_rows_keeps_records_with_other_fields(self):
+        """Проверяет, что запись с другим набором полей не теряется в rows."""
+        records = self.records[:3] + [{"url": "http://other.com"}]
+        for fmt in ("rows", "rows+gzip"):
+            self.assertEqual(decode(encode(records, fmt)), records)
+        self.assertEqual(decode(encode([], "rows")), [])
+        # Не записи хранилища пишутся компактным JSON
+        self.assertEqual(detect_format(encode([[1, 2]], "rows")), "compact")
+
+    def test_corrupted_and_unknown(self):
+        """Проверяет ошибки для поврежденного файла и неизвестного формата."""
+        content = encode(self.records, "gzip")
+        with self.assertRaises(ValueError):
+            decode(content[: len(content) // 2])
+        with self.assertRaises(ValueError):
+            parse_format("zip")
+        with self.assertRaises(ValueError):
+            JSONSaver(self.filename, storage_format="zip")
+
+    def test_json_saver_keeps_detected_format(self):
+        """Проверяет, что JSONSaver читает сжатый файл и сохраняет его в том же формате."""
+        with open(self.filename, "wb") as f:
+            f.write(encode(self.records[:10], "rows+lzma"))
+
+        saver = JSONSaver(self.filename, binary_cache=False)
+        self.assertEqual(len(saver.get_vacancies()), 10)
+        saver.add_vacancy(Vacancy("Новая вакансия", "http://new.com"))
+        self.assertEqual(sniff(self.filename), "rows+lzma")
+
+        saver = JSONSaver(self.filename, storage_format="gzip")
+        saver.delete_vacancy(Vacancy("", "http://test.com/0"))
+        self.assertEqual(sniff(self.filename), "gzip")
+        with gzip.open(self.filename, "rb") as f:
+            self.assertNotIn(b"\n", f.read())
+
+        # Двоичный кэш снимка тоже разбирает сжатый файл
+        self.assertEqual(len(JSONSaver(self.filename).get_vacancies()), 10)
+        self.assertEqual(len(JSONSaver(self.filename).get_vacancies()), 10)
+
+    def test_new_file_uses_pretty_json(self):
+        """Проверяет, что новый файл по умолчанию пишется с отступами."""
+        saver = JSONSaver(self.filename, binary_cache=False)
+        saver.add_vacancy(Vacancy("Python Dev", "http://a.com"))
+        self.assertEqual(sniff(self.filename), "pretty")
+
+    def test_cli_migrate_to_compressed(self):
+        """Проверяет пересохранение хранилища в сжатый формат через CLI."""
+        with open(self.filename, "wb") as f:
+            f.write(encode(self.records, "pretty"))
+        target = os.path.join(self.tmp.name, "vacancies.json.xz")
+
+        with patch("sys.stderr", new_callable=io.StringIO) as stderr:
+            code = main(["migrate", self.filename, target])
+        self.assertEqual(code, 0)
+        self.assertIn("Перенесено вакансий: 2500", stderr.getvalue())
+        self.assertEqual(sniff(target), "lzma")
+
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout, patch(
+            "sys.stderr", new_callable=io.StringIO
+        ):
+            code = main(["--storage", target, "top", "1"])
+        self.assertEqual(code, 0)
+        self.assertIn("Разработчик 2499", stdout.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
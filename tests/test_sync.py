@@ -0,0 +1,82 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+)
+
+from src.data_savers import JSONSaver
+from src.sync import WatermarkStore, sync_query
+from tests.helpers import make_item
+
+
+class TestSync(unittest.TestCase):
+
+    def setUp(self):
+        """Сетап для тестов"""
+        self.directory = tempfile.mkdtemp()
+        self.watermarks_file = os.path.join(self.directory, "watermarks.json")
+        self.saver = JSONSaver(os.path.join(self.directory, "vacancies.json"))
+
+    def tearDown(self):
+        """Выход"""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_watermark_store_roundtrip(self):
+        """Проверяет сохранение отметок с нормализацией запроса."""
+        store = WatermarkStore(self.watermarks_file)
+        store.set("  Python   Developer ", "2026-01-01T00:00:00+0000")
+        store.save()
+
+        reloaded = WatermarkStore(self.watermarks_file)
+        self.assertEqual(reloaded.get("python developer"), "2026-01-01T00:00:00+0000")
+        self.assertIsNone(reloaded.get("java"))
+
+    def test_sync_query_counts_and_watermark(self):
+        """Проверяет повторную синхронизацию: обновления по URL и date_from."""
+        connector = MagicMock()
+        connector.iter_vacancies.return_value = [make_item(1, 100), make_item(2, 200)]
+        watermarks = WatermarkStore(self.watermarks_file)
+
+        counts = sync_query(connector, self.saver, "python", watermarks)
+
+        self.assertEqual((counts["added"], counts["updated"]), (2, 0))
+        connector.iter_vacancies.assert_called_with("python", date_from=None)
+        watermark = watermarks.get("python")
+        self.assertIsNotNone(watermark)
+        with open(self.watermarks_file, encoding="utf-8") as f:
+            self.assertEqual(json.load(f), {"python": watermark})
+
+        connector.iter_vacancies.return_value = [make_item(1, 150), make_item(2, 200)]
+        counts = sync_query(connector, self.saver, "python", watermarks)
+
+        connector.iter_vacancies.assert_called_with("python", date_from=watermark)
+        self.assertEqual(
+            (counts["added"], counts["updated"], counts["unchanged"]), (0, 1, 1)
+        )
+        self.assertEqual(
+            self.saver.get_values("salary_from", {"url": "http://test.com/1"}), [150]
+        )
+
+    def test_failed_save_keeps_watermark(self):
+        """Проверяет, что отметка не сдвигается, если сохранить не удалось."""
+        connector = MagicMock()
+        connector.iter_vacancies.return_value = [make_item(1, 100)]
+        saver = MagicMock()
+        saver.upsert_vacancies.return_value = ["failed"]
+        watermarks = WatermarkStore(self.watermarks_file)
+
+        counts = sync_query(connector, saver, "python", watermarks)
+
+        self.assertEqual(counts["failed"], 1)
+        self.assertIsNone(watermarks.get("python"))
+        self.assertFalse(os.path.exists(self.watermarks_file))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,7 +6,7 @@ sys.path.insert(
     0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
 )
 
-from src.vacancy import Vacancy
+from src.vacancy import LazyVacancyList, Vacancy, VacancyView
 
 
 class TestVacancy(unittest.TestCase):
@@ -117,5 +117,47 @@ class TestVacancy(unittest.TestCase):
         self.assertEqual(str(vacancy), expected_string)
 
 
+class TestVacancyView(unittest.TestCase):
+
+    def setUp(self):
+        """Сетап для тестов"""
+        self.record = {
+            "title": "Test Title",
+            "url": "http://test.com",
+            "salary_from": None,
+            "salary_to": 200,
+            "description": "Test Description",
+        }
+
+    def test_same_interface_as_vacancy(self):
+        """Проверяет, что представление ведет себя как Vacancy."""
+        view = VacancyView(self.record)
+        vacancy = view.materialize()
+
+        self.assertIsInstance(vacancy, Vacancy)
+        self.assertEqual(view.salary_from, 0)
+        self.assertEqual(str(view), str(vacancy))
+        self.assertTrue(view == vacancy)
+        self.assertTrue(view < Vacancy("a", "b", salary_from=1))
+
+    def test_read_only(self):
+        """Проверяет, что представление нельзя изменить."""
+        view = VacancyView(self.record)
+        with self.assertRaises(AttributeError):
+            view.title = "Other"
+
+    def test_lazy_list_creates_views_on_access(self):
+        """Проверяет ленивую последовательность представлений."""
+        records = [dict(self.record, url=f"http://{i}.com") for i in range(3)]
+        vacancies = LazyVacancyList(records)
+
+        self.assertEqual(len(vacancies), 3)
+        self.assertEqual(vacancies[1].url, "http://1.com")
+        self.assertEqual(
+            [v.url for v in vacancies[1:]], ["http://1.com", "http://2.com"]
+        )
+        self.assertEqual(vacancies.materialize()[0].title, "Test Title")
+
+
 if __name__ == "__main__":
     unittest.main()